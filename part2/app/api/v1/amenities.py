@@ -1,6 +1,7 @@
 """Amenities API endpoints implementation."""
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import facade
+from app.api.v1.serialization import json_response
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -18,10 +19,10 @@ def validate_amenity_name(name):
 @api.route('/')
 class AmenityList(Resource):
     @api.doc('list_amenities')
-    @api.marshal_list_with(amenity_model)
+    @api.response(200, 'Success', [amenity_model])
     def get(self):
         """List all amenities"""
-        return facade.get_all_amenities()
+        return json_response(facade.get_all_amenities(), amenity_model)
 
     @api.doc('create_amenity')
     @api.expect(api.model('AmenityInput', {
@@ -42,14 +43,14 @@ class AmenityList(Resource):
 @api.response(404, 'Amenity not found')
 class AmenityResource(Resource):
     @api.doc('get_amenity')
-    @api.marshal_with(amenity_model)
+    @api.response(200, 'Success', amenity_model)
     @api.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """Fetch an amenity by ID"""
         amenity = facade.get_amenity(amenity_id)
         if amenity is None:
             api.abort(404, f"Amenity {amenity_id} not found")
-        return amenity
+        return json_response(amenity, amenity_model)
 
     @api.doc('update_amenity')
     @api.expect(api.model('AmenityUpdate', {
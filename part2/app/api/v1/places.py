@@ -1,6 +1,9 @@
 """Places API endpoints implementation."""
+import json
+from flask import Response, request
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import facade
+from app.api.v1.serialization import dumps, json_response
 
 api = Namespace('places', description='Place operations')
 
@@ -17,24 +20,61 @@ place_model = api.model('Place', {
     'updated_at': fields.DateTime(readonly=True)
 })
 
+place_input_model = api.model('PlaceInput', {
+    'title': fields.String(required=True),
+    'description': fields.String(required=True),
+    'price': fields.Float(required=True),
+    'latitude': fields.Float(required=True),
+    'longitude': fields.Float(required=True),
+    'owner_id': fields.String(required=True),
+    'amenity_ids': fields.List(fields.String)
+})
+
+# Places accepted by one POST /places/batch
+MAX_BATCH = 1000
+
+
+def parse_search_args(args):
+    """Read min_price/max_price/bbox query parameters"""
+    filters = {}
+    for name in ('min_price', 'max_price'):
+        if args.get(name) not in (None, ''):
+            try:
+                filters[name] = float(args[name])
+            except ValueError:
+                raise ValueError(f"{name} must be a number")
+    if args.get('bbox'):
+        try:
+            bbox = tuple(float(v) for v in args['bbox'].split(','))
+        except ValueError:
+            bbox = ()
+        if len(bbox) != 4:
+            raise ValueError(
+                "bbox must be min_lon,min_lat,max_lon,max_lat")
+        filters['bbox'] = bbox
+    return filters
+
 @api.route('/')
 class PlaceList(Resource):
-    @api.doc('list_places')
-    @api.marshal_list_with(place_model)
+    @api.doc('list_places', params={
+        'min_price': 'Minimum price per night (inclusive)',
+        'max_price': 'Maximum price per night (inclusive)',
+        'bbox': 'Bounding box: min_lon,min_lat,max_lon,max_lat'
+    })
+    @api.response(200, 'Success', [place_model])
+    @api.response(400, 'Invalid filter')
     def get(self):
-        """List all places"""
-        return facade.get_all_places()
+        """List all places, optionally filtered by price and area"""
+        try:
+            filters = parse_search_args(request.args)
+        except ValueError as e:
+            api.abort(400, str(e))
+        if filters:
+            return json_response(facade.search_places(**filters), place_model)
+        return json_response(facade.get_all_places(), place_model)
 
     @api.doc('create_place')
-    @api.expect(api.model('PlaceInput', {
-        'title': fields.String(required=True),
-        'description': fields.String(required=True),
-        'price': fields.Float(required=True),
-        'latitude': fields.Float(required=True),
-        'longitude': fields.Float(required=True),
-        'owner_id': fields.String(required=True),
-        'amenity_ids': fields.List(fields.String)
-    }))
+    @api.expect(place_input_model)
     @api.marshal_with(place_model, code=201)
     @api.response(400, 'Validation Error')
     def post(self):
@@ -44,18 +84,114 @@ class PlaceList(Resource):
         except ValueError as e:
             api.abort(400, str(e))
 
+
+@api.route('/batch')
+class PlaceBatch(Resource):
+    @api.doc('create_places')
+    @api.expect([place_input_model])
+    @api.response(201, 'Every place created')
+    @api.response(207, 'Some places failed; see each item status')
+    @api.response(400, 'Not a JSON array, or too many items')
+    def post(self):
+        """
+        Create up to MAX_BATCH places in one request.
+        Returns one result per item, in order:
+        {"index", "status": 201, "place"} or {"index", "status": 400, "error"}
+        """
+        items = request.get_json(silent=True)
+        if not isinstance(items, list):
+            api.abort(400, "Request body must be a JSON array")
+        if len(items) > MAX_BATCH:
+            api.abort(400, f"At most {MAX_BATCH} places per batch")
+        parts = []
+        failed = False
+        for index, result in enumerate(facade.create_places(items)):
+            if isinstance(result, Exception):
+                failed = True
+                parts.append(json.dumps({'index': index, 'status': 400,
+                                         'error': str(result)},
+                                        separators=(',', ':')).encode())
+            else:
+                parts.append(b'{"index":%d,"status":201,"place":%s}'
+                             % (index, dumps(result, place_model)))
+        return Response(b'[' + b','.join(parts) + b']',
+                        status=207 if failed else 201,
+                        mimetype='application/json')
+
+
+nearby_model = api.model('PlaceNearby', {
+    'distance_km': fields.Float(description='Distance from the search point'),
+    'place': fields.Nested(place_model)
+})
+
+nearby_page_model = api.model('PlaceNearbyPage', {
+    'total': fields.Integer(description='Places within the radius'),
+    'limit': fields.Integer(),
+    'offset': fields.Integer(),
+    'results': fields.List(fields.Nested(nearby_model))
+})
+
+
+def parse_nearby_args(args):
+    """Read lat/lon/radius_km/limit/offset query parameters"""
+    params = {}
+    for name in ('lat', 'lon', 'radius_km'):
+        if args.get(name) in (None, ''):
+            raise ValueError(f"{name} is required")
+        try:
+            params[name] = float(args[name])
+        except ValueError:
+            raise ValueError(f"{name} must be a number")
+    for name, default in (('limit', 20), ('offset', 0)):
+        try:
+            params[name] = int(args.get(name, default))
+        except ValueError:
+            raise ValueError(f"{name} must be an integer")
+    if not 1 <= params['limit'] <= 100:
+        raise ValueError("limit must be between 1 and 100")
+    if params['offset'] < 0:
+        raise ValueError("offset must not be negative")
+    return params
+
+
+@api.route('/nearby')
+class PlaceNearby(Resource):
+    @api.doc('places_nearby', params={
+        'lat': 'Latitude of the search point',
+        'lon': 'Longitude of the search point',
+        'radius_km': 'Search radius in kilometres (at most 10)',
+        'limit': 'Page size (1-100, default 20)',
+        'offset': 'Number of results to skip (default 0)'
+    })
+    @api.marshal_with(nearby_page_model)
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """List places within a radius, nearest first"""
+        try:
+            params = parse_nearby_args(request.args)
+            total, hits = facade.get_places_nearby(**params)
+        except ValueError as e:
+            api.abort(400, str(e))
+        return {
+            'total': total,
+            'limit': params['limit'],
+            'offset': params['offset'],
+            'results': [{'distance_km': distance, 'place': place}
+                        for place, distance in hits]
+        }
+
 @api.route('/<string:place_id>')
 @api.param('place_id', 'The place identifier')
 @api.response(404, 'Place not found')
 class PlaceResource(Resource):
     @api.doc('get_place')
-    @api.marshal_with(place_model)
+    @api.response(200, 'Success', place_model)
     def get(self, place_id):
         """Fetch a place by ID"""
         place = facade.get_place(place_id)
         if place is None:
             api.abort(404, f"Place {place_id} not found")
-        return place
+        return json_response(place, place_model)
 
     @api.doc('update_place')
     @api.expect(api.model('PlaceUpdate', {
@@ -75,4 +211,4 @@ class PlaceResource(Resource):
                 api.abort(404, f"Place {place_id} not found")
             return place
         except ValueError as e:
-            api.abort(400, str(e))
\ No newline at end of file
+            api.abort(400, str(e))
\ No newline at end of file
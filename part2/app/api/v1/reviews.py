@@ -1,6 +1,7 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import facade
 from flask import request, jsonify
+from app.api.v1.serialization import json_response
 
 api = Namespace('reviews', description='Review operations')
 
@@ -17,10 +18,10 @@ review_model = api.model('Review', {
 @api.route('/')
 class ReviewList(Resource):
     @api.doc('list_reviews')
-    @api.marshal_list_with(review_model)
+    @api.response(200, 'Success', [review_model])
     def get(self):
         """List all reviews"""
-        return facade.get_all_reviews()
+        return json_response(facade.get_all_reviews(), review_model)
 
     @api.doc('create_review')
     @api.expect(review_model)
@@ -38,13 +39,13 @@ class ReviewList(Resource):
 @api.response(404, 'Review not found')
 class ReviewResource(Resource):
     @api.doc('get_review')
-    @api.marshal_with(review_model)
+    @api.response(200, 'Success', review_model)
     def get(self, review_id):
         """Get a review by ID"""
         review = facade.get_review(review_id)
         if not review:
             api.abort(404, "Review not found")
-        return review
+        return json_response(review, review_model)
 
     @api.doc('update_review')
     @api.expect(review_model)
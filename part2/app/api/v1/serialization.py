@@ -0,0 +1,127 @@
+"""
+Generated JSON serializers for API models.
+
+marshal_with() walks a model's fields for every object and hands the
+resulting dict to the JSON encoder, which walks it again. For the read
+endpoints, serializer_for(model) generates one function per API model,
+once, that reads each field off the object and writes the JSON text in
+a single expression. Output matches marshal(): every field of the model,
+in order, None as null, DateTime as ISO 8601, Float/Integer/String
+coerced the same way.
+
+orjson is used when installed (HBNB_JSON_BACKEND=json turns it off).
+An object the generated code cannot handle, e.g. a string in a Float
+field, goes through marshal() instead.
+"""
+import json
+from json.encoder import encode_basestring_ascii
+from os import getenv
+from typing import Any, Callable, Dict, Iterable
+
+from flask import Response
+from flask_restx import fields, marshal
+
+from app.models.base_model import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson and getenv(
+    'HBNB_JSON_BACKEND', 'orjson') == 'orjson' else 'json'
+
+# Field type -> expression over v, for each backend
+_JSON_EXPRESSIONS = {
+    fields.String: '_s(v)',
+    fields.Float: '_r(float(v))',
+    fields.Integer: '_r(int(v))',
+    fields.Boolean: "('true' if v else 'false')",
+    fields.DateTime: "'\"' + v.isoformat() + '\"'",
+}
+_ORJSON_EXPRESSIONS = {
+    fields.String: 'v if v.__class__ is str else str(v)',
+    fields.Float: 'float(v)',
+    fields.Integer: 'int(v)',
+    fields.Boolean: 'bool(v)',
+    fields.DateTime: 'v',
+}
+
+_serializers: Dict[int, Callable[[Any], bytes]] = {}
+
+
+def _expression(field, table, backend):
+    """Expression encoding v for field, or None if unsupported"""
+    field_type = field if isinstance(field, type) else type(field)
+    if field_type is fields.List:
+        item = field.container
+        if not isinstance(item, fields.String) and item is not fields.String:
+            return None
+        if backend == 'orjson':
+            return '[x if x.__class__ is str else str(x) for x in v]'
+        return "'[' + ','.join(map(_s, v)) + ']'"
+    if field_type is fields.DateTime and field.dt_format != 'iso8601':
+        return None
+    return table.get(field_type)
+
+
+def _compile(model) -> Callable[[Any], bytes]:
+    """Generate the serializer for a flask-restx model"""
+    def fallback(obj):
+        return json.dumps(marshal(obj, model)).encode()
+
+    backend = BACKEND
+    table = _ORJSON_EXPRESSIONS if backend == 'orjson' else _JSON_EXPRESSIONS
+    parts = []
+    for i, (name, field) in enumerate(model.items()):
+        expression = _expression(field, table, backend)
+        if expression is None or not name.isidentifier():
+            return fallback
+        if backend == 'orjson':
+            value = f"None if (v := obj.{name}) is None else {expression}"
+            parts.append(f"{name!r}: {value}")
+        else:
+            value = f"('null' if (v := obj.{name}) is None else {expression})"
+            key = ('{' if i == 0 else ',') + json.dumps(name) + ':'
+            parts.append(f"{key!r}, {value}")
+    if backend == 'orjson':
+        body = f"_dumps({{{', '.join(parts)}}})"
+    else:
+        body = f"''.join(({', '.join(parts)}, '}}')).encode()"
+    source = ("def serialize(obj):\n"
+              "    try:\n"
+              f"        return {body}\n"
+              "    except (AttributeError, TypeError, ValueError):\n"
+              "        return _fallback(obj)\n")
+    namespace = {'_s': encode_basestring_ascii, '_r': repr,
+                 '_dumps': orjson and orjson.dumps, '_fallback': fallback}
+    exec(compile(source, f'<serializer {model.name}>', 'exec'), namespace)
+    return namespace['serialize']
+
+
+def serializer_for(model) -> Callable[[Any], bytes]:
+    """Return the generated serializer for model, building it once"""
+    func = _serializers.get(id(model))
+    if func is None:
+        func = _serializers[id(model)] = _compile(model)
+    return func
+
+
+def dumps(obj, model) -> bytes:
+    """JSON bytes for obj as marshal(obj, model) would produce"""
+    return serializer_for(model)(obj)
+
+
+def dumps_list(objs: Iterable[Any], model) -> bytes:
+    """JSON bytes for a list of objects of one model"""
+    serialize = serializer_for(model)
+    return b'[' + b','.join(serialize(obj) for obj in objs) + b']'
+
+
+def json_response(obj, model, status: int = 200) -> Response:
+    """Respond with a model object, or an iterable of them, as JSON"""
+    if isinstance(obj, BaseModel):
+        body = dumps(obj, model)
+    else:
+        body = dumps_list(obj, model)
+    return Response(body, status=status, mimetype='application/json')
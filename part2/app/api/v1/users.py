@@ -1,6 +1,7 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import HBnBFacade
 from app.models.user import User
+from app.api.v1.serialization import json_response
 
 api = Namespace('users', description='User operations')
 
@@ -32,10 +33,10 @@ user_input_model = api.model('UserInput', {
 @api.route('/')
 class UserList(Resource):
     @api.doc('list_users')
-    @api.marshal_list_with(user_model)
+    @api.response(200, 'Success', [user_model])
     def get(self):
         """List all users"""
-        return facade.get_all_users()
+        return json_response(facade.get_all_users(), user_model)
 
     @api.doc('create_user')
     @api.expect(user_input_model)
@@ -53,13 +54,13 @@ class UserList(Resource):
 @api.response(404, 'User not found')
 class UserResource(Resource):
     @api.doc('get_user')
-    @api.marshal_with(user_model)
+    @api.response(200, 'Success', user_model)
     def get(self, user_id):
         """Fetch a user by ID"""
         user = facade.get_user(user_id)
         if user is None:
             api.abort(404, f"User {user_id} not found")
-        return user
+        return json_response(user, user_model)
 
     @api.doc('update_user')
     @api.expect(user_input_model)
@@ -5,6 +5,8 @@ import uuid
 
 class Amenity(BaseModel):
     """Amenity Model"""
+    __slots__ = ('name',)
+
     def __init__(self, *args, **kwargs):
         """Initialize amenity"""
         super().__init__(*args, **kwargs)
@@ -14,7 +14,15 @@ class ValidationError(Exception):
 
 
 class BaseModel:
-    """Base model with ID and validation"""
+    """
+    Base model with ID and validation
+
+    Declared fields live in __slots__ (subclasses add their own), so an
+    instance carries no per-object dict. The '__dict__' slot is only
+    materialized when an undeclared attribute is set, which keeps extra
+    kwargs working as before.
+    """
+    __slots__ = ('id', 'created_at', 'updated_at', '__dict__')
 
     def __init__(self, *args, **kwargs):
         """Initialize base model attributes"""
@@ -26,20 +34,57 @@ class BaseModel:
                     setattr(self, key, datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f'))
                 else:
                     setattr(self, key, value)
+            # One datetime shared by both timestamps until the first update
+            now = datetime.now()
             if 'created_at' not in kwargs:
-                self.created_at = datetime.now()
+                self.created_at = now
             if 'updated_at' not in kwargs:
-                self.updated_at = datetime.now()
+                self.updated_at = now
             if 'id' not in kwargs:
                 self.id = str(uuid.uuid4())
         else:
             self.id = str(uuid.uuid4())
-            self.created_at = datetime.now()
-            self.updated_at = datetime.now()
+            self.created_at = self.updated_at = datetime.now()
+
+    @classmethod
+    def _fields(cls):
+        """Slot names declared along the MRO, base class first"""
+        fields = cls.__dict__.get('_slot_fields')
+        if fields is None:
+            fields = tuple(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get('__slots__', ())
+                if name != '__dict__')
+            cls._slot_fields = fields
+        return fields
+
+    def _attributes(self) -> Dict[str, Any]:
+        """All instance attributes: declared fields, then extra ones"""
+        result = {}
+        for name in self._fields():
+            try:
+                result[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        extra = getattr(self, '__dict__', None)
+        if extra:
+            result.update(extra)
+        return result
+
+    def __getstate__(self):
+        return self._attributes()
+
+    def __setstate__(self, state):
+        # Accepts plain dicts, including pickles of the pre-__slots__ models
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for key, value in state.items():
+            setattr(self, key, value)
 
     def to_dict(self):
         """Return dictionary representation of the model"""
-        result = self.__dict__.copy()
+        result = self._attributes()
         result['created_at'] = self.created_at.isoformat()
         result['updated_at'] = self.updated_at.isoformat()
         result['__class__'] = self.__class__.__name__
@@ -65,4 +110,4 @@ class BaseModel:
 
     def __str__(self):
         """String representation of the model"""
-        return f"[{self.__class__.__name__}] ({self.id}) {self.__dict__}"
+        return f"[{self.__class__.__name__}] ({self.id}) {self._attributes()}"
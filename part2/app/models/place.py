@@ -3,6 +3,9 @@ from app.models.base_model import BaseModel
 class Place(BaseModel):
     """Place Model"""
     
+    __slots__ = ('title', 'description', 'price', 'latitude', 'longitude',
+                 'owner_id', 'amenity_ids')
+
     def __init__(self, *args, **kwargs):
         """Initialize place"""
         super().__init__(*args, **kwargs)
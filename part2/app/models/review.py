@@ -4,6 +4,8 @@ from app.models.base_model import BaseModel
 
 class Review(BaseModel):
     """Review Model"""
+    __slots__ = ('text', 'rating', 'user_id', 'place_id')
+
     def __init__(self, *args, **kwargs):
         """Initialize review"""
         super().__init__(*args, **kwargs)
@@ -6,6 +6,8 @@ import uuid
 
 class User(BaseModel):
     """User Model"""
+    __slots__ = ('first_name', 'last_name', 'email')
+
     def __init__(self, *args, **kwargs):
         """Initialize user"""
         super().__init__(*args, **kwargs)
@@ -0,0 +1,130 @@
+"""
+Spatial grid index for place radius searches.
+
+Places are bucketed into fixed-size latitude/longitude cells. A radius
+query only visits the cells overlapping the circle's bounding box (or,
+for very large circles, only the non-empty cells), computes exact
+great-circle distances for the places in them, and keeps the nearest
+``offset + limit`` with a heap, so cost follows the number of nearby
+places rather than the total. Buckets keep each point's latitude in
+radians and its cosine so the inner loop compares the haversine term
+against a precomputed threshold without any trigonometry on the
+stored point.
+"""
+
+import heapq
+import math
+import threading
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km between two points"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+class GeoGridIndex:
+    """Uniform lat/lon grid of place ids"""
+
+    def __init__(self, cell_deg=0.1):
+        self.cell_deg = cell_deg
+        self._columns = int(math.ceil(360 / cell_deg))
+        self._lock = threading.Lock()
+        self._cells = {}   # (row, col) -> {place_id: (lat_r, lon_r, cos_lat)}
+        self._points = {}  # place_id -> (row, col)
+
+    def __len__(self):
+        return len(self._points)
+
+    def _cell(self, lat, lon):
+        row = int(math.floor((lat + 90) / self.cell_deg))
+        col = int(math.floor((lon + 180) / self.cell_deg)) % self._columns
+        return row, col
+
+    def load(self, places):
+        """Index many places (e.g. from an existing repository)"""
+        for place in places:
+            self.upsert(place.id, place.latitude, place.longitude)
+
+    def upsert(self, place_id, lat, lon):
+        """Index place_id at (lat, lon), moving it if it was elsewhere"""
+        cell = self._cell(lat, lon)
+        with self._lock:
+            old = self._points.get(place_id)
+            if old is not None and old != cell:
+                self._discard(place_id, old)
+            lat_r = math.radians(lat)
+            self._cells.setdefault(cell, {})[place_id] = (
+                lat_r, math.radians(lon), math.cos(lat_r))
+            self._points[place_id] = cell
+
+    def remove(self, place_id):
+        """Forget place_id"""
+        with self._lock:
+            cell = self._points.pop(place_id, None)
+            if cell is not None:
+                self._discard(place_id, cell)
+
+    def _discard(self, place_id, cell):
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(place_id, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def _candidate_cells(self, lat, lon, radius_km):
+        dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+        min_row, _ = self._cell(max(lat - dlat, -90), 0)
+        max_row, _ = self._cell(min(lat + dlat, 90), 0)
+        rows = range(min_row, max_row + 1)
+
+        cos_lat = math.cos(math.radians(min(abs(lat) + dlat, 90)))
+        dlon = (math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+                if cos_lat > 1e-9 else 360)
+        if dlon >= 180:
+            cols = range(self._columns)
+        else:
+            first = self._cell(0, lon - dlon)[1]
+            span = (self._cell(0, lon + dlon)[1] - first) % self._columns
+            cols = [(first + i) % self._columns for i in range(span + 1)]
+
+        # Read under the lock: a concurrent remove() deletes emptied cells
+        # and writers change buckets in place, so copy what is returned
+        with self._lock:
+            cells = self._cells
+            if len(rows) * len(cols) > len(cells):
+                # Huge circle: cheaper to test the occupied cells
+                col_set = set(cols)
+                buckets = [bucket for (row, col), bucket in cells.items()
+                           if row in rows and col in col_set]
+            else:
+                buckets = [cells.get((row, col))
+                           for row in rows for col in cols]
+            return [list(bucket.items()) for bucket in buckets if bucket]
+
+    def nearby(self, lat, lon, radius_km, limit=20, offset=0):
+        """
+        Places within radius_km of (lat, lon), nearest first
+        Returns:
+            (total, [(place_id, distance_km), ...]) for the requested page
+        """
+        lat_r, lon_r = math.radians(lat), math.radians(lon)
+        cos_lat = math.cos(lat_r)
+        # haversine(a) is monotonic in a, so filter and rank on a directly
+        a_max = math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi) / 2) ** 2
+        sin = math.sin
+        matches = []
+        for bucket in self._candidate_cells(lat, lon, radius_km):
+            for place_id, (plat, plon, pcos) in bucket:
+                a = (sin((plat - lat_r) / 2) ** 2
+                     + cos_lat * pcos * sin((plon - lon_r) / 2) ** 2)
+                if a <= a_max:
+                    matches.append((a, place_id))
+        page = heapq.nsmallest(offset + limit, matches)[offset:]
+        return len(matches), [
+            (place_id, 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0))))
+            for a, place_id in page]
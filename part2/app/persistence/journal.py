@@ -0,0 +1,210 @@
+"""
+Append-only journal and snapshots for the in-memory repositories.
+
+Every mutation is appended to the current log file as a length-prefixed,
+CRC-checked pickle frame. Callers block until their frame is fsynced, but
+whichever thread reaches the disk first flushes every pending frame at once
+(group commit), so concurrent writers share fsyncs.
+
+Once a log grows past ``compact_bytes`` a background thread rotates to a new
+log generation and writes a binary snapshot of the repository. Recovery
+loads the newest snapshot and replays the logs written after it; a torn
+frame at the end of a log is treated as the end of that log.
+
+Layout of ``directory``:
+    snapshot        pickle of (generation, [objects]) behind SNAPSHOT_MAGIC
+    log.<gen>       frames written from generation <gen> onwards
+"""
+
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+SNAPSHOT_MAGIC = b'HBNBSNP1'
+FRAME_HEADER = struct.Struct('<II')  # payload length, crc32
+
+
+class Journal:
+    """Durable log of repository mutations"""
+
+    def __init__(self, directory, compact_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.compact_bytes = compact_bytes
+        self.snapshot_source = None
+        self._lock = threading.Lock()        # guards the pending buffer
+        self._flush_lock = threading.Lock()  # one thread writes at a time
+        self._buffer = []
+        self._seq = 0
+        self._durable = 0
+        self._generation = 0
+        self._file = None
+        self._log_bytes = 0
+        self._compactor = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _log_path(self, generation):
+        return os.path.join(self.directory, f"log.{generation}")
+
+    def _generations(self):
+        generations = []
+        for name in os.listdir(self.directory):
+            prefix, _, suffix = name.partition('.')
+            if prefix == 'log' and suffix.isdigit():
+                generations.append(int(suffix))
+        return sorted(generations)
+
+    def recover(self):
+        """
+        Load the snapshot and replay the logs after it
+        Returns:
+            Dictionary of object id to object, in insertion order
+        """
+        objects = {}
+        first_generation = 0
+        snapshot_path = os.path.join(self.directory, 'snapshot')
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, 'rb') as f:
+                if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                    raise ValueError(f"{snapshot_path} is not a snapshot")
+                first_generation, snapshot = pickle.load(f)
+            objects = {obj.id: obj for obj in snapshot}
+
+        generations = [g for g in self._generations() if g >= first_generation]
+        for generation in generations:
+            self._replay(self._log_path(generation), objects)
+
+        self._generation = max(generations + [first_generation - 1]) + 1
+        self._open_log()
+        return objects
+
+    def _replay(self, path, objects):
+        with open(path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset + FRAME_HEADER.size <= len(data):
+            length, crc = FRAME_HEADER.unpack_from(data, offset)
+            start = offset + FRAME_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break  # torn write at the tail of the log
+            operation, value = pickle.loads(payload)
+            if operation == 'put':
+                objects[value.id] = value
+            elif operation == 'put_many':
+                for obj in value:
+                    objects[obj.id] = obj
+            else:
+                objects.pop(value, None)
+            offset = start + length
+        if offset < len(data):
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+
+    def _open_log(self):
+        self._file = open(self._log_path(self._generation), 'ab')
+        self._log_bytes = self._file.tell()
+        _fsync_directory(self.directory)
+
+    def append_put(self, obj):
+        """Queue a frame storing obj; returns the sequence to wait() on"""
+        return self._append(('put', obj))
+
+    def append_put_many(self, objs):
+        """Queue one frame storing every object of objs"""
+        return self._append(('put_many', objs))
+
+    def append_delete(self, obj_id):
+        """Queue a frame deleting obj_id; returns the sequence to wait() on"""
+        return self._append(('delete', obj_id))
+
+    def _append(self, record):
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        frame = FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            self._buffer.append(frame)
+            self._seq += 1
+            return self._seq
+
+    def wait(self, seq):
+        """Block until the frame numbered seq is on disk"""
+        with self._flush_lock:
+            if self._durable < seq:
+                self._flush()
+        if (self._log_bytes > self.compact_bytes
+                and self.snapshot_source is not None
+                and self._compactor is None):
+            self._start_compaction()
+
+    def _flush(self):
+        # Caller holds _flush_lock; takes every frame queued so far, so the
+        # threads blocked behind us usually find their frame already durable
+        with self._lock:
+            frames = self._buffer
+            self._buffer = []
+            last = self._seq
+        if frames:
+            data = b''.join(frames)
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._log_bytes += len(data)
+        self._durable = last
+
+    def _rotate(self):
+        """Flush and switch to a new log generation; returns its number"""
+        with self._flush_lock:
+            self._flush()
+            self._file.close()
+            self._generation += 1
+            self._open_log()
+            return self._generation
+
+    def _start_compaction(self):
+        with self._lock:
+            if self._compactor is not None:
+                return
+            self._compactor = threading.Thread(
+                target=self.compact, name='journal-compactor', daemon=True)
+        self._compactor.start()
+
+    def compact(self):
+        """Write a snapshot and drop the logs it covers"""
+        try:
+            # Rotate before copying: a write that reached the old log was
+            # applied to the repository before the copy below is taken
+            generation = self._rotate()
+            objects = list(self.snapshot_source())
+            path = os.path.join(self.directory, 'snapshot')
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(SNAPSHOT_MAGIC)
+                pickle.dump((generation, objects), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            _fsync_directory(self.directory)
+            for old in self._generations():
+                if old < generation:
+                    os.remove(self._log_path(old))
+        finally:
+            self._compactor = None
+
+    def close(self):
+        """Flush pending frames and close the log"""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._flush_lock:
+            self._flush()
+            self._file.close()
+
+
+def _fsync_directory(directory):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,139 @@
+"""
+Columnar copy of the place fields used for filtering.
+
+Price, latitude and longitude of every place are kept in contiguous NumPy
+arrays next to an id <-> row map, so price-range, bounding-box and radius
+filters run as vectorized comparisons instead of Python loops over Place
+objects. NumPy is optional: without it PlaceColumns.available is False
+and the facade filters the repository objects directly.
+"""
+
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see setup.py extras
+    np = None
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class PlaceColumns:
+    """Price/latitude/longitude columns for fast place queries"""
+
+    available = np is not None
+
+    def __init__(self, capacity=1024):
+        if np is None:
+            raise RuntimeError("PlaceColumns requires numpy")
+        self._lock = threading.Lock()
+        self._size = 0
+        self._ids = []        # row -> place id
+        self._rows = {}       # place id -> row
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._lat = np.empty(capacity, dtype=np.float64)
+        self._lon = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self):
+        return self._size
+
+    def load(self, places):
+        """Add or refresh many places (e.g. from an existing repository)"""
+        for place in places:
+            self.upsert(place)
+
+    def _grow(self):
+        capacity = max(1024, len(self._price) * 2)
+        for name in ('_price', '_lat', '_lon'):
+            column = np.empty(capacity, dtype=np.float64)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+
+    def upsert(self, place):
+        """Store the current price and coordinates of place"""
+        with self._lock:
+            row = self._rows.get(place.id)
+            if row is None:
+                if self._size == len(self._price):
+                    self._grow()
+                row = self._size
+                self._size += 1
+                self._rows[place.id] = row
+                self._ids.append(place.id)
+            self._price[row] = place.price
+            self._lat[row] = place.latitude
+            self._lon[row] = place.longitude
+
+    def remove(self, place_id):
+        """Drop a place, moving the last row into its slot"""
+        with self._lock:
+            row = self._rows.pop(place_id, None)
+            if row is None:
+                return
+            last = self._size - 1
+            if row != last:
+                moved = self._ids[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                for column in (self._price, self._lat, self._lon):
+                    column[row] = column[last]
+            self._ids.pop()
+            self._size = last
+
+    def query(self, min_price=None, max_price=None, bbox=None,
+              center=None, radius_km=None):
+        """
+        Ids of the places matching every given filter
+        Args:
+            min_price, max_price: Inclusive price bounds
+            bbox: (min_lon, min_lat, max_lon, max_lat), inclusive
+            center, radius_km: (lat, lon) and great-circle distance in km
+        Returns:
+            List of place ids in insertion order (rows move on removal)
+        """
+        with self._lock:
+            n = self._size
+            price, lat, lon = self._price[:n], self._lat[:n], self._lon[:n]
+            mask = np.ones(n, dtype=bool)
+            if min_price is not None:
+                mask &= price >= min_price
+            if max_price is not None:
+                mask &= price <= max_price
+            if bbox is not None:
+                min_lon, min_lat, max_lon, max_lat = bbox
+                mask &= (lat >= min_lat) & (lat <= max_lat)
+                mask &= (lon >= min_lon) & (lon <= max_lon)
+            if center is not None and radius_km is not None:
+                # Cheap bounding-box prefilter, then exact distance on the
+                # surviving rows only
+                mask &= _radius_bbox_mask(center, radius_km, lat, lon)
+                rows = np.flatnonzero(mask)
+                distance = haversine_km(center[0], center[1],
+                                        lat[rows], lon[rows])
+                rows = rows[distance <= radius_km]
+            else:
+                rows = np.flatnonzero(mask)
+            ids = self._ids
+            return [ids[row] for row in rows.tolist()]
+
+
+def _radius_bbox_mask(center, radius_km, lat, lon):
+    """Rows inside the lat/lon box enclosing the search circle"""
+    lat0, lon0 = center
+    dlat = np.degrees(radius_km / EARTH_RADIUS_KM)
+    mask = (lat >= lat0 - dlat) & (lat <= lat0 + dlat)
+    cos_lat = np.cos(np.radians(min(abs(lat0) + dlat, 90.0)))
+    if cos_lat > 1e-6:
+        dlon = np.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat))
+        if lon0 - dlon >= -180 and lon0 + dlon <= 180:
+            mask &= (lon >= lon0 - dlon) & (lon <= lon0 + dlon)
+    return mask
+
+
+def haversine_km(lat, lon, lats, lons):
+    """Great-circle distance in km from (lat, lon) to arrays of points"""
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
@@ -1,10 +1,35 @@
+import gc
+import logging
+import pickle
+import sqlite3
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import partial
+from app.persistence.journal import Journal
+from app.persistence.tracing import logger
+
+
+class DuplicateValueError(ValueError):
+    """Raised when a write would break a unique index"""
+
+    def __init__(self, attr_name, value):
+        self.attr_name = attr_name
+        self.value = value
+        super().__init__(f"Duplicate value for {attr_name}: {value}")
+
 
 class Repository(ABC):
     @abstractmethod
     def add(self, obj):
         pass
 
+    def add_many(self, objs):
+        """Add every object of objs; backends override this to batch"""
+        for obj in objs:
+            self.add(obj)
+
     @abstractmethod
     def get(self, obj_id):
         pass
@@ -25,43 +50,532 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def get_all_by_attribute(self, attr_name, attr_value):
+        pass
+
 
 class InMemoryRepository(Repository):
-    def __init__(self, model_class=None):
+    def __init__(self, model_class=None, indexes=(), unique=()):
         self._storage = {}
         self.model_class = model_class
+        # attr_name -> {value: {obj_id: None}}; the inner dict keeps the
+        # insertion order of _storage so lookups match a linear scan
+        self._indexes = {}
+        # attr_name -> {obj_id: value}; remembers what each object was indexed
+        # under, since models are often mutated before update() is called
+        self._indexed_values = {}
+        self._unique = set()
+        for attr_name in unique:
+            self.add_index(attr_name, unique=True)
+        for attr_name in indexes:
+            self.add_index(attr_name)
+
+    def add_index(self, attr_name, unique=False):
+        """Declare a secondary index on attr_name (values must be hashable)"""
+        index = {}
+        indexed_values = {}
+        for obj_id, obj in self._storage.items():
+            value = getattr(obj, attr_name, None)
+            bucket = index.get(value)
+            if bucket is None:
+                index[value] = bucket = {}
+            elif unique:
+                raise DuplicateValueError(attr_name, value)
+            bucket[obj_id] = None
+            indexed_values[obj_id] = value
+        self._indexes[attr_name] = index
+        self._indexed_values[attr_name] = indexed_values
+        if unique:
+            self._unique.add(attr_name)
+
+    def _check_unique(self, obj_id, values):
+        for attr_name in self._unique:
+            if attr_name not in values:
+                continue
+            bucket = self._indexes[attr_name].get(values[attr_name])
+            if bucket and obj_id not in bucket:
+                raise DuplicateValueError(attr_name, values[attr_name])
+
+    def _index(self, obj):
+        for attr_name, index in self._indexes.items():
+            value = getattr(obj, attr_name, None)
+            bucket = index.get(value)
+            if bucket is None:
+                index[value] = bucket = {}
+            bucket[obj.id] = None
+            self._indexed_values[attr_name][obj.id] = value
+
+    def _unindex(self, obj_id):
+        for attr_name, index in self._indexes.items():
+            indexed_values = self._indexed_values[attr_name]
+            if obj_id not in indexed_values:
+                continue
+            value = indexed_values.pop(obj_id)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(obj_id, None)
+                if not bucket:
+                    del index[value]
 
     def add(self, obj):
-        print(f"Ajout de l'objet {obj.id} : {obj}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Ajout de l'objet %s : %s", obj.id, obj,
+                        extra={'operation': 'add', 'object_id': obj.id})
+        self._check_unique(obj.id, {
+            attr_name: getattr(obj, attr_name, None)
+            for attr_name in self._unique
+        })
+        self._unindex(obj.id)
         self._storage[obj.id] = obj
+        self._index(obj)
+
+    def add_many(self, objs):
+        """Add objs at once: if one would break a unique index, none is"""
+        objs = list(objs)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Ajout de %d objets", len(objs),
+                        extra={'operation': 'add_many', 'object_id': None})
+        for attr_name in self._unique:
+            batch = {}
+            for obj in objs:
+                value = getattr(obj, attr_name, None)
+                if batch.setdefault(value, obj.id) != obj.id:
+                    raise DuplicateValueError(attr_name, value)
+                self._check_unique(obj.id, {attr_name: value})
+        for obj in objs:
+            self._unindex(obj.id)
+            self._storage[obj.id] = obj
+            self._index(obj)
 
     def get(self, obj_id):
         obj = self._storage.get(obj_id)
-        print(f"Récupération de l'objet {obj_id} : {obj}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération de l'objet %s : %s", obj_id, obj,
+                         extra={'operation': 'get', 'object_id': obj_id})
         return obj
 
     def get_all(self):
-        print(f"Récupération de tous les objets")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération de tous les objets (%d)",
+                         len(self._storage),
+                         extra={'operation': 'get_all', 'object_id': None})
         return list(self._storage.values())
 
     def update(self, obj_id, data):
-        obj = self.get(obj_id)
+        obj = self._storage.get(obj_id)
         if obj:
+            self._check_unique(obj_id, {
+                attr_name: data.get(attr_name, getattr(obj, attr_name, None))
+                for attr_name in self._unique
+            })
             for key, value in data.items():
                 if hasattr(obj, key):
                     setattr(obj, key, value)
-            print(f"Mise à jour de l'objet {obj_id} : {obj}")
+            self._unindex(obj_id)
+            self._index(obj)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Mise à jour de l'objet %s : %s", obj_id, obj,
+                            extra={'operation': 'update', 'object_id': obj_id})
         else:
             raise ValueError(f"Object with ID {obj_id} not found")
 
     def delete(self, obj_id):
         if obj_id in self._storage:
+            self._unindex(obj_id)
             del self._storage[obj_id]
-            print(f"Suppression de l'objet {obj_id}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Suppression de l'objet %s", obj_id,
+                            extra={'operation': 'delete', 'object_id': obj_id})
         else:
             raise ValueError(f"Object with ID {obj_id} not found")
 
     def get_by_attribute(self, attr_name, attr_value):
-        print(f"Récupération de l'objet avec {attr_name} = {attr_value}")
-        return next((obj for obj in self._storage.values() if getattr(obj, attr_name) == attr_value), None)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération de l'objet avec %s = %s",
+                         attr_name, attr_value,
+                         extra={'operation': 'get_by_attribute',
+                                'object_id': None})
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            for obj_id in list(index.get(attr_value, ())):
+                obj = self._storage.get(obj_id)
+                if obj is not None:
+                    return obj
+            return None
+        return next((obj for obj in list(self._storage.values())
+                     if getattr(obj, attr_name) == attr_value), None)
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération des objets avec %s = %s",
+                         attr_name, attr_value,
+                         extra={'operation': 'get_all_by_attribute',
+                                'object_id': None})
+        index = self._indexes.get(attr_name)
+        if index is not None:
+            objs = (self._storage.get(obj_id)
+                    for obj_id in list(index.get(attr_value, ())))
+            return [obj for obj in objs if obj is not None]
+        return [obj for obj in list(self._storage.values())
+                if getattr(obj, attr_name) == attr_value]
+
+
+class ConcurrentInMemoryRepository(InMemoryRepository):
+    """
+    InMemoryRepository that can be shared between request threads.
+
+    Writes hold striped locks covering the object id and every index entry
+    they touch, so a unique check and the insert that follows are atomic
+    while writers on unrelated keys proceed in parallel. Reads take no lock:
+    they copy index buckets before walking them and otherwise rely on single
+    dict operations being atomic under the GIL.
+    """
+
+    def __init__(self, model_class=None, indexes=(), unique=(), stripes=64):
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        super().__init__(model_class, indexes, unique)
+
+    @contextmanager
+    def _locked(self, keys):
+        """Hold the stripes of keys, always acquired in stripe order"""
+        stripes = sorted({hash(key) % len(self._stripes) for key in keys})
+        for stripe in stripes:
+            self._stripes[stripe].acquire()
+        try:
+            yield
+        finally:
+            for stripe in reversed(stripes):
+                self._stripes[stripe].release()
+
+    def _write_keys(self, obj_id, new_values):
+        keys = {('id', obj_id)}
+        for attr_name, indexed_values in self._indexed_values.items():
+            try:
+                keys.add((attr_name, indexed_values[obj_id]))
+            except KeyError:
+                pass
+            if attr_name in new_values:
+                keys.add((attr_name, new_values[attr_name]))
+        return keys
+
+    def _write(self, obj_id, new_values, operation):
+        # Old index values are read before the id stripe is held, so check
+        # them again once locked and retry if a concurrent write moved them
+        while True:
+            keys = self._write_keys(obj_id, new_values)
+            with self._locked(keys):
+                if self._write_keys(obj_id, new_values) <= keys:
+                    return operation()
+
+    def _write_many(self, writes, operation):
+        """_write for several (obj_id, new_values) at once, under one lock"""
+        def write_keys():
+            keys = set()
+            for obj_id, new_values in writes:
+                keys |= self._write_keys(obj_id, new_values)
+            return keys
+
+        while True:
+            keys = write_keys()
+            with self._locked(keys):
+                if write_keys() <= keys:
+                    return operation()
+
+    def add_index(self, attr_name, unique=False):
+        with self._locked(range(len(self._stripes))):
+            super().add_index(attr_name, unique)
+
+    def add(self, obj):
+        new_values = {
+            attr_name: getattr(obj, attr_name, None)
+            for attr_name in self._indexes
+        }
+        self._write(obj.id, new_values, partial(super().add, obj))
+
+    def add_many(self, objs):
+        objs = list(objs)
+        writes = [(obj.id, {attr_name: getattr(obj, attr_name, None)
+                            for attr_name in self._indexes})
+                  for obj in objs]
+        self._write_many(writes, partial(super().add_many, objs))
+
+    def update(self, obj_id, data):
+        obj = self._storage.get(obj_id)
+        new_values = {
+            attr_name: data.get(attr_name, getattr(obj, attr_name, None))
+            for attr_name in self._indexes
+        } if obj else {}
+        self._write(obj_id, new_values, partial(super().update, obj_id, data))
+
+    def delete(self, obj_id):
+        self._write(obj_id, {}, partial(super().delete, obj_id))
+
+
+class DurableInMemoryRepository(ConcurrentInMemoryRepository):
+    """
+    ConcurrentInMemoryRepository that survives restarts.
+
+    Each write is journaled while its stripes are held and returns once the
+    journal frame is fsynced; concurrent writers share fsyncs through group
+    commit. On startup the repository is rebuilt from the latest snapshot
+    plus the logs written after it (see app.persistence.journal).
+    """
+
+    def __init__(self, path, model_class=None, indexes=(), unique=(),
+                 compact_bytes=64 * 1024 * 1024, stripes=64):
+        super().__init__(model_class, indexes, unique, stripes)
+        self._journal = Journal(path, compact_bytes)
+        # Recovery allocates millions of long-lived objects; cyclic GC
+        # passes over them would only slow the load down
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._storage = self._journal.recover()
+            for attr_name in list(self._indexes):
+                self.add_index(attr_name, attr_name in self._unique)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self._journal.snapshot_source = lambda: list(self._storage.values())
+
+    def _write(self, obj_id, new_values, operation):
+        def journaled():
+            operation()
+            obj = self._storage.get(obj_id)
+            if obj is None:
+                return self._journal.append_delete(obj_id)
+            return self._journal.append_put(obj)
+        self._journal.wait(super()._write(obj_id, new_values, journaled))
+
+    def _write_many(self, writes, operation):
+        # One frame for the whole batch: it is replayed entirely or not at all
+        def journaled():
+            operation()
+            return self._journal.append_put_many(
+                [self._storage[obj_id] for obj_id, _ in writes])
+        self._journal.wait(super()._write_many(writes, journaled))
+
+    def compact(self):
+        """Snapshot the repository now instead of waiting for the log size"""
+        self._journal.compact()
+
+    def close(self):
+        """Flush the journal and release its files"""
+        self._journal.close()
+
+
+class _ThreadConnection:
+    """A thread's SQLite connection, held only by its thread-local"""
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+
+
+class SQLiteRepository(Repository):
+    """
+    Repository stored in a SQLite database in WAL mode.
+
+    Objects are pickled into a ``data`` column and every declared index gets
+    its own column with a real SQL index (UNIQUE for unique attributes), so
+    get_by_attribute on it is an index lookup and memory stays bounded by
+    the page cache rather than the dataset. Each thread gets its own
+    connection, closed when the thread exits; the SQL text is built once
+    here so sqlite3's per-connection statement cache keeps reusing the
+    prepared statements.
+    """
+
+    def __init__(self, path, model_class=None, indexes=(), unique=(),
+                 table=None):
+        self.path = path
+        self.model_class = model_class
+        self.table = table or f"{model_class.__name__.lower()}s"
+        self._unique = set(unique)
+        self._columns = list(unique) + [
+            attr_name for attr_name in indexes
+            if attr_name not in self._unique]
+        for name in [self.table] + self._columns:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid SQL identifier: {name}")
+        self._local = threading.local()
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+        table = f'"{self.table}"'
+        columns = ''.join(f', "{column}"' for column in self._columns)
+        placeholders = ', ?' * len(self._columns)
+        assignments = ''.join(
+            f', "{column}" = excluded."{column}"' for column in self._columns)
+        self._insert_sql = (
+            f'INSERT INTO {table} (id, data{columns}) '
+            f'VALUES (?, ?{placeholders}) '
+            f'ON CONFLICT(id) DO UPDATE SET data = excluded.data{assignments}')
+        self._update_sql = (
+            f'UPDATE {table} SET data = ?'
+            + ''.join(f', "{column}" = ?' for column in self._columns)
+            + ' WHERE id = ?')
+        self._select_sql = f'SELECT data FROM {table} WHERE id = ?'
+        self._select_all_sql = f'SELECT data FROM {table} ORDER BY rowid'
+        self._delete_sql = f'DELETE FROM {table} WHERE id = ?'
+        self._select_by_sql = {
+            column: f'SELECT data FROM {table} WHERE "{column}" IS ? '
+                    f'ORDER BY rowid'
+            for column in self._columns
+        }
+
+        conn = self._connection()
+        with self._transaction(conn):
+            conn.execute(f'CREATE TABLE IF NOT EXISTS {table} '
+                         f'(id TEXT PRIMARY KEY, data BLOB NOT NULL{columns})')
+            for column in self._columns:
+                kind = 'UNIQUE INDEX' if column in self._unique else 'INDEX'
+                conn.execute(
+                    f'CREATE {kind} IF NOT EXISTS "{self.table}_{column}" '
+                    f'ON {table} ("{column}")')
+
+    def _connection(self):
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            # Autocommit mode: writes open their own BEGIN IMMEDIATE below
+            conn = sqlite3.connect(self.path, timeout=30,
+                                   isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            holder = self._local.holder = _ThreadConnection(conn)
+            with self._connections_lock:
+                self._connections.add(conn)
+            # Only the thread-local refers to holder, so this runs when
+            # the thread exits (one thread per request on the dev server)
+            weakref.finalize(holder, self._release, self._connections,
+                             self._connections_lock, conn)
+        return holder.conn
+
+    @staticmethod
+    def _release(connections, lock, conn):
+        """Close conn unless close() already did"""
+        with lock:
+            if conn not in connections:
+                return
+            connections.discard(conn)
+        conn.close()
+
+    @contextmanager
+    def _transaction(self, conn):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def _row(self, obj):
+        return (obj.id, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL),
+                *[getattr(obj, column, None) for column in self._columns])
+
+    def _execute(self, conn, sql, params, obj=None):
+        """Run sql (executemany when obj is None) mapping UNIQUE failures"""
+        try:
+            if obj is None:
+                conn.executemany(sql, params)
+            else:
+                conn.execute(sql, params)
+        except sqlite3.IntegrityError as e:
+            # Message format: "UNIQUE constraint failed: <table>.<column>"
+            attr_name = str(e).rsplit('.', 1)[-1]
+            if attr_name not in self._unique:
+                raise
+            value = getattr(obj, attr_name, None) if obj is not None else None
+            raise DuplicateValueError(attr_name, value) from e
+
+    def add(self, obj):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Ajout de l'objet %s : %s", obj.id, obj,
+                        extra={'operation': 'add', 'object_id': obj.id})
+        conn = self._connection()
+        with self._transaction(conn):
+            self._execute(conn, self._insert_sql, self._row(obj), obj)
+
+    def add_many(self, objs):
+        """Insert or replace objs in a single transaction"""
+        conn = self._connection()
+        with self._transaction(conn):
+            self._execute(conn, self._insert_sql,
+                          (self._row(obj) for obj in objs))
+
+    def get(self, obj_id):
+        row = self._connection().execute(
+            self._select_sql, (obj_id,)).fetchone()
+        obj = pickle.loads(row[0]) if row else None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération de l'objet %s : %s", obj_id, obj,
+                         extra={'operation': 'get', 'object_id': obj_id})
+        return obj
+
+    def get_all(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération de tous les objets",
+                         extra={'operation': 'get_all', 'object_id': None})
+        rows = self._connection().execute(self._select_all_sql)
+        return [pickle.loads(data) for data, in rows]
+
+    def update(self, obj_id, data):
+        conn = self._connection()
+        with self._transaction(conn):
+            row = conn.execute(self._select_sql, (obj_id,)).fetchone()
+            if row is None:
+                raise ValueError(f"Object with ID {obj_id} not found")
+            obj = pickle.loads(row[0])
+            for key, value in data.items():
+                if hasattr(obj, key):
+                    setattr(obj, key, value)
+            _, blob, *values = self._row(obj)
+            self._execute(conn, self._update_sql, (blob, *values, obj_id), obj)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Mise à jour de l'objet %s : %s", obj_id, obj,
+                        extra={'operation': 'update', 'object_id': obj_id})
+
+    def delete(self, obj_id):
+        conn = self._connection()
+        with self._transaction(conn):
+            if conn.execute(self._delete_sql, (obj_id,)).rowcount == 0:
+                raise ValueError(f"Object with ID {obj_id} not found")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Suppression de l'objet %s", obj_id,
+                        extra={'operation': 'delete', 'object_id': obj_id})
+
+    def get_by_attribute(self, attr_name, attr_value):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération de l'objet avec %s = %s",
+                         attr_name, attr_value,
+                         extra={'operation': 'get_by_attribute',
+                                'object_id': None})
+        sql = self._select_by_sql.get(attr_name)
+        if sql is not None:
+            row = self._connection().execute(sql, (attr_value,)).fetchone()
+            return pickle.loads(row[0]) if row else None
+        return next((obj for obj in self.get_all()
+                     if getattr(obj, attr_name) == attr_value), None)
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Récupération des objets avec %s = %s",
+                         attr_name, attr_value,
+                         extra={'operation': 'get_all_by_attribute',
+                                'object_id': None})
+        sql = self._select_by_sql.get(attr_name)
+        if sql is not None:
+            rows = self._connection().execute(sql, (attr_value,))
+            return [pickle.loads(data) for data, in rows]
+        return [obj for obj in self.get_all()
+                if getattr(obj, attr_name) == attr_value]
 
+    def close(self):
+        """Close every per-thread connection"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,54 @@
+"""
+Tracing for the persistence layer.
+
+Repository operations are logged through the ``app.persistence`` logger:
+mutations at INFO, reads at DEBUG. Call sites check ``logger.isEnabledFor``
+before building a record and pass objects as %-style arguments, so nothing
+is formatted unless a record is actually emitted and a disabled level costs
+a single cached lookup. Each record carries ``operation`` and ``object_id``
+attributes for structured handlers.
+"""
+
+import logging
+import random
+
+logger = logging.getLogger('app.persistence')
+
+
+class SamplingFilter(logging.Filter):
+    """Let through roughly ``rate`` of the records (1.0 keeps everything)"""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+def configure_tracing(level=logging.WARNING, sample_rate=1.0, handler=None):
+    """
+    Configure repository tracing
+    Args:
+        level: Logging level (name or number); WARNING disables tracing
+        sample_rate: Fraction of records to keep, between 0 and 1
+        handler: Optional handler, defaults to a stderr StreamHandler
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    logger.setLevel(level)
+
+    for old_filter in [f for f in logger.filters
+                       if isinstance(f, SamplingFilter)]:
+        logger.removeFilter(old_filter)
+    if sample_rate < 1.0:
+        logger.addFilter(SamplingFilter(sample_rate))
+
+    if handler is None and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s %(levelname)s %(name)s %(operation)s '
+            '%(object_id)s %(message)s'))
+    if handler is not None:
+        logger.addHandler(handler)
+    return logger
@@ -1,9 +1,36 @@
-from app.persistence.repository import InMemoryRepository
+import copy
+import os
+from app.persistence.geo_index import GeoGridIndex
+from app.persistence.place_columns import PlaceColumns
+from app.persistence.repository import (
+    ConcurrentInMemoryRepository, DurableInMemoryRepository,
+    DuplicateValueError, SQLiteRepository)
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
 
+# Largest radius served by get_places_nearby: at 1M places
+# bench_geo_index measured p99 2.8 ms at 10 km but 12 ms at 25 km,
+# against a 10 ms target
+MAX_NEARBY_RADIUS_KM = 10
+
+
+def _make_repository(name, **kwargs):
+    """
+    Pick the repository backend from the environment:
+    $HBNB_SQLITE_DB (one table per repository), then $HBNB_DATA_DIR
+    (journaled in-memory), else plain in-memory
+    """
+    sqlite_db = os.getenv('HBNB_SQLITE_DB')
+    if sqlite_db:
+        return SQLiteRepository(sqlite_db, table=name, **kwargs)
+    data_dir = os.getenv('HBNB_DATA_DIR')
+    if data_dir:
+        return DurableInMemoryRepository(os.path.join(data_dir, name),
+                                         **kwargs)
+    return ConcurrentInMemoryRepository(**kwargs)
+
 
 class HBnBFacade:
     _instance = None
@@ -12,10 +39,21 @@ class HBnBFacade:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         # Initialize repositories with their respective models
-            cls._instance.user_repo = InMemoryRepository(model_class=User)
-            cls._instance.amenity_repo = InMemoryRepository(model_class=Amenity)
-            cls._instance.place_repo = InMemoryRepository(model_class=Place)
-            cls._instance.review_repo = InMemoryRepository(model_class=Review)
+            cls._instance.user_repo = _make_repository(
+                'users', model_class=User, unique=('email',))
+            cls._instance.amenity_repo = _make_repository(
+                'amenities', model_class=Amenity)
+            cls._instance.place_repo = _make_repository(
+                'places', model_class=Place, indexes=('owner_id',))
+            cls._instance.review_repo = _make_repository(
+                'reviews', model_class=Review, indexes=('place_id', 'user_id'))
+            cls._instance.place_columns = None
+            if PlaceColumns.available:
+                cls._instance.place_columns = PlaceColumns()
+                cls._instance.place_columns.load(
+                    cls._instance.place_repo.get_all())
+            cls._instance.place_geo = GeoGridIndex()
+            cls._instance.place_geo.load(cls._instance.place_repo.get_all())
             cls._instance._initialized = False
         return cls._instance
 
@@ -23,6 +61,21 @@ class HBnBFacade:
         if not hasattr(self, '_initialized'):
             self._initialized = True
 
+    @staticmethod
+    def _update(repo, obj, updates):
+        """
+        Validate updates on a copy of obj, then apply them through
+        repo.update alone: the in-memory backends hand out the stored
+        object itself, which must not change unless the update (and its
+        unique check) goes through. Returns the stored object.
+        """
+        candidate = copy.copy(obj)
+        for key, value in updates.items():
+            setattr(candidate, key, value)
+        candidate.validate()
+        repo.update(obj.id, updates)
+        return repo.get(obj.id)
+
 # Users methods
     def get_user(self, user_id: str):
         """Get user by ID"""
@@ -32,6 +85,10 @@ class HBnBFacade:
         """Get all users"""
         return self.user_repo.get_all()
 
+    def get_user_by_email(self, email: str):
+        """Get user by email (indexed lookup)"""
+        return self.user_repo.get_by_attribute('email', email)
+
     def create_user(self, user_data: dict):
         """Create new user"""
         if not user_data:
@@ -39,14 +96,16 @@ class HBnBFacade:
         if 'email' not in user_data:
             raise ValueError("Email is required")
 
-        all_users = self.get_all_users()
-        if any(user.email == user_data['email'] for user in all_users):
+        if self.get_user_by_email(user_data['email']):
             raise ValueError("Email already registered")
 
         try:
             user = User(**user_data)
             self.user_repo.add(user)
             return user
+        except DuplicateValueError:
+            # Another request registered the email since the check above
+            raise ValueError("Email already registered")
         except Exception as e:
             raise ValueError(f"Error creating user: {str(e)}")
 
@@ -57,16 +116,15 @@ class HBnBFacade:
             raise ValueError("User not found")
 
         if 'email' in user_data:
-            all_users = self.get_all_users()
-            if any(u.email == user_data['email'] and u.id != user_id for u in all_users):
+            existing = self.get_user_by_email(user_data['email'])
+            if existing and existing.id != user_id:
                 raise ValueError("Email already registered")
 
         try:
-            for key, value in user_data.items():
-                setattr(user, key, value)
-            user.validate()
-            self.user_repo.update(user_id, user_data)  # Passez user_data au lieu de user
-            return user
+            return self._update(self.user_repo, user, user_data)
+        except DuplicateValueError:
+            # Another request registered the email since the check above
+            raise ValueError("Email already registered")
         except Exception as e:
             raise ValueError(f"Error updating user: {str(e)}")
 
@@ -100,50 +158,77 @@ class HBnBFacade:
             raise ValueError("Amenity not found")
 
         try:
-            for key, value in amenity_data.items():
-                setattr(amenity, key, value)
-            amenity.validate()
-            self.amenity_repo.update(amenity_id, amenity)
-            return amenity
+            return self._update(self.amenity_repo, amenity, amenity_data)
         except Exception as e:
             raise ValueError(f"Error updating amenity: {str(e)}")
         
 # Place methods
+    def _build_place(self, place_data):
+        """Validate place_data and return the new, not yet stored, Place"""
+        if not place_data:
+            raise ValueError("Place data cannot be empty")
+
+        # Validate required fields
+        required_fields = ['title', 'description', 'price', 'latitude',
+                           'longitude', 'owner_id']
+        for field in required_fields:
+            if field not in place_data:
+                raise ValueError(f"{field} is required")
+
+        # Validate owner exists
+        owner = self.get_user(place_data['owner_id'])
+        if not owner:
+            raise ValueError(
+                f"Owner with id {place_data['owner_id']} not found")
+
+        # Validate amenities if provided
+        if 'amenity_ids' in place_data:
+            valid_amenities = []
+            for amenity_id in place_data['amenity_ids']:
+                amenity = self.get_amenity(amenity_id)
+                if not amenity:
+                    raise ValueError(f"Amenity {amenity_id} not found")
+                valid_amenities.append(amenity_id)
+            place_data['amenity_ids'] = valid_amenities
+
+        return Place(**place_data)
+
+    def _index_place(self, place):
+        """Keep the column and geo indexes in step with place_repo"""
+        if self.place_columns is not None:
+            self.place_columns.upsert(place)
+        self.place_geo.upsert(place.id, place.latitude, place.longitude)
+
     def create_place(self, place_data):
         """Create new place"""
         try:
-            if not place_data:
-                raise ValueError("Place data cannot be empty")
-            
-            # Validate required fields
-            required_fields = ['title', 'description', 'price', 'latitude',
-                            'longitude', 'owner_id']
-            for field in required_fields:
-                if field not in place_data:
-                    raise ValueError(f"{field} is required")
-
-            # Validate owner exists
-            owner = self.get_user(place_data['owner_id'])
-            if not owner:
-                raise ValueError(f"Owner with id {place_data['owner_id']} not found")
-
-            # Validate amenities if provided
-            if 'amenity_ids' in place_data:
-                valid_amenities = []
-                for amenity_id in place_data['amenity_ids']:
-                    amenity = self.get_amenity(amenity_id)
-                    if not amenity:
-                        raise ValueError(f"Amenity {amenity_id} not found")
-                    valid_amenities.append(amenity_id)
-                place_data['amenity_ids'] = valid_amenities
-
-            # Create place
-            place = Place(**place_data)
+            place = self._build_place(place_data)
             self.place_repo.add(place)
+            self._index_place(place)
             return place
         except Exception as e:
             raise ValueError(f"Error creating place: {str(e)}")
 
+    def create_places(self, places_data):
+        """
+        Create many places with a single add_many.
+        Returns one entry per item, in order: the new Place, or the
+        ValueError that item failed validation with.
+        """
+        results = []
+        for place_data in places_data:
+            try:
+                if not isinstance(place_data, dict):
+                    raise ValueError("Place data must be an object")
+                results.append(self._build_place(place_data))
+            except Exception as e:
+                results.append(ValueError(f"Error creating place: {str(e)}"))
+        places = [place for place in results if isinstance(place, Place)]
+        self.place_repo.add_many(places)
+        for place in places:
+            self._index_place(place)
+        return results
+
     def get_place(self, place_id):
         """Get place by ID"""
         return self.place_repo.get(place_id)
@@ -160,27 +245,63 @@ class HBnBFacade:
 
         try:
             # Update only provided fields
-            for key, value in place_data.items():
-                if key not in ['id', 'created_at', 'updated_at', 'owner_id']:
-                    setattr(place, key, value)
-
-            # Re-validate place
-            place.validate()
-            self.place_repo.update(place_id, place)
+            updates = {
+                key: value for key, value in place_data.items()
+                if key not in ['id', 'created_at', 'updated_at', 'owner_id']
+            }
+            place = self._update(self.place_repo, place, updates)
+            self._index_place(place)
             return place
         except Exception as e:
             raise ValueError(f"Error updating place: {str(e)}")
 
-# Review methods
-    def get_reviews_by_place(self, place_id):
-        """Get all reviews for a specific place"""
-        place = self.get_place(place_id)
-        if not place:
-            raise ValueError(f"Place {place_id} not found")
-
-        all_reviews = self.get_all_reviews()
-        return [review for review in all_reviews if review.place_id == place_id]
+    def search_places(self, min_price=None, max_price=None, bbox=None):
+        """
+        Get places matching price bounds and/or a bounding box
+        Args:
+            min_price, max_price: Inclusive price bounds
+            bbox: (min_lon, min_lat, max_lon, max_lat), inclusive
+        """
+        if self.place_columns is not None:
+            ids = self.place_columns.query(min_price=min_price,
+                                           max_price=max_price, bbox=bbox)
+            places = (self.place_repo.get(place_id) for place_id in ids)
+            return [place for place in places if place is not None]
+
+        def matches(place):
+            if min_price is not None and place.price < min_price:
+                return False
+            if max_price is not None and place.price > max_price:
+                return False
+            if bbox is not None:
+                min_lon, min_lat, max_lon, max_lat = bbox
+                if not (min_lat <= place.latitude <= max_lat
+                        and min_lon <= place.longitude <= max_lon):
+                    return False
+            return True
+        return [place for place in self.get_all_places() if matches(place)]
+
+    def get_places_nearby(self, lat, lon, radius_km, limit=20, offset=0):
+        """
+        Get places within radius_km of (lat, lon), nearest first
+        Returns:
+            (total, [(place, distance_km), ...]) for the requested page
+        """
+        if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+            raise ValueError("lat/lon out of range")
+        if not 0 < radius_km <= MAX_NEARBY_RADIUS_KM:
+            raise ValueError(
+                f"radius_km must be between 0 and {MAX_NEARBY_RADIUS_KM}")
+        total, hits = self.place_geo.nearby(lat, lon, radius_km,
+                                            limit=limit, offset=offset)
+        results = []
+        for place_id, distance in hits:
+            place = self.place_repo.get(place_id)
+            if place is not None:
+                results.append((place, distance))
+        return total, results
 
+# Review methods
     def create_review(self, review_data):
         """Create new review"""
         try:
@@ -221,12 +342,11 @@ class HBnBFacade:
             raise ValueError("Review not found")
 
         try:
-            for key, value in review_data.items():
-                if key not in ['id', 'created_at', 'updated_at']:
-                    setattr(review, key, value)
-            review.validate()
-            self.review_repo.update(review_id, review)
-            return review
+            updates = {
+                key: value for key, value in review_data.items()
+                if key not in ['id', 'created_at', 'updated_at']
+            }
+            return self._update(self.review_repo, review, updates)
         except Exception as e:
             raise ValueError(f"Error updating review: {str(e)}")
 
@@ -244,15 +364,11 @@ class HBnBFacade:
             if not place:
                 raise ValueError(f"Place {place_id} not found")
 
-            # Filtre les reviews pour ce place
-            all_reviews = self.get_all_reviews()
-            place_reviews = [
-                review for review in all_reviews 
-                if review.place_id == place_id
-            ]
-            
-            return place_reviews
+            # review_repo indexes place_id, so this only touches the
+            # reviews of this place instead of scanning every review
+            return self.review_repo.get_all_by_attribute('place_id', place_id)
         except Exception as e:
             raise ValueError(f"Error getting reviews for place: {str(e)}")
 
-facade = HBnBFacade()
\ No newline at end of file
+
+facade = HBnBFacade()
\ No newline at end of file
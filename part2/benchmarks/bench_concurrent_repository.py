@@ -0,0 +1,114 @@
+"""
+Multi-threaded stress benchmark for the in-memory repositories.
+
+Runs a read-mostly workload (lookups by id and by unique email, plus a
+share of user inserts) at 1/4/16 threads and reports total throughput for:
+  - InMemoryRepository (no locking, not thread-safe; reference only)
+  - a single global lock around every operation
+  - ConcurrentInMemoryRepository (striped write locks, lock-free reads)
+
+Usage (from part2/):
+    python -m benchmarks.bench_concurrent_repository
+        [--ops 50000] [--writes 0.05]
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from app.models.user import User
+from app.persistence.repository import (
+    ConcurrentInMemoryRepository, InMemoryRepository)
+
+THREAD_COUNTS = (1, 4, 16)
+SEED_USERS = 10000
+
+
+class GlobalLockRepository(InMemoryRepository):
+    """Baseline that serializes every call on one lock"""
+
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def add(self, obj):
+        with self._lock:
+            super().add(obj)
+
+    def get(self, obj_id):
+        with self._lock:
+            return super().get(obj_id)
+
+    def get_by_attribute(self, attr_name, attr_value):
+        with self._lock:
+            return super().get_by_attribute(attr_name, attr_value)
+
+
+def make_user(i):
+    return User(first_name="Bench", last_name=str(i),
+                email=f"user{i}@hbnb.io")
+
+
+def run(repo_class, threads, ops_per_thread, write_ratio):
+    repo = repo_class(model_class=User, unique=('email',))
+    seed = [make_user(i) for i in range(SEED_USERS)]
+    for user in seed:
+        repo.add(user)
+    ids = [user.id for user in seed]
+    # Build the inserted users up front so only repository work is timed
+    counter = iter(range(SEED_USERS, SEED_USERS + threads * ops_per_thread))
+    fresh = [[make_user(next(counter))
+              for _ in range(int(ops_per_thread * write_ratio) + 1)]
+             for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(n):
+        rng = random.Random(n)
+        pending = fresh[n]
+        barrier.wait()
+        for _ in range(ops_per_thread):
+            roll = rng.random()
+            if roll < write_ratio and pending:
+                repo.add(pending.pop())
+            elif roll < 0.5:
+                repo.get(rng.choice(ids))
+            else:
+                repo.get_by_attribute(
+                    'email', f"user{rng.randrange(SEED_USERS)}@hbnb.io")
+
+    workers = [threading.Thread(target=worker, args=(n,))
+               for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ops', type=int, default=50000,
+                        help='operations per thread')
+    parser.add_argument('--writes', type=float, default=0.05,
+                        help='fraction of operations that insert')
+    args = parser.parse_args()
+
+    repos = [
+        ('unlocked', InMemoryRepository),
+        ('global lock', GlobalLockRepository),
+        ('striped', ConcurrentInMemoryRepository),
+    ]
+    print(f"{'threads':>8}" + ''.join(f"{name:>16}" for name, _ in repos)
+          + "   (ops/s)")
+    for threads in THREAD_COUNTS:
+        row = [run(repo_class, threads, args.ops, args.writes)
+               for _, repo_class in repos]
+        print(f"{threads:>8}" + ''.join(f"{ops:>16,.0f}" for ops in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark for DurableInMemoryRepository.
+
+Write phase: concurrent inserts at 1/4/16 threads, reporting throughput and
+how many journal frames each fsync carried (group commit).
+Startup phase: snapshot N objects, then time how long reopening takes.
+
+Usage (from part2/):
+    python -m benchmarks.bench_durable_repository [--objects 1000000]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from app.models.review import Review
+from app.persistence import journal
+from app.persistence.repository import DurableInMemoryRepository
+
+THREAD_COUNTS = (1, 4, 16)
+
+
+class FsyncCounter:
+    """Counts os.fsync calls made by the journal"""
+
+    def __init__(self):
+        self.calls = 0
+        self._fsync = os.fsync
+
+    def __call__(self, fd):
+        self.calls += 1
+        self._fsync(fd)
+
+
+def make_review(i):
+    return Review(text=f"Review {i}", rating=1 + i % 5,
+                  user_id=f"user-{i % 1000}", place_id=f"place-{i % 10000}")
+
+
+def open_repo(path):
+    return DurableInMemoryRepository(
+        path, model_class=Review, indexes=('place_id', 'user_id'))
+
+
+def bench_writes(path, threads, per_thread, counter):
+    repo = open_repo(path)
+    batches = [[make_review(n * per_thread + i) for i in range(per_thread)]
+               for n in range(threads)]
+    workers = [threading.Thread(target=lambda b=b: [repo.add(r) for r in b])
+               for b in batches]
+    counter.calls = 0
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    fsyncs = counter.calls
+    repo.close()
+    ops = threads * per_thread
+    return ops / elapsed, ops / max(fsyncs, 1)
+
+
+def bench_startup(path, objects):
+    repo = open_repo(path)
+    for i in range(objects):
+        # Fill storage directly: only the reload is being measured
+        review = make_review(i)
+        repo._storage[review.id] = review
+    repo.compact()
+    repo.close()
+    size = os.path.getsize(os.path.join(path, 'snapshot'))
+
+    start = time.perf_counter()
+    repo = open_repo(path)
+    elapsed = time.perf_counter() - start
+    assert len(repo.get_all()) == objects
+    repo.close()
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--objects', type=int, default=1000000,
+                        help='objects in the startup snapshot')
+    parser.add_argument('--writes', type=int, default=2000,
+                        help='inserts per thread in the write phase')
+    args = parser.parse_args()
+
+    counter = FsyncCounter()
+    journal.os.fsync = counter
+    root = tempfile.mkdtemp()
+    try:
+        print(f"{'threads':>8} {'writes/s':>12} {'frames/fsync':>14}")
+        for threads in THREAD_COUNTS:
+            path = os.path.join(root, f"writes-{threads}")
+            rate, batching = bench_writes(path, threads, args.writes, counter)
+            print(f"{threads:>8} {rate:>12,.0f} {batching:>14.1f}")
+
+        elapsed, size = bench_startup(os.path.join(root, 'startup'),
+                                      args.objects)
+        print(f"\nstartup: {args.objects:,} objects from a "
+              f"{size / 1e6:.0f} MB snapshot in {elapsed:.2f}s")
+    finally:
+        journal.os.fsync = counter._fsync
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
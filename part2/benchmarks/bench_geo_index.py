@@ -0,0 +1,74 @@
+"""
+Benchmark for the spatial grid index.
+
+Indexes N places (half spread over the inhabited latitudes, half
+clustered around a few cities) and reports p50/p99 latency of
+"within R km, nearest first, first page" queries centred on random
+cities, next to a brute-force scan for reference.
+
+Usage (from part2/):
+    python -m benchmarks.bench_geo_index [--places 1000000] [--queries 500]
+"""
+
+import argparse
+import random
+import time
+
+from app.persistence.geo_index import GeoGridIndex, haversine_km
+
+CITIES = [(48.85, 2.35), (51.51, -0.13), (40.71, -74.01), (35.68, 139.69),
+          (-33.87, 151.21), (37.77, -122.42), (52.52, 13.40), (41.90, 12.50),
+          (-23.55, -46.63), (19.43, -99.13), (1.35, 103.82), (55.76, 37.62)]
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=1000000)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--cell-deg', type=float, default=0.1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    points = []
+    for i in range(args.places):
+        if i % 2:
+            lat, lon = rng.choice(CITIES)
+            points.append((lat + rng.gauss(0, 0.5), lon + rng.gauss(0, 0.5)))
+        else:
+            points.append((rng.uniform(-60, 70), rng.uniform(-180, 180)))
+
+    index = GeoGridIndex(cell_deg=args.cell_deg)
+    start = time.perf_counter()
+    for i, (lat, lon) in enumerate(points):
+        index.upsert(f"place-{i}", lat, lon)
+    elapsed = time.perf_counter() - start
+    print(f"indexed {args.places} places in {elapsed:.1f}s")
+
+    print(f"{'radius km':>10} {'avg hits':>9} {'p50 (ms)':>9} {'p99 (ms)':>9}"
+          f" {'scan (ms)':>10}")
+    for radius_km in (1, 5, 10, 25):
+        timings, hits = [], 0
+        for _ in range(args.queries):
+            lat, lon = rng.choice(CITIES)
+            lat, lon = lat + rng.gauss(0, 0.2), lon + rng.gauss(0, 0.2)
+            start = time.perf_counter()
+            total, _ = index.nearby(lat, lon, radius_km, limit=args.limit)
+            timings.append(time.perf_counter() - start)
+            hits += total
+        start = time.perf_counter()
+        sum(1 for plat, plon in points
+            if haversine_km(lat, lon, plat, plon) <= radius_km)
+        scan = time.perf_counter() - start
+        print(f"{radius_km:>10} {hits / args.queries:>9.0f}"
+              f" {percentile(timings, 50) * 1e3:>9.2f}"
+              f" {percentile(timings, 99) * 1e3:>9.2f} {scan * 1e3:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Memory benchmark for the part2 models.
+
+Each model is measured in a fresh process: 100k instances are created and
+kept alive, then the script reports the RSS they added and, from a second
+traced batch, the bytes per object seen by tracemalloc (instance, id string
+and timestamps included).
+
+Usage (from part2/):
+    python -m benchmarks.bench_model_memory [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+MAKERS = {
+    'User': lambda i: User(first_name="Alice", last_name="Smith",
+                           email="alice@example.com"),
+    'Place': lambda i: Place(title="Cozy Apartment",
+                             description="A nice place", price=100,
+                             latitude=37.77, longitude=-122.41,
+                             owner_id="owner"),
+    'Review': lambda i: Review(text="Great stay!", rating=5,
+                               user_id="user", place_id="place"),
+    'Amenity': lambda i: Amenity(name="Wi-Fi"),
+}
+
+# Per-object budget (bytes) traced by tracemalloc, list slot included
+TARGETS = {'User': 260, 'Place': 350, 'Review': 270, 'Amenity': 240}
+
+
+def rss_bytes():
+    """Current resident set size (Linux), 0 elsewhere"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return 0
+
+
+def measure(name, count):
+    make = MAKERS[name]
+    make(0)  # warm up class-level caches before measuring
+    gc.collect()
+    before = rss_bytes()
+    objects = [make(i) for i in range(count)]
+    rss = rss_bytes() - before
+
+    # Traced separately: tracemalloc's own bookkeeping inflates RSS
+    sample = max(1, count // 10)
+    tracemalloc.start()
+    traced_objects = [make(i) for i in range(sample)]
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'rss': rss, 'per_object': traced / len(traced_objects),
+            'count': len(objects)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(measure(args.run, args.count)))
+        return
+
+    print(f"{'model':>8} {'RSS/100k (MB)':>14} {'bytes/object':>13} "
+          f"{'target':>7}")
+    for name in MAKERS:
+        out = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_model_memory',
+             '--run', name, '--count', str(args.count)],
+            check=True, capture_output=True, text=True).stdout
+        result = json.loads(out)
+        rss_per_100k = result['rss'] / args.count * 100000 / 1e6
+        status = 'ok' if result['per_object'] <= TARGETS[name] else 'OVER'
+        print(f"{name:>8} {rss_per_100k:>14.1f} {result['per_object']:>13.0f} "
+              f"{TARGETS[name]:>5} {status}")
+
+
+if __name__ == '__main__':
+    main()
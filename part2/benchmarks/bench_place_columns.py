@@ -0,0 +1,71 @@
+"""
+Benchmark for the columnar place store.
+
+Loads N random places into PlaceColumns and times price-range,
+bounding-box and radius queries (ids only), next to the same filters run
+as a Python loop over Place objects.
+
+Usage (from part2/):
+    python -m benchmarks.bench_place_columns [--places 1000000]
+"""
+
+import argparse
+import random
+import timeit
+
+from app.persistence.place_columns import PlaceColumns
+
+
+class Point:
+    """Minimal stand-in carrying the columns PlaceColumns reads"""
+    __slots__ = ('id', 'price', 'latitude', 'longitude')
+
+    def __init__(self, i, rng):
+        self.id = f"place-{i}"
+        self.price = rng.randrange(20, 1000)
+        self.latitude = rng.uniform(-60, 70)
+        self.longitude = rng.uniform(-180, 180)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if not PlaceColumns.available:
+        raise SystemExit("numpy is required: pip install numpy")
+
+    rng = random.Random(0)
+    places = [Point(i, rng) for i in range(args.places)]
+    columns = PlaceColumns(capacity=args.places)
+    columns.load(places)
+
+    queries = {
+        'price 100-120': (
+            dict(min_price=100, max_price=120),
+            lambda p: 100 <= p.price <= 120),
+        'bbox Paris area': (
+            dict(bbox=(1.5, 48.0, 3.5, 49.5)),
+            lambda p: (48.0 <= p.latitude <= 49.5
+                       and 1.5 <= p.longitude <= 3.5)),
+        'radius 50km': (
+            dict(center=(48.85, 2.35), radius_km=50),
+            None),
+    }
+    print(f"{'query':>16} {'matches':>8} {'columnar (us)':>14}"
+          f" {'loop (us)':>10}")
+    for name, (kwargs, predicate) in queries.items():
+        matches = len(columns.query(**kwargs))
+        columnar = timeit.timeit(lambda: columns.query(**kwargs),
+                                 number=args.repeat) / args.repeat
+        loop = ''
+        if predicate is not None:
+            elapsed = timeit.timeit(
+                lambda: [p.id for p in places if predicate(p)], number=1)
+            loop = f"{elapsed * 1e6:.0f}"
+        print(f"{name:>16} {matches:>8} {columnar * 1e6:>14.0f} {loop:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark for HBnBFacade.get_reviews_by_place.
+
+Keeps one place with a fixed number of reviews while the global review
+count grows, and compares the indexed lookup with the old full scan.
+
+Usage (from part2/):
+    python -m benchmarks.bench_reviews_by_place [--max 1000000]
+"""
+
+import argparse
+import timeit
+
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.repository import InMemoryRepository
+from app.services.facade import HBnBFacade
+
+REVIEWS_PER_PLACE = 10
+
+
+def populate(facade, total_reviews, place_count=1000):
+    """Fill fresh repositories and return the id of the measured place"""
+    facade.user_repo = InMemoryRepository(model_class=User, unique=('email',))
+    facade.place_repo = InMemoryRepository(
+        model_class=Place, indexes=('owner_id',))
+    facade.review_repo = InMemoryRepository(
+        model_class=Review, indexes=('place_id', 'user_id'))
+
+    user = User(first_name="Bench", last_name="User", email="bench@hbnb.io")
+    facade.user_repo.add(user)
+    place_ids = []
+    for i in range(place_count):
+        place = Place(title=f"Place {i}", description="Bench place",
+                      price=100, latitude=0, longitude=0, owner_id=user.id)
+        facade.place_repo.add(place)
+        place_ids.append(place.id)
+
+    target = place_ids[0]
+    for i in range(total_reviews):
+        if i < REVIEWS_PER_PLACE:
+            place_id = target
+        else:
+            place_id = place_ids[1 + i % (place_count - 1)]
+        facade.review_repo.add(Review(text="Nice", rating=4,
+                                      user_id=user.id, place_id=place_id))
+    return target
+
+
+def scan(facade, place_id):
+    """Previous implementation: filter a copy of every review"""
+    return [review for review in facade.get_all_reviews()
+            if review.place_id == place_id]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max', type=int, default=1000000,
+                        help='largest global review count')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    facade = HBnBFacade()
+    sizes = [n for n in (1000, 10000, 100000, 1000000) if n <= args.max]
+    print(f"{'reviews':>10} {'indexed (us)':>14} {'scan (us)':>12}")
+    for size in sizes:
+        place_id = populate(facade, size)
+        assert len(facade.get_reviews_by_place(place_id)) == REVIEWS_PER_PLACE
+        indexed = timeit.timeit(
+            lambda: facade.get_reviews_by_place(place_id),
+            number=args.repeat) / args.repeat
+        scan_repeat = max(1, args.repeat // 20)
+        scanned = timeit.timeit(
+            lambda: scan(facade, place_id),
+            number=scan_repeat) / scan_repeat
+        print(f"{size:>10} {indexed * 1e6:>14.1f} {scanned * 1e6:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark for place serialization.
+
+Serializes N places the way marshal_list_with() does (marshal() and
+json.dumps, as flask-restx's output_json) and through the generated
+serializer with each available backend.
+
+Usage (from part2/):
+    python -m benchmarks.bench_serialization [--places 100000]
+"""
+
+import argparse
+import json
+import time
+
+from flask_restx import marshal
+
+from app.api.v1 import serialization
+from app.api.v1.places import place_model
+from app.models.place import Place
+
+
+def make_places(count):
+    return [Place(title=f'Place {i}', description='A quiet room ' * 4,
+                  price=50 + i % 200, latitude=40 + (i % 1000) / 1000,
+                  longitude=-70 - (i % 1000) / 1000,
+                  owner_id=f'owner-{i % 1000}',
+                  amenity_ids=[f'amenity-{i % 7}', f'amenity-{i % 11}'])
+            for i in range(count)]
+
+
+def best(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    places = make_places(args.places)
+
+    def old():
+        return len(json.dumps(marshal(places, place_model)) + "\n")
+
+    def new():
+        return len(serialization.dumps_list(places, place_model))
+
+    results = {'marshal + json': best(old, args.repeat)}
+    for backend in ('json', 'orjson'):
+        if backend == 'orjson' and serialization.orjson is None:
+            continue
+        serialization.BACKEND = backend
+        serialization._serializers.clear()
+        results[f'generated ({backend})'] = best(new, args.repeat)
+
+    baseline = results['marshal + json'][0]
+    print(f"{args.places} places")
+    for name, (seconds, size) in results.items():
+        print(f"{name:<20} {seconds * 1000:8.1f} ms  "
+              f"{args.places / seconds:10.0f} places/s  "
+              f"{size / 1e6:6.1f} MB  x{baseline / seconds:.1f}")
+
+
+if __name__ == '__main__':
+    main()
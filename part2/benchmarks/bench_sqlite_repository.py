@@ -0,0 +1,115 @@
+"""
+Benchmark comparing the dict-backed and SQLite-backed repositories.
+
+For 10k/100k/1M reviews, each backend runs in its own process and reports
+load time, lookup latency by id and through the place_id index, and the
+resident memory the dataset added.
+
+Usage (from part2/):
+    python -m benchmarks.bench_sqlite_repository [--max 1000000]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from app.models.review import Review
+from app.persistence.repository import InMemoryRepository, SQLiteRepository
+
+SIZES = (10000, 100000, 1000000)
+LOOKUPS = 2000
+BATCH = 10000
+
+
+def rss_bytes():
+    """Current resident set size (Linux), 0 elsewhere"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return 0
+
+
+def make_review(i):
+    return Review(text=f"Review number {i}", rating=1 + i % 5,
+                  user_id=f"user-{i % 1000}", place_id=f"place-{i % 10000}")
+
+
+def run(backend, size, directory):
+    before = rss_bytes()
+    if backend == 'sqlite':
+        repo = SQLiteRepository(os.path.join(directory, 'bench.db'),
+                                model_class=Review,
+                                indexes=('place_id', 'user_id'))
+    else:
+        repo = InMemoryRepository(model_class=Review,
+                                  indexes=('place_id', 'user_id'))
+
+    ids = []
+    start = time.perf_counter()
+    for offset in range(0, size, BATCH):
+        batch = [make_review(i)
+                 for i in range(offset, min(size, offset + BATCH))]
+        ids.extend(review.id for review in batch[::50])
+        if backend == 'sqlite':
+            repo.add_many(batch)
+        else:
+            for review in batch:
+                repo.add(review)
+    load = time.perf_counter() - start
+    memory = rss_bytes() - before
+
+    rng = random.Random(0)
+    sample = [rng.choice(ids) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for obj_id in sample:
+        repo.get(obj_id)
+    get_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+    places = [f"place-{rng.randrange(10000)}" for _ in range(LOOKUPS // 10)]
+    start = time.perf_counter()
+    for place_id in places:
+        repo.get_all_by_attribute('place_id', place_id)
+    index_us = (time.perf_counter() - start) / len(places) * 1e6
+
+    return {'load': load, 'get_us': get_us, 'index_us': index_us,
+            'rss_mb': memory / 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max', type=int, default=1000000)
+    parser.add_argument('--run', nargs=2, metavar=('BACKEND', 'SIZE'),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        directory = tempfile.mkdtemp()
+        try:
+            print(json.dumps(run(args.run[0], int(args.run[1]), directory)))
+        finally:
+            shutil.rmtree(directory)
+        return
+
+    print(f"{'backend':>8} {'objects':>9} {'load (s)':>9} {'get (us)':>9} "
+          f"{'index (us)':>11} {'RSS (MB)':>9}")
+    for size in (n for n in SIZES if n <= args.max):
+        for backend in ('dict', 'sqlite'):
+            out = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_sqlite_repository',
+                 '--run', backend, str(size)],
+                check=True, capture_output=True, text=True).stdout
+            result = json.loads(out)
+            print(f"{backend:>8} {size:>9} {result['load']:>9.2f} "
+                  f"{result['get_us']:>9.1f} {result['index_us']:>11.1f} "
+                  f"{result['rss_mb']:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,9 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
     DEBUG = False
     SECRET_KEY = 'dev'
+    # Repository tracing: WARNING keeps it off, DEBUG/INFO turn it on
+    TRACE_LEVEL = os.getenv('HBNB_TRACE_LEVEL', 'WARNING')
+    TRACE_SAMPLE_RATE = float(os.getenv('HBNB_TRACE_SAMPLE_RATE', '1.0'))
 class DevelopmentConfig(Config):
     DEBUG = True
 
@@ -1,10 +1,13 @@
 from flask import Flask, redirect
 from app.api import api_v1_blueprint
+from app.persistence.tracing import configure_tracing
 from config import Config
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    configure_tracing(app.config['TRACE_LEVEL'],
+                      app.config['TRACE_SAMPLE_RATE'])
     
     # Register blueprint
     app.register_blueprint(api_v1_blueprint)
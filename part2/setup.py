@@ -15,4 +15,8 @@ setup(
         'flask',
         'flask-restx',
     ],
+    extras_require={
+        # Columnar place filtering (app/persistence/place_columns.py)
+        'columnar': ['numpy'],
+    },
 )
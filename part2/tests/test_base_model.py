@@ -0,0 +1,65 @@
+"""
+Test module for the slotted BaseModel.
+"""
+
+import pickle
+import unittest
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+
+class TestBaseModelSlots(unittest.TestCase):
+    """Test case for compact model instances"""
+
+    def setUp(self):
+        """Create a place to work with"""
+        self.place = Place(title="Cozy Apartment", description="A nice place",
+                           price=100, latitude=37.77, longitude=-122.41,
+                           owner_id="owner")
+
+    def test_no_instance_dict(self):
+        """Declared fields do not allocate a per-instance dict"""
+        self.assertEqual(getattr(self.place, '__dict__', {}), {})
+        self.assertIs(self.place.created_at, self.place.updated_at)
+
+    def test_to_dict(self):
+        """to_dict lists every field with formatted timestamps"""
+        data = self.place.to_dict()
+        self.assertEqual(data['__class__'], 'Place')
+        self.assertEqual(data['price'], 100.0)
+        self.assertEqual(data['created_at'], self.place.created_at.isoformat())
+        for field in ('id', 'title', 'description', 'latitude', 'longitude',
+                      'owner_id', 'amenity_ids', 'updated_at'):
+            self.assertIn(field, data)
+
+    def test_extra_attributes(self):
+        """Undeclared kwargs are still stored and serialized"""
+        user = User(first_name="Alice", last_name="Smith",
+                    email="alice@example.com", password="secret")
+        self.assertEqual(user.password, "secret")
+        self.assertEqual(user.to_dict()['password'], "secret")
+
+    def test_update_validates(self):
+        """update() still applies known fields and re-validates"""
+        review = Review(text="Great", rating=5, user_id="u", place_id="p")
+        review.update({'rating': 3, 'unknown': 1})
+        self.assertEqual(review.rating, 3)
+        self.assertFalse(hasattr(review, 'unknown'))
+        with self.assertRaises(ValueError):
+            review.update({'rating': 9})
+
+    def test_pickle_round_trip(self):
+        """Pickled models (journal, SQLite) restore every attribute"""
+        restored = pickle.loads(pickle.dumps(self.place))
+        self.assertEqual(restored.to_dict(), self.place.to_dict())
+
+    def test_unpickle_dict_state(self):
+        """State saved as a plain dict by the older models still loads"""
+        restored = Place.__new__(Place)
+        restored.__setstate__(dict(self.place._attributes()))
+        self.assertEqual(restored.to_dict(), self.place.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
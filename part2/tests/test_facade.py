@@ -0,0 +1,70 @@
+"""
+Test module for facade updates.
+"""
+
+import unittest
+import uuid
+from unittest import mock
+from app.services.facade import HBnBFacade, MAX_NEARBY_RADIUS_KM
+
+
+class TestFacadeUpdates(unittest.TestCase):
+    """Test case for updates that fail part way"""
+
+    def setUp(self):
+        """Create two users with distinct emails"""
+        self.facade = HBnBFacade()
+        tag = uuid.uuid4().hex
+        self.alice = self.facade.create_user({
+            'first_name': 'Alice', 'last_name': 'Smith',
+            'email': f'alice-{tag}@example.com'})
+        self.bob = self.facade.create_user({
+            'first_name': 'Bob', 'last_name': 'Jones',
+            'email': f'bob-{tag}@example.com'})
+
+    def test_duplicate_email_leaves_user_unchanged(self):
+        """A unique index failure must not leave the new email behind"""
+        old_email = self.alice.email
+        # As if Bob registered the email right after the facade's check
+        with mock.patch.object(self.facade, 'get_user_by_email',
+                               return_value=None):
+            with self.assertRaises(ValueError) as error:
+                self.facade.update_user(self.alice.id,
+                                        {'email': self.bob.email})
+        self.assertEqual(str(error.exception), "Email already registered")
+        self.assertEqual(self.facade.get_user(self.alice.id).email,
+                         old_email)
+        self.assertEqual(self.facade.get_user_by_email(old_email).id,
+                         self.alice.id)
+        self.assertEqual(self.facade.get_user_by_email(self.bob.email).id,
+                         self.bob.id)
+
+    def test_invalid_update_leaves_user_unchanged(self):
+        """Validation runs before anything is stored"""
+        with self.assertRaises(ValueError):
+            self.facade.update_user(self.alice.id, {'first_name': ''})
+        self.assertEqual(self.facade.get_user(self.alice.id).first_name,
+                         'Alice')
+
+    def test_update(self):
+        """A valid update is stored and returned"""
+        user = self.facade.update_user(self.alice.id, {'last_name': 'Brown'})
+        self.assertEqual(user.last_name, 'Brown')
+        self.assertEqual(self.facade.get_user(self.alice.id).last_name,
+                         'Brown')
+
+
+class TestFacadeNearby(unittest.TestCase):
+    """Test case for the nearby search bounds"""
+
+    def test_radius_capped(self):
+        """Radii past the measured range are refused"""
+        facade = HBnBFacade()
+        facade.get_places_nearby(48.85, 2.35, MAX_NEARBY_RADIUS_KM)
+        for radius_km in (0, MAX_NEARBY_RADIUS_KM + 0.1, 20000):
+            with self.assertRaises(ValueError):
+                facade.get_places_nearby(48.85, 2.35, radius_km)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Test module for the spatial grid index.
+"""
+
+import random
+import unittest
+from app.persistence.geo_index import GeoGridIndex, haversine_km
+
+
+class TestGeoGridIndex(unittest.TestCase):
+    """Test case for radius searches"""
+
+    def setUp(self):
+        """Index a few thousand random points, clustered and global"""
+        rng = random.Random(7)
+        self.points = {}
+        for i in range(1500):
+            self.points[f"near-{i}"] = (rng.uniform(48.5, 49.2),
+                                        rng.uniform(1.9, 2.8))
+        for i in range(1500):
+            self.points[f"far-{i}"] = (rng.uniform(-90, 90),
+                                       rng.uniform(-180, 180))
+        self.index = GeoGridIndex(cell_deg=0.1)
+        for place_id, (lat, lon) in self.points.items():
+            self.index.upsert(place_id, lat, lon)
+
+    def brute_force(self, lat, lon, radius_km):
+        hits = []
+        for place_id, (plat, plon) in self.points.items():
+            distance = haversine_km(lat, lon, plat, plon)
+            if distance <= radius_km:
+                hits.append((distance, place_id))
+        return [place_id for _, place_id in sorted(hits)]
+
+    def assert_search(self, lat, lon, radius_km):
+        expected = self.brute_force(lat, lon, radius_km)
+        total, page = self.index.nearby(lat, lon, radius_km,
+                                        limit=len(self.points))
+        self.assertEqual(total, len(expected))
+        self.assertEqual([place_id for place_id, _ in page], expected)
+
+    def test_haversine(self):
+        """Paris to London is about 344 km"""
+        self.assertAlmostEqual(
+            haversine_km(48.8566, 2.3522, 51.5074, -0.1278), 343.5, delta=1)
+
+    def test_radius_matches_brute_force(self):
+        """Results equal a full scan, sorted by distance"""
+        for radius_km in (1, 10, 50, 500, 5000, 25000):
+            self.assert_search(48.85, 2.35, radius_km)
+
+    def test_antimeridian_and_poles(self):
+        """Searches wrap around longitude +-180 and cover the poles"""
+        self.points['east'] = (0.0, 179.95)
+        self.points['west'] = (0.0, -179.95)
+        self.points['pole'] = (89.99, 45.0)
+        for place_id in ('east', 'west', 'pole'):
+            self.index.upsert(place_id, *self.points[place_id])
+        self.assert_search(0.0, 180.0, 20)
+        self.assert_search(89.9, -120.0, 50)
+
+    def test_pagination(self):
+        """limit/offset slice the distance-ordered results"""
+        total, everything = self.index.nearby(48.85, 2.35, 30, limit=1000)
+        _, page = self.index.nearby(48.85, 2.35, 30, limit=5, offset=10)
+        self.assertEqual(page, everything[10:15])
+        self.assertEqual(total, len(everything))
+
+    def test_update_and_remove(self):
+        """Moving or removing a place updates the index"""
+        self.index.upsert('mover', 10.0, 10.0)
+        self.assertEqual(self.index.nearby(10.0, 10.0, 1)[1][0][0], 'mover')
+        self.index.upsert('mover', -33.0, 151.0)
+        self.assertNotIn('mover',
+                         [p for p, _ in self.index.nearby(10.0, 10.0, 1)[1]])
+        self.assertEqual(self.index.nearby(-33.0, 151.0, 1)[1][0][0], 'mover')
+        self.index.remove('mover')
+        self.assertEqual(self.index.nearby(-33.0, 151.0, 1), (0, []))
+        self.assertEqual(len(self.index), len(self.points))
+
+    def test_cell_emptied_during_search(self):
+        """A cell emptied by a concurrent remove does not break a search"""
+        index = GeoGridIndex()
+        index.upsert('gone', 10.0, 10.05)
+        index.upsert('kept', 10.0, 9.95)
+        for n in range(10):
+            # Occupied cells elsewhere, so the search probes its own cells
+            index.upsert(f'far-{n}', -40.0, n * 1.0)
+
+        class RacingCells(dict):
+            # As if remove('gone') ran right after each membership test
+            def __contains__(self, cell):
+                found = dict.__contains__(self, cell)
+                if found and 'gone' in self[cell]:
+                    del self[cell]
+                return found
+
+        index._cells = RacingCells(index._cells)
+        found = [place_id for place_id, _ in index.nearby(10.0, 10.0, 10)[1]]
+        self.assertIn('kept', found)
+
+
+if __name__ == '__main__':
+    unittest.main()
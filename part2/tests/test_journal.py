@@ -0,0 +1,122 @@
+"""
+Test module for the journaled (durable) repository.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app.persistence.repository import DurableInMemoryRepository
+from app.models.user import User
+
+
+class TestDurableRepository(unittest.TestCase):
+    """Test case for journal replay and snapshots"""
+
+    def setUp(self):
+        """Create an empty data directory"""
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the data directory"""
+        shutil.rmtree(self.path)
+
+    def open_repo(self, **kwargs):
+        return DurableInMemoryRepository(
+            self.path, model_class=User, unique=('email',), **kwargs)
+
+    def make_user(self, i):
+        return User(first_name="User", last_name=str(i),
+                    email=f"user{i}@example.com")
+
+    def test_replay_log(self):
+        """Adds, updates and deletes survive a restart"""
+        repo = self.open_repo()
+        users = [self.make_user(i) for i in range(3)]
+        for user in users:
+            repo.add(user)
+        repo.update(users[0].id, {'email': 'changed@example.com'})
+        repo.delete(users[1].id)
+        repo.close()
+
+        repo = self.open_repo()
+        self.assertEqual([u.id for u in repo.get_all()],
+                         [users[0].id, users[2].id])
+        self.assertEqual(
+            repo.get_by_attribute('email', 'changed@example.com').id,
+            users[0].id)
+        self.assertIsNone(repo.get(users[1].id))
+        repo.close()
+
+    def test_replay_add_many(self):
+        """A batch written with add_many survives a restart"""
+        repo = self.open_repo()
+        users = [self.make_user(i) for i in range(5)]
+        repo.add_many(users)
+        repo.close()
+
+        repo = self.open_repo()
+        self.assertEqual([u.id for u in repo.get_all()],
+                         [u.id for u in users])
+        self.assertEqual(
+            repo.get_by_attribute('email', 'user3@example.com').id,
+            users[3].id)
+        repo.close()
+
+    def test_snapshot_and_log(self):
+        """Writes after a snapshot are replayed on top of it"""
+        repo = self.open_repo()
+        first = self.make_user(1)
+        repo.add(first)
+        repo.compact()
+        second = self.make_user(2)
+        repo.add(second)
+        repo.delete(first.id)
+        repo.close()
+
+        self.assertIn('snapshot', os.listdir(self.path))
+        repo = self.open_repo()
+        self.assertEqual([u.id for u in repo.get_all()], [second.id])
+        repo.close()
+
+    def test_torn_tail_is_ignored(self):
+        """A partially written frame at the end of the log is dropped"""
+        repo = self.open_repo()
+        user = self.make_user(1)
+        repo.add(user)
+        repo.close()
+        log = os.path.join(self.path, 'log.0')
+        with open(log, 'ab') as f:
+            f.write(b'\x40\x00\x00\x00garbage')
+
+        repo = self.open_repo()
+        self.assertEqual([u.id for u in repo.get_all()], [user.id])
+        repo.add(self.make_user(2))
+        repo.close()
+        repo = self.open_repo()
+        self.assertEqual(len(repo.get_all()), 2)
+        repo.close()
+
+    def test_background_compaction(self):
+        """Crossing compact_bytes snapshots the repository"""
+        repo = self.open_repo(compact_bytes=4096)
+        threads = [
+            threading.Thread(target=lambda n=n: [
+                repo.add(self.make_user(n * 100 + i)) for i in range(25)])
+            for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        repo.close()
+
+        self.assertIn('snapshot', os.listdir(self.path))
+        repo = self.open_repo()
+        self.assertEqual(len(repo.get_all()), 100)
+        repo.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Test module for the columnar place store.
+"""
+
+import math
+import random
+import unittest
+from app.models.place import Place
+from app.persistence.place_columns import PlaceColumns
+
+
+def make_place(rng):
+    return Place(title="Place", description="Somewhere", owner_id="owner",
+                 price=rng.randrange(0, 500),
+                 latitude=rng.uniform(-90, 90),
+                 longitude=rng.uniform(-180, 180))
+
+
+@unittest.skipUnless(PlaceColumns.available, "numpy is not installed")
+class TestPlaceColumns(unittest.TestCase):
+    """Test case for vectorized place filters"""
+
+    def setUp(self):
+        """Load a few hundred random places"""
+        rng = random.Random(42)
+        self.places = {p.id: p for p in (make_place(rng) for _ in range(300))}
+        self.columns = PlaceColumns(capacity=16)
+        self.columns.load(self.places.values())
+
+    def expected(self, predicate):
+        return sorted(p.id for p in self.places.values() if predicate(p))
+
+    def test_price_range(self):
+        """Price bounds are inclusive"""
+        self.assertEqual(
+            sorted(self.columns.query(min_price=100, max_price=200)),
+            self.expected(lambda p: 100 <= p.price <= 200))
+
+    def test_bbox(self):
+        """Bounding boxes use min_lon,min_lat,max_lon,max_lat"""
+        bbox = (-60, -30, 90, 45)
+        self.assertEqual(
+            sorted(self.columns.query(bbox=bbox)),
+            self.expected(lambda p: -30 <= p.latitude <= 45
+                          and -60 <= p.longitude <= 90))
+
+    def test_radius(self):
+        """Radius queries match points within the great-circle distance"""
+        place = next(iter(self.places.values()))
+        found = self.columns.query(
+            center=(place.latitude, place.longitude), radius_km=1)
+        self.assertIn(place.id, found)
+
+        def distance(p):
+            lat1, lon1 = math.radians(10), math.radians(20)
+            lat2, lon2 = math.radians(p.latitude), math.radians(p.longitude)
+            a = (math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1)
+                 * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+            return 2 * 6371.0088 * math.asin(math.sqrt(a))
+        self.assertEqual(
+            sorted(self.columns.query(center=(10, 20), radius_km=3000)),
+            self.expected(lambda p: distance(p) <= 3000))
+
+    def test_update_and_remove(self):
+        """upsert() refreshes a row and remove() keeps the rest addressable"""
+        ids = list(self.places)
+        moved = self.places[ids[0]]
+        moved.price = 10000
+        self.columns.upsert(moved)
+        self.assertEqual(self.columns.query(min_price=9999), [moved.id])
+
+        for place_id in ids[:150]:
+            self.columns.remove(place_id)
+            del self.places[place_id]
+        self.assertEqual(len(self.columns), 150)
+        self.assertEqual(sorted(self.columns.query(max_price=250)),
+                         self.expected(lambda p: p.price <= 250))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+"""
+Test module for InMemoryRepository secondary indexes.
+"""
+
+import logging
+import threading
+import unittest
+from app.persistence.repository import (
+    ConcurrentInMemoryRepository, DuplicateValueError, InMemoryRepository)
+from app.persistence.tracing import logger
+from app.models.user import User
+from app.models.review import Review
+
+
+class TestRepositoryIndexes(unittest.TestCase):
+    """Test case for indexed repository lookups"""
+
+    def setUp(self):
+        """Set up repositories with declared indexes"""
+        self.user_repo = InMemoryRepository(model_class=User,
+                                            unique=('email',))
+        self.review_repo = InMemoryRepository(
+            model_class=Review, indexes=('place_id', 'user_id'))
+        self.user = User(first_name="Alice", last_name="Smith",
+                         email="alice@example.com")
+        self.user_repo.add(self.user)
+
+    def test_unique_lookup(self):
+        """Indexed get_by_attribute returns the matching object"""
+        self.assertIs(
+            self.user_repo.get_by_attribute('email', 'alice@example.com'),
+            self.user)
+        self.assertIsNone(
+            self.user_repo.get_by_attribute('email', 'bob@example.com'))
+
+    def test_unique_violation(self):
+        """Adding a duplicate value to a unique index fails"""
+        duplicate = User(first_name="Other", last_name="Alice",
+                         email="alice@example.com")
+        with self.assertRaises(DuplicateValueError):
+            self.user_repo.add(duplicate)
+        self.assertIsNone(self.user_repo.get(duplicate.id))
+
+    def test_add_many(self):
+        """add_many stores and indexes every object"""
+        reviews = [Review(text="Fine", rating=4, place_id=f"place-{i % 2}",
+                          user_id=self.user.id) for i in range(4)]
+        self.review_repo.add_many(reviews)
+        self.assertEqual(self.review_repo.get_all(), reviews)
+        self.assertEqual(
+            self.review_repo.get_all_by_attribute('place_id', 'place-1'),
+            [reviews[1], reviews[3]])
+
+    def test_add_many_is_all_or_nothing(self):
+        """A duplicate anywhere in the batch adds none of it"""
+        fresh = User(first_name="Bob", last_name="B", email="bob@example.com")
+        clash = User(first_name="Eve", last_name="E",
+                     email="alice@example.com")
+        with self.assertRaises(DuplicateValueError):
+            self.user_repo.add_many([fresh, clash])
+        twins = [User(first_name="Twin", last_name=str(i),
+                      email="twin@example.com") for i in range(2)]
+        with self.assertRaises(DuplicateValueError):
+            self.user_repo.add_many(twins)
+        self.assertEqual(self.user_repo.get_all(), [self.user])
+
+    def test_update_reindexes(self):
+        """Updating an indexed attribute moves the object in the index"""
+        self.user_repo.update(self.user.id, {'email': 'alice@new.com'})
+        self.assertIsNone(
+            self.user_repo.get_by_attribute('email', 'alice@example.com'))
+        self.assertIs(
+            self.user_repo.get_by_attribute('email', 'alice@new.com'),
+            self.user)
+
+    def test_update_after_mutation(self):
+        """Objects mutated before update() are reindexed from old values"""
+        self.user.email = 'alice@mutated.com'
+        self.user_repo.update(self.user.id, {})
+        self.assertIsNone(
+            self.user_repo.get_by_attribute('email', 'alice@example.com'))
+        self.assertIs(
+            self.user_repo.get_by_attribute('email', 'alice@mutated.com'),
+            self.user)
+
+    def test_non_unique_index(self):
+        """Non-unique indexes return every match in insertion order"""
+        reviews = [
+            Review(text=f"Review {i}", rating=5, user_id=self.user.id,
+                   place_id='place-a' if i % 2 else 'place-b')
+            for i in range(4)
+        ]
+        for review in reviews:
+            self.review_repo.add(review)
+
+        place_a = self.review_repo.get_all_by_attribute('place_id', 'place-a')
+        self.assertEqual(place_a, [reviews[1], reviews[3]])
+
+        self.review_repo.delete(reviews[1].id)
+        self.assertEqual(
+            self.review_repo.get_all_by_attribute('place_id', 'place-a'),
+            [reviews[3]])
+        self.assertEqual(
+            len(self.review_repo.get_all_by_attribute('user_id',
+                                                      self.user.id)),
+            3)
+
+    def test_unindexed_attribute(self):
+        """Attributes without an index fall back to a scan"""
+        self.assertIs(
+            self.user_repo.get_by_attribute('first_name', 'Alice'), self.user)
+
+
+class TestConcurrentRepository(unittest.TestCase):
+    """Test case for the lock-striped repository"""
+
+    def test_racing_unique_inserts(self):
+        """Only one of many concurrent inserts of the same email wins"""
+        repo = ConcurrentInMemoryRepository(model_class=User,
+                                            unique=('email',))
+        users = [User(first_name="Racer", last_name=str(i),
+                      email="race@example.com") for i in range(16)]
+        barrier = threading.Barrier(len(users))
+        rejected = []
+
+        def insert(user):
+            barrier.wait()
+            try:
+                repo.add(user)
+            except DuplicateValueError:
+                rejected.append(user)
+
+        threads = [threading.Thread(target=insert, args=(user,))
+                   for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(rejected), len(users) - 1)
+        self.assertEqual(len(repo.get_all()), 1)
+        self.assertIsNotNone(
+            repo.get_by_attribute('email', 'race@example.com'))
+
+    def test_racing_add_many(self):
+        """Concurrent batches sharing an email: exactly one batch wins"""
+        repo = ConcurrentInMemoryRepository(model_class=User,
+                                            unique=('email',))
+        batches = [[User(first_name="Batch", last_name=f"{i}-{j}",
+                         email=f"{'shared' if j == 0 else i}-{j}@example.com")
+                    for j in range(8)] for i in range(8)]
+        barrier = threading.Barrier(len(batches))
+        rejected = []
+
+        def insert(batch):
+            barrier.wait()
+            try:
+                repo.add_many(batch)
+            except DuplicateValueError:
+                rejected.append(batch)
+
+        threads = [threading.Thread(target=insert, args=(batch,))
+                   for batch in batches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(rejected), len(batches) - 1)
+        self.assertEqual(len(repo.get_all()), 8)
+
+    def test_concurrent_updates_keep_index_consistent(self):
+        """Parallel writers leave every index entry pointing at live data"""
+        repo = ConcurrentInMemoryRepository(
+            model_class=Review, indexes=('place_id',), stripes=4)
+        reviews = [Review(text="Ok", rating=3, user_id='u',
+                          place_id=f"place-{i % 4}") for i in range(200)]
+        for review in reviews:
+            repo.add(review)
+
+        def churn(offset):
+            for review in reviews[offset::4]:
+                repo.update(review.id, {'place_id': 'moved'})
+                if offset % 2:
+                    repo.delete(review.id)
+
+        threads = [threading.Thread(target=churn, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            len(repo.get_all_by_attribute('place_id', 'moved')), 100)
+        for n in range(4):
+            self.assertEqual(
+                repo.get_all_by_attribute('place_id', f"place-{n}"), [])
+
+
+class TestRepositoryTracing(unittest.TestCase):
+    """Test case for repository tracing"""
+
+    def setUp(self):
+        """Set up a repository with one stored user"""
+        self.repo = InMemoryRepository(model_class=User)
+        self.user = User(first_name="Alice", last_name="Smith",
+                         email="alice@example.com")
+        self.repo.add(self.user)
+        self.level = logger.level
+
+    def tearDown(self):
+        """Restore the tracing level"""
+        logger.setLevel(self.level)
+
+    def test_disabled_does_not_format(self):
+        """Objects are not formatted when tracing is disabled"""
+        logger.setLevel(logging.WARNING)
+        formatted = []
+        original = User.__str__
+        User.__str__ = lambda obj: formatted.append(obj) or original(obj)
+        try:
+            self.repo.get(self.user.id)
+            self.repo.get_all()
+            self.repo.update(self.user.id, {'first_name': 'Alicia'})
+        finally:
+            User.__str__ = original
+        self.assertEqual(formatted, [])
+
+    def test_enabled_emits_records(self):
+        """Operations emit leveled records with structured fields"""
+        with self.assertLogs(logger, level=logging.DEBUG) as captured:
+            self.repo.get(self.user.id)
+            self.repo.delete(self.user.id)
+        get_record, delete_record = captured.records
+        self.assertEqual(get_record.levelno, logging.DEBUG)
+        self.assertEqual(get_record.operation, 'get')
+        self.assertEqual(delete_record.levelno, logging.INFO)
+        self.assertEqual(delete_record.object_id, self.user.id)
+
+
+if __name__ == '__main__':
+    unittest.main()
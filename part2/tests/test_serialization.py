@@ -0,0 +1,81 @@
+"""
+Test module for the generated API serializers.
+"""
+
+import json
+import unittest
+from flask_restx import marshal
+from app.api.v1 import serialization
+from app.api.v1.places import place_model
+from app.api.v1.reviews import review_model
+from app.api.v1.users import user_model
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+
+
+class TestSerialization(unittest.TestCase):
+    """Test case for serializers against marshal()"""
+
+    def setUp(self):
+        self.backend = serialization.BACKEND
+        self.place = Place(title='Café "Nord"', description='Quiet',
+                           price=90, latitude=48.85, longitude=2,
+                           owner_id='owner-1', amenity_ids=['a1', 'a2'])
+
+    def tearDown(self):
+        serialization.BACKEND = self.backend
+        serialization._serializers.clear()
+
+    def backends(self):
+        """Yield each available backend, with fresh serializers"""
+        for backend in ('json', 'orjson'):
+            if backend == 'orjson' and serialization.orjson is None:
+                continue
+            serialization.BACKEND = backend
+            serialization._serializers.clear()
+            with self.subTest(backend=backend):
+                yield backend
+
+    def expected(self, obj, model):
+        return json.loads(json.dumps(marshal(obj, model)))
+
+    def test_matches_marshal(self):
+        """Output decodes to what marshal() produces"""
+        user = User(first_name='Ada', last_name='L', email='ada@example.com')
+        review = Review(text='Great', rating=5, user_id=user.id,
+                        place_id=self.place.id)
+        for _ in self.backends():
+            for obj, model in ((self.place, place_model), (user, user_model),
+                               (review, review_model)):
+                self.assertEqual(
+                    json.loads(serialization.dumps(obj, model)),
+                    self.expected(obj, model))
+
+    def test_coerces_like_marshal(self):
+        """Integer prices become floats, non-string ids strings"""
+        self.place.owner_id = 42
+        for _ in self.backends():
+            out = json.loads(serialization.dumps(self.place, place_model))
+            self.assertEqual(out['price'], 90.0)
+            self.assertIsInstance(out['price'], float)
+            self.assertEqual(out['owner_id'], '42')
+
+    def test_missing_attribute_is_null(self):
+        """Unset fields fall back to marshal() and come out as null"""
+        del self.place.description
+        for _ in self.backends():
+            out = json.loads(serialization.dumps(self.place, place_model))
+            self.assertIsNone(out['description'])
+
+    def test_dumps_list(self):
+        """Lists and other iterables encode as JSON arrays"""
+        for _ in self.backends():
+            out = serialization.dumps_list(iter([self.place]), place_model)
+            self.assertEqual(json.loads(out),
+                             [self.expected(self.place, place_model)])
+            self.assertEqual(serialization.dumps_list([], place_model), b'[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
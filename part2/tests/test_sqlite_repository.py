@@ -0,0 +1,108 @@
+"""
+Test module for SQLiteRepository.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app.persistence.repository import DuplicateValueError, SQLiteRepository
+from app.models.review import Review
+from app.models.user import User
+
+
+class TestSQLiteRepository(unittest.TestCase):
+    """Test case for the SQLite-backed repository"""
+
+    def setUp(self):
+        """Open repositories on a fresh database file"""
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'hbnb.db')
+        self.user_repo = SQLiteRepository(
+            self.path, model_class=User, unique=('email',))
+        self.review_repo = SQLiteRepository(
+            self.path, model_class=Review, indexes=('place_id', 'user_id'))
+        self.user = User(first_name="Alice", last_name="Smith",
+                         email="alice@example.com")
+        self.user_repo.add(self.user)
+
+    def tearDown(self):
+        """Close connections and remove the database"""
+        self.user_repo.close()
+        self.review_repo.close()
+        shutil.rmtree(self.dir)
+
+    def test_crud(self):
+        """Objects round-trip through add/get/update/delete"""
+        stored = self.user_repo.get(self.user.id)
+        self.assertEqual(stored.to_dict(), self.user.to_dict())
+
+        self.user_repo.update(self.user.id, {'first_name': 'Alicia'})
+        self.assertEqual(self.user_repo.get(self.user.id).first_name, 'Alicia')
+
+        self.user_repo.delete(self.user.id)
+        self.assertIsNone(self.user_repo.get(self.user.id))
+        with self.assertRaises(ValueError):
+            self.user_repo.delete(self.user.id)
+
+    def test_unique_index(self):
+        """Unique columns reject duplicates on insert and update"""
+        with self.assertRaises(DuplicateValueError):
+            self.user_repo.add(User(first_name="Other", last_name="Alice",
+                                    email="alice@example.com"))
+        bob = User(first_name="Bob", last_name="Smith",
+                   email="bob@example.com")
+        self.user_repo.add(bob)
+        with self.assertRaises(DuplicateValueError):
+            self.user_repo.update(bob.id, {'email': 'alice@example.com'})
+        self.assertEqual(
+            self.user_repo.get_by_attribute('email', 'bob@example.com').id,
+            bob.id)
+
+    def test_indexed_lookup_and_bulk_insert(self):
+        """add_many rows are found through the SQL indexes in order"""
+        reviews = [Review(text=f"Review {i}", rating=4, user_id=self.user.id,
+                          place_id=f"place-{i % 3}") for i in range(9)]
+        self.review_repo.add_many(reviews)
+        found = self.review_repo.get_all_by_attribute('place_id', 'place-1')
+        self.assertEqual([r.id for r in found],
+                         [r.id for r in reviews if r.place_id == 'place-1'])
+        self.assertEqual(
+            len(self.review_repo.get_all_by_attribute('user_id',
+                                                      self.user.id)),
+            9)
+
+    def test_thread_connections(self):
+        """Each thread writes through its own connection"""
+        def insert(n):
+            for i in range(20):
+                self.review_repo.add(Review(text="Ok", rating=3, user_id='u',
+                                            place_id=f"thread-{n}"))
+
+        threads = [threading.Thread(target=insert, args=(n,))
+                   for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.review_repo.get_all()), 80)
+        # The four worker connections closed when their threads exited
+        self.assertEqual(len(self.review_repo._connections), 1)
+
+    def test_connections_bounded(self):
+        """Short-lived threads do not leave connections open"""
+        def lookup():
+            self.user_repo.get(self.user.id)
+
+        for _ in range(200):
+            thread = threading.Thread(target=lookup)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(self.user_repo._connections), 1)
+        self.assertEqual(self.user_repo.get(self.user.id).email,
+                         self.user.email)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,34 +3,51 @@
 from flask import Flask, make_response, jsonify
 from models import storage
 from api.v1.views import app_views
+from api.v1 import query_budget, response_cache
 from os import getenv
 from flask_cors import CORS
 from flasgger import Swagger
 
-app = Flask(__name__)
-app.register_blueprint(app_views)
-cors = CORS(app, resources={r"/api/v1/*": {"origins": "*"}})
 
-app.config['SWAGGER'] = {
-    'title': 'AirBnB clone Restful API',
-    'uiversion': 3,
-    'specs_route': '/apidocs/'
-}
-swagger = Swagger(app)
-
-
-@app.teardown_appcontext
 def close_db(error):
     """Close database"""
     storage.close()
 
 
-@app.errorhandler(404)
 def not_found(error):
     """404 Error handler"""
     return make_response(jsonify({'error': "Not found"}), 404)
 
 
+def create_app():
+    """
+    Build the Flask application.
+    Safe to call before gunicorn forks (preload_app): the only connection
+    opened by then is the one models used to create the tables, and
+    gunicorn_config.py has every worker drop it with
+    storage.dispose(close=False) so workers open their own.
+    """
+    app = Flask(__name__)
+    app.register_blueprint(app_views)
+    CORS(app, resources={r"/api/v1/*": {"origins": "*"}})
+
+    app.config['SWAGGER'] = {
+        'title': 'AirBnB clone Restful API',
+        'uiversion': 3,
+        'specs_route': '/apidocs/'
+    }
+    Swagger(app)
+
+    query_budget.init_app(app)
+    response_cache.init_app(app)
+    app.teardown_appcontext(close_db)
+    app.register_error_handler(404, not_found)
+    return app
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     host = getenv('HBNB_API_HOST', '0.0.0.0')
     port = getenv('HBNB_API_PORT', '5000')
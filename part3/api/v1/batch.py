@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+"""Request and response helpers for the batch write endpoints"""
+import json
+from flask import Response, abort, request
+from sqlalchemy.types import Float, Integer, String
+from models.serializer import dumps
+
+# Items accepted in one batch request
+MAX_BATCH = 1000
+
+# Range of the 32-bit INT columns Integer maps to
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+def read_batch():
+    """
+    Return the JSON array sent as the request body, or abort 400 when
+    the body is not one or holds more than MAX_BATCH items
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        abort(400, description="Not a JSON array")
+    if len(items) > MAX_BATCH:
+        abort(400, description=f"At most {MAX_BATCH} items per batch")
+    return items
+
+
+def invalid_value(cls, values):
+    """
+    Check values against the type, length and nullability of the cls
+    columns they name, so that one bad item is reported on its own
+    instead of failing the whole executemany. Keys that are not
+    columns are left to the caller. Returns the first problem as a
+    message, or None.
+    """
+    columns = cls.__table__.columns
+    for key, value in values.items():
+        column = columns.get(key)
+        if column is None:
+            continue
+        if value is None:
+            if not column.nullable:
+                return f"Invalid {key}: may not be null"
+            continue
+        kind = column.type
+        if isinstance(kind, String):
+            if not isinstance(value, str):
+                return f"Invalid {key}: expected a string"
+            if kind.length is not None and len(value) > kind.length:
+                return f"Invalid {key}: longer than {kind.length} characters"
+        elif isinstance(kind, Integer):
+            if (not isinstance(value, int) or isinstance(value, bool)
+                    or not INT_MIN <= value <= INT_MAX):
+                return f"Invalid {key}: expected an integer"
+        elif isinstance(kind, Float):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return f"Invalid {key}: expected a number"
+    return None
+
+
+def batch_response(results, key, success):
+    """
+    Respond with one result per request item, in request order:
+    {"index": i, "status": <code>, key: <object>} when it went through,
+    {"index": i, "status": <code>, "error": <message>} when it did not.
+    results is a list of (status, object or message) pairs, objects may
+    be None. The response status is success if every item got it, else
+    207 Multi-Status.
+    """
+    parts = []
+    for index, (status, value) in enumerate(results):
+        head = f'{{"index":{index},"status":{status},'.encode()
+        if value is None:
+            parts.append(head[:-1] + b'}')
+        elif isinstance(value, str):
+            parts.append(head + b'"error":' + json.dumps(value).encode() +
+                         b'}')
+        else:
+            parts.append(head + json.dumps(key).encode() + b':' +
+                         dumps(value) + b'}')
+    ok = all(status == success for status, _ in results)
+    return Response(b'[' + b','.join(parts) + b']',
+                    status=success if ok else 207,
+                    mimetype='application/json')
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""Keyset pagination and streaming helpers for list endpoints"""
+import base64
+import binascii
+from datetime import datetime
+from flask import Response, abort, request, stream_with_context, url_for
+from models import storage
+from models.serializer import public_columns, row_serializer
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+NDJSON = 'application/x-ndjson'
+# Objects serialized per chunk written to the client
+STREAM_CHUNK = 500
+
+
+def encode_cursor(after):
+    """Turn a (created_at, id) pair into an opaque URL-safe cursor"""
+    created_at, obj_id = after
+    raw = f"{created_at.isoformat()}|{obj_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Turn a cursor back into a (created_at, id) pair, or abort 400"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, obj_id = raw.decode().split('|', 1)
+        return datetime.fromisoformat(created_at), obj_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        abort(400, description="Invalid cursor")
+
+
+def paginate(cls, **filters):
+    """
+    Respond with one page of cls objects matching filters.
+    Reads ?limit= (default DEFAULT_LIMIT, at most MAX_LIMIT) and ?after=
+    from the request. The body stays a JSON array; when more rows follow,
+    the next page is advertised in a Link header (rel="next") and its
+    cursor in X-Next-Cursor. Only public_columns(cls) are selected, as
+    plain rows: listings never build or track ORM objects.
+    With "Accept: application/x-ndjson" (or ?stream=1 for a JSON array)
+    the whole collection after the cursor is streamed instead.
+    """
+    ndjson = request.accept_mimetypes.best_match(
+        ['application/json', NDJSON]) == NDJSON
+    if ndjson or request.args.get('stream') in ('1', 'true'):
+        after = request.args.get('after')
+        return stream(cls, ndjson, after and decode_cursor(after), **filters)
+
+    limit = request.args.get('limit', DEFAULT_LIMIT, type=int)
+    if not 1 <= limit <= MAX_LIMIT:
+        abort(400, description=f"limit must be between 1 and {MAX_LIMIT}")
+    after = request.args.get('after')
+    if after is not None:
+        after = decode_cursor(after)
+
+    columns = public_columns(cls)
+    rows, next_after = storage.page(cls, limit, after=after,
+                                    columns=columns, **filters)
+    dumps = row_serializer(cls, columns)
+    response = Response(b'[' + b','.join(map(dumps, rows)) + b']',
+                        mimetype='application/json')
+    if next_after is not None:
+        cursor = encode_cursor(next_after)
+        args = dict(request.view_args, limit=limit, after=cursor)
+        next_url = url_for(request.endpoint, _external=True, **args)
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+        response.headers['X-Next-Cursor'] = cursor
+    return response
+
+
+def stream(cls, ndjson, after=None, **filters):
+    """
+    Stream cls objects as NDJSON (one object per line) or as a JSON
+    array, serializing STREAM_CHUNK objects per write so neither the
+    rows nor the body are ever held in full.
+    """
+    columns = public_columns(cls)
+    dumps = row_serializer(cls, columns)
+
+    def generate():
+        chunk = []
+        first = True
+        if not ndjson:
+            yield b'['
+        for row in storage.iterate(cls, after=after, batch_size=STREAM_CHUNK,
+                                   columns=columns, **filters):
+            if ndjson:
+                chunk.append(dumps(row) + b'\n')
+            else:
+                chunk.append((b'' if first else b',') + dumps(row))
+                first = False
+            if len(chunk) >= STREAM_CHUNK:
+                yield b''.join(chunk)
+                chunk = []
+        yield b''.join(chunk)
+        if not ndjson:
+            yield b']'
+
+    return Response(stream_with_context(generate()),
+                    mimetype=NDJSON if ndjson else 'application/json')
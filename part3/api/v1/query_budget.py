@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Per-request SQL statement counting against per-endpoint budgets"""
+import logging
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """An endpoint issued more SQL statements than its budget"""
+
+
+def query_budget(limit):
+    """Declare how many SQL statements a view may issue per request"""
+    def decorator(view):
+        view.query_budget = limit
+        return view
+    return decorator
+
+
+def count_statement(conn, cursor, statement, parameters, context,
+                    executemany):
+    """Count each statement issued while handling a request"""
+    if has_request_context():
+        g.sql_statements = g.get('sql_statements', 0) + 1
+
+
+def check_budget(response):
+    """
+    Compare the request's statement count with its view's budget.
+    Over budget, log a warning, or raise QueryBudgetExceeded when the
+    app sets QUERY_BUDGET_STRICT (the test suite does).
+    """
+    view = current_app.view_functions.get(request.endpoint)
+    limit = getattr(view, 'query_budget', None)
+    used = g.get('sql_statements', 0)
+    if limit is not None and used > limit:
+        message = (f"{request.endpoint} issued {used} SQL statements, "
+                   f"budget is {limit}")
+        if current_app.config.get('QUERY_BUDGET_STRICT'):
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+    return response
+
+
+def init_app(app):
+    """Start counting statements and checking budgets for app"""
+    if not event.contains(Engine, 'before_cursor_execute', count_statement):
+        event.listen(Engine, 'before_cursor_execute', count_statement)
+    app.after_request(check_budget)
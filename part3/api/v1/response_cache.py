@@ -0,0 +1,212 @@
+#!/usr/bin/python3
+"""
+Read-through cache for GET responses, invalidated by commits.
+
+Views opt in with @cached(Model, ...), naming the models their output
+depends on. A response is stored under its path, query string and Accept
+header plus the current version of each of those models; every commit
+that writes a model bumps its version, so older entries are simply never
+read again and expire on their own.
+
+HBNB_RESPONSE_CACHE selects the backend: unset or "off" disables the
+cache, "lru" keeps entries in this process, and a redis:// URL shares
+entries and versions between workers. HBNB_RESPONSE_CACHE_TTL (seconds,
+default 60) bounds how long an entry lives.
+
+"lru" keeps the versions in this process too, so a commit in one worker
+would not retire the entries of the others: init_app() refuses it when
+HBNB_WORKERS (set by gunicorn_config.py) says more than one process
+serves the app.
+"""
+import pickle
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from os import getenv
+from flask import Response, current_app, make_response, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Caches of every app, bumped by the session listeners below
+_caches = weakref.WeakSet()
+
+
+class LRUBackend:
+    """In-process backend: bounded LRU of entries, unbounded versions"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def versions(self, names):
+        return [self._versions.get(name, 0) for name in names]
+
+    def bump(self, names):
+        with self._lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+
+class RedisBackend:
+    """Shared backend: any client with Redis' get/set/mget/incr calls"""
+
+    def __init__(self, client, prefix='hbnb:cache:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url):
+        import redis
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        return None if value is None else pickle.loads(value)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, pickle.dumps(value),
+                        ex=max(1, int(ttl)))
+
+    def versions(self, names):
+        values = self.client.mget([self.prefix + 'v:' + n for n in names])
+        return [int(v or 0) for v in values]
+
+    def bump(self, names):
+        for name in names:
+            self.client.incr(self.prefix + 'v:' + name)
+
+
+class ResponseCache:
+    """Response cache bound to one backend"""
+
+    def __init__(self, backend, ttl=60):
+        self.backend = backend
+        self.ttl = ttl
+
+    def key(self, names):
+        versions = ','.join(f"{name}={version}" for name, version in
+                            zip(names, self.backend.versions(names)))
+        accept = request.headers.get('Accept', '')
+        return f"{versions}|{request.full_path}|{accept}"
+
+
+def cached(*models):
+    """Serve a GET view from the response cache while models are unchanged"""
+    names = tuple(sorted(model.__name__ for model in models))
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = current_app.extensions.get('response_cache')
+            if cache is None or request.method != 'GET':
+                return view(*args, **kwargs)
+            key = cache.key(names)
+            hit = cache.backend.get(key)
+            if hit is not None:
+                body, mimetype, headers = hit
+                response = Response(body, mimetype=mimetype, headers=headers)
+                response.headers['X-Cache'] = 'HIT'
+                return response
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                headers = [(k, v) for k, v in response.headers
+                           if k in ('Link', 'X-Next-Cursor')]
+                cache.backend.set(
+                    key, (response.get_data(), response.mimetype, headers),
+                    cache.ttl)
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+
+def collect_written(session, flush_context):
+    """Remember which models this flush wrote"""
+    written = session.info.setdefault('written_models', set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        written.add(type(obj).__name__)
+
+
+def collect_bulk(context):
+    """Bulk query writes bypass the flush"""
+    session = context.session
+    session.info.setdefault('written_models', set()).add(
+        context.mapper.class_.__name__)
+
+
+def collect_statement(orm_execute_state):
+    """So do ORM INSERT/UPDATE/DELETE statements run with execute()"""
+    state = orm_execute_state
+    if (state.is_insert or state.is_update or state.is_delete) \
+            and state.bind_mapper:
+        state.session.info.setdefault('written_models', set()).add(
+            state.bind_mapper.class_.__name__)
+
+
+def bump_written(session):
+    """After a commit, retire cached responses built from written models"""
+    written = session.info.pop('written_models', None)
+    if written:
+        for cache in _caches:
+            cache.backend.bump(sorted(written))
+
+
+def discard_written(session):
+    """A rolled back transaction wrote nothing"""
+    session.info.pop('written_models', None)
+
+
+def init_app(app, backend=None):
+    """
+    Attach a response cache to app. backend overrides the one chosen by
+    HBNB_RESPONSE_CACHE (e.g. a stand-in for a shared store in tests).
+    """
+    if backend is None:
+        setting = getenv('HBNB_RESPONSE_CACHE', 'off')
+        if setting == 'lru':
+            workers = int(getenv('HBNB_WORKERS') or 1)
+            if workers > 1:
+                raise RuntimeError(
+                    f"HBNB_RESPONSE_CACHE=lru is per process and would "
+                    f"serve stale responses with {workers} workers; use a "
+                    f"redis:// URL")
+            backend = LRUBackend()
+        elif setting.startswith('redis://'):
+            backend = RedisBackend.from_url(setting)
+        else:
+            app.extensions.pop('response_cache', None)
+            return None
+    cache = ResponseCache(backend,
+                          float(getenv('HBNB_RESPONSE_CACHE_TTL') or 60))
+    app.extensions['response_cache'] = cache
+    _caches.add(cache)
+    if not event.contains(Session, 'after_commit', bump_written):
+        event.listen(Session, 'after_flush', collect_written)
+        event.listen(Session, 'after_bulk_delete', collect_bulk)
+        event.listen(Session, 'after_bulk_update', collect_bulk)
+        event.listen(Session, 'do_orm_execute', collect_statement)
+        event.listen(Session, 'after_commit', bump_written)
+        event.listen(Session, 'after_rollback', discard_written)
+    return cache
@@ -0,0 +1,13 @@
+#!/usr/bin/python3
+"""JSON responses built with the generated model serializers"""
+from flask import Response
+from models.serializer import dumps, dumps_list
+
+
+def json_response(obj, status=200):
+    """Respond with a model object, or a list of them, as JSON"""
+    if isinstance(obj, (list, tuple)):
+        body = dumps_list(obj)
+    else:
+        body = dumps(obj)
+    return Response(body, status=status, mimetype='application/json')
@@ -1,27 +1,32 @@
 #!/usr/bin/python3
 """Routes for Amenity objects"""
 from api.v1.views import app_views
+from api.v1.query_budget import query_budget
+from api.v1.response_cache import cached
+from api.v1.pagination import paginate
+from api.v1.serialization import json_response
 from flask import jsonify, abort, request, current_app as app
 from models import storage
 from models.amenity import Amenity
 
 
 @app_views.route('/amenities', methods=['GET'], strict_slashes=False)
+@query_budget(1)
+@cached(Amenity)
 def get_amenities():
-    """Retrieve all amenities"""
-    amenities = [amenity.to_dict()
-                 for amenity in storage.all(Amenity).values()]
-    return jsonify(amenities)
+    """Retrieve amenities, one page at a time"""
+    return paginate(Amenity)
 
 
 @app_views.route('/amenities/<amenity_id>',
                  methods=['GET'], strict_slashes=False)
+@cached(Amenity)
 def get_amenity(amenity_id):
     """Retrieve an amenity by ID"""
     amenity = storage.get(Amenity, amenity_id)
     if not amenity:
         abort(404)
-    return jsonify(amenity.to_dict())
+    return json_response(amenity)
 
 
 @app_views.route('/amenities/<amenity_id>',
@@ -51,7 +56,7 @@ def create_amenity():
     amenity = Amenity(**amenity_data)
     storage.new(amenity)
     amenity.save()
-    return jsonify(amenity.to_dict()), 201
+    return json_response(amenity, 201)
 
 
 @app_views.route('/amenities/<amenity_id>',
@@ -69,4 +74,4 @@ def update_amenity(amenity_id):
         if key not in ["id", "created_at", "updated_at"]:
             setattr(amenity, key, value)
     storage.save()
-    return jsonify(amenity.to_dict())
+    return json_response(amenity)
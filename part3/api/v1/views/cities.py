@@ -1,10 +1,14 @@
 #!/usr/bin/python3
 """Cities API views"""
 from api.v1.views import app_views
+from api.v1.query_budget import query_budget
+from api.v1.response_cache import cached
+from api.v1.serialization import json_response
 from flask import jsonify, request, abort
 from models import storage
 from models.state import State
 from models.city import City
+from sqlalchemy.orm import joinedload
 
 
 @app_views.route('/states/<state_id>/cities',
@@ -25,27 +29,29 @@ def create_city(state_id):
     city.state_id = state_id
     storage.new(city)
     storage.save()
-    return jsonify(city.to_dict()), 201
+    return json_response(city, 201)
 
 
 @app_views.route('/states/<state_id>/cities',
                  methods=['GET'], strict_slashes=False)
+@query_budget(1)
+@cached(State, City)
 def get_cities(state_id):
     """Retrieve all cities in a state"""
-    state = storage.get(State, state_id)
+    state = storage.get(State, state_id, options=[joinedload(State.cities)])
     if not state:
         abort(404)
-    cities = [city.to_dict() for city in state.cities]
-    return jsonify(cities)
+    return json_response(state.cities)
 
 
 @app_views.route('/cities/<city_id>', methods=['GET'], strict_slashes=False)
+@cached(City)
 def get_city(city_id):
     """Get city by id"""
     city = storage.get(City, city_id)
     if not city:
         abort(404)
-    return jsonify(city.to_dict())
+    return json_response(city)
 
 
 @app_views.route('/cities/<city_id>', methods=['DELETE'], strict_slashes=False)
@@ -76,4 +82,4 @@ def update_city(city_id):
         if key not in ignore:
             setattr(city, key, value)
     storage.save()
-    return jsonify(city.to_dict())
+    return json_response(city)
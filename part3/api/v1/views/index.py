@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 """Index view for API"""
 from api.v1.views import app_views
+from api.v1.query_budget import query_budget
 from flask import jsonify
 from models import storage
 
@@ -12,13 +13,21 @@ def status():
 
 
 @app_views.route('/stats', methods=['GET'], strict_slashes=False)
+@query_budget(1)
 def stats():
     """Get counts of all objects"""
+    counts = storage.count_all()
     return jsonify({
-        "amenities": storage.count("Amenity"),
-        "cities": storage.count("City"),
-        "places": storage.count("Place"),
-        "reviews": storage.count("Review"),
-        "states": storage.count("State"),
-        "users": storage.count("User")
+        "amenities": counts["Amenity"],
+        "cities": counts["City"],
+        "places": counts["Place"],
+        "reviews": counts["Review"],
+        "states": counts["State"],
+        "users": counts["User"]
     })
+
+
+@app_views.route('/stats/pool', methods=['GET'], strict_slashes=False)
+def pool_stats():
+    """Get database connection pool statistics for this worker"""
+    return jsonify(storage.pool_stats())
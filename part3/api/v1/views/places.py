@@ -1,32 +1,69 @@
 #!/usr/bin/python3
 """Places API views"""
 from api.v1.views import app_views
+from api.v1.batch import batch_response, invalid_value, read_batch
+from api.v1.query_budget import query_budget
+from api.v1.response_cache import cached
+from api.v1.pagination import paginate
+from api.v1.serialization import json_response
+from datetime import datetime
 from flask import jsonify, request, abort
 from models import storage
+from models.serializer import public_columns
 from models.city import City
 from models.user import User
 from models.place import Place
-from models.state import State
 from models.amenity import Amenity
 
 
 @app_views.route('/cities/<city_id>/places',
                  methods=['GET'], strict_slashes=False)
+@query_budget(2)
+@cached(City, Place)
 def get_places(city_id):
-    """Get all places of a city"""
+    """Get the places of a city, one page at a time"""
     city = storage.get(City, city_id)
     if not city:
         abort(404)
-    return jsonify([place.to_dict() for place in city.places])
+    return paginate(Place, city_id=city_id)
+
+
+@app_views.route('/places/nearby', methods=['GET'], strict_slashes=False)
+@query_budget(2)
+@cached(Place)
+def get_places_nearby():
+    """Get places within radius_km of lat/lon, nearest first"""
+    lat = request.args.get('lat', type=float)
+    lon = request.args.get('lon', type=float)
+    radius_km = request.args.get('radius_km', type=float)
+    limit = request.args.get('limit', 20, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    if lat is None or lon is None or radius_km is None:
+        abort(400, description="Missing lat, lon or radius_km")
+    if not -90 <= lat <= 90 or not -180 <= lon <= 180 or radius_km <= 0:
+        abort(400, description="Invalid lat, lon or radius_km")
+    if not 1 <= limit <= 100 or offset < 0:
+        abort(400, description="Invalid limit or offset")
+
+    total, hits = storage.places_nearby(lat, lon, radius_km,
+                                        limit=limit, offset=offset)
+    return jsonify({
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "results": [{"distance_km": distance, "place": place.to_dict()}
+                    for place, distance in hits]
+    })
 
 
 @app_views.route('/places/<place_id>', methods=['GET'], strict_slashes=False)
+@cached(Place)
 def get_place(place_id):
     """Get place by id"""
     place = storage.get(Place, place_id)
     if not place:
         abort(404)
-    return jsonify(place.to_dict())
+    return json_response(place)
 
 
 @app_views.route('/places/<place_id>',
@@ -81,7 +118,7 @@ def create_place(city_id):
     place = Place(**place_data)
     storage.new(place)
     storage.save()
-    return jsonify(place.to_dict()), 201
+    return json_response(place, 201)
 
 
 @app_views.route('/places/<place_id>', methods=['PUT'], strict_slashes=False)
@@ -98,119 +135,147 @@ def update_place(place_id):
         if key not in ignore:
             setattr(place, key, value)
     storage.save()
-    return jsonify(place.to_dict())
+    return json_response(place)
+
+
+@app_views.route('/places/batch', methods=['POST'], strict_slashes=False)
+@query_budget(3)
+def create_places():
+    """
+    Create up to MAX_BATCH places, each carrying its city_id, in one
+    INSERT. Items that fail validation are reported and skipped.
+    """
+    items = read_batch()
+    objs = [item for item in items if isinstance(item, dict)]
+    cities = storage.existing_ids(City, (item.get('city_id') for item in objs))
+    users = storage.existing_ids(User, (item.get('user_id') for item in objs))
+    results = []
+    places = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append((400, "Not a JSON object"))
+            continue
+        missing = [key for key in ('city_id', 'user_id', 'name')
+                   if key not in item]
+        if missing:
+            results.append((400, f"Missing {missing[0]}"))
+            continue
+        if item['city_id'] not in cities or item['user_id'] not in users:
+            results.append((404, "Not found"))
+            continue
+        data = {key: value for key, value in item.items()
+                if key not in ('id', 'created_at', 'updated_at')}
+        error = invalid_value(Place, data)
+        if error:
+            results.append((400, error))
+            continue
+        try:
+            place = Place(**data)
+        except (TypeError, ValueError) as e:
+            results.append((400, str(e)))
+            continue
+        places.append(place)
+        results.append((201, place))
+    storage.bulk_new(places)
+    storage.bulk_save()
+    return batch_response(results, 'place', 201)
+
+
+@app_views.route('/places/batch', methods=['PUT'], strict_slashes=False)
+@query_budget(2)
+def update_places():
+    """Update up to MAX_BATCH places, given as objects with their id"""
+    items = read_batch()
+    existing = storage.existing_ids(
+        Place, (item.get('id') for item in items if isinstance(item, dict)))
+    ignore = ('id', 'user_id', 'city_id', 'created_at', 'updated_at')
+    columns = set(public_columns(Place)).difference(ignore)
+    now = datetime.utcnow()
+    results = []
+    rows = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append((400, "Not a JSON object"))
+            continue
+        if 'id' not in item:
+            results.append((400, "Missing id"))
+            continue
+        if item['id'] not in existing:
+            results.append((404, "Not found"))
+            continue
+        values = {key: value for key, value in item.items()
+                  if key not in ignore}
+        unknown = sorted(set(values).difference(columns))
+        if unknown:
+            results.append((400, f"Unknown attribute {unknown[0]}"))
+            continue
+        error = invalid_value(Place, values)
+        if error:
+            results.append((400, error))
+            continue
+        rows.append(dict(values, id=item['id'], updated_at=now))
+        results.append((200, None))
+    storage.bulk_update(Place, rows)
+    storage.save()
+    return batch_response(results, 'place', 200)
+
+
+@app_views.route('/places/batch', methods=['DELETE'], strict_slashes=False)
+@query_budget(5)
+def delete_places():
+    """Delete up to MAX_BATCH places, given as a JSON array of ids"""
+    ids = read_batch()
+    existing = storage.existing_ids(Place, ids)
+    results = []
+    for place_id in ids:
+        if not isinstance(place_id, str):
+            results.append((400, "Not an id"))
+        elif place_id not in existing:
+            results.append((404, "Not found"))
+        else:
+            results.append((200, None))
+    storage.bulk_delete(Place, list(existing))
+    storage.save()
+    return batch_response(results, 'place', 200)
 
 
 @app_views.route('/places_search', methods=['POST'], strict_slashes=False)
+@query_budget(1)
 def places_search():
     """Search places based on states, cities and amenities"""
-    try:
-        print("\n=== Starting places_search ===")
-        if not request.get_json():
-            print("No JSON data received")
-            abort(400, description="Not a JSON")
-
-        data = request.get_json()
-        print(f"\nReceived search data: {data}")
-        places = []
-
-        # Si aucun critère n'est fourni
-        if not data or (not data.get('states') and
-                        not data.get('cities') and
-                        not data.get('amenities')):
-            print("\nNo search criteria - returning all places")
-            all_places = storage.all(Place).values()
-            return jsonify([place.to_dict() for place in all_places])
-
-        # Chercher par states
-        if data.get('states'):
-            print(f"\nSearching by states: {data['states']}")
-            for state_id in data['states']:
-                state = storage.get(State, state_id)
-                print(f"Found state: {state.name if state else 'None'}")
-                if state:
-                    for city in state.cities:
-                        print(f"Processing city: {city.name}")
-                        places.extend([place for place in city.places])
-                        print(
-                            f"Places found in {city.name}: {len(city.places)}")
-
-        # Chercher par cities
-        if data.get('cities'):
-            print(f"\nSearching by cities: {data['cities']}")
-            cities_places = []
-            for city_id in data['cities']:
-                city = storage.get(City, city_id)
-                print(f"Found city: {city.name if city else 'None'}")
-                if city:
-                    city_places = [place for place in city.places]
-                    print(f"Places found in {city.name}: {len(city_places)}")
-                    cities_places.extend(city_places)
-
-            if places:
-                print("Filtering existing places by cities")
-                places = [p for p in places if p in cities_places]
-            else:
-                places = cities_places
-            print(f"Total places after city filtering: {len(places)}")
-
-        # Filtrer par amenities
-        if data.get('amenities'):
-            print(f"\nFiltering by amenities: {data['amenities']}")
-            amenities = []
-            for amenity_id in data['amenities']:
-                amenity = storage.get(Amenity, amenity_id)
-                print(f"Found amenity: {amenity.name if amenity else 'None'}")
-                if amenity:
-                    amenities.append(amenity)
-
-            # Si on n'a pas encore de places, prendre toutes les places
-            if not places:
-                print("No places yet, getting all places")
-                places = list(storage.all(Place).values())
-
-            # Vérifier les amenities pour chaque place
-            filtered_places = []
-            for place in places:
-                print(f"\nChecking amenities for place: {place.id}")
-                place_amenities = [a for a in place.amenities]
-                print(f"Place amenities: {[a.name for a in place_amenities]}")
-                if all(am in place_amenities for am in amenities):
-                    filtered_places.append(place)
-            places = filtered_places
-            print(f"Places after amenity filtering: {len(places)}")
-
-        # Convertir en dictionnaires
-        print("\nConverting places to dictionaries")
-        place_dicts = []
-        for place in places:
-            try:
-                place_dict = place.to_dict()
-                place_dicts.append(place_dict)
-                print(f"Successfully converted place {place.id}")
-            except Exception as e:
-                print(f"Error converting place {place.id}: {str(e)}")
-
-        print(f"\nFinal number of places: {len(place_dicts)}")
-        return jsonify(place_dicts)
-
-    except Exception as e:
-        print(f"\n=== Error in places_search ===")
-        print(f"Type: {type(e)}")
-        print(f"Message: {str(e)}")
-        import traceback
-        print(f"Traceback:\n{traceback.format_exc()}")
-        abort(500, description=str(e))
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400, description="Not a JSON")
+
+    limit = data.get('limit')
+    offset = data.get('offset', 0)
+    if limit is not None and (not isinstance(limit, int) or limit < 1):
+        abort(400, description="Invalid limit")
+    if not isinstance(offset, int) or offset < 0:
+        abort(400, description="Invalid offset")
+    for key in ('states', 'cities', 'amenities'):
+        ids = data.get(key)
+        if ids is not None and (not isinstance(ids, list) or not all(
+                isinstance(obj_id, str) for obj_id in ids)):
+            abort(400, description=f"Invalid {key}")
+
+    places = storage.search_places(states=data.get('states'),
+                                   cities=data.get('cities'),
+                                   amenities=data.get('amenities'),
+                                   limit=limit, offset=offset)
+    return json_response(places)
 
 
 @app_views.route('/places/<place_id>/amenities', methods=['GET'],
                  strict_slashes=False)
+@query_budget(2)
+@cached(Place, Amenity)
 def get_place_amenities(place_id):
     """Get all amenities of a place"""
     place = storage.get(Place, place_id)
     if not place:
         abort(404)
-    return jsonify([amenity.to_dict() for amenity in place.amenities])
+    return json_response(list(place.amenities))
 
 
 @app_views.route('/places/<place_id>/amenities/<amenity_id>',
@@ -226,11 +291,11 @@ def link_amenity_to_place(place_id, amenity_id):
         abort(404)
 
     if amenity in place.amenities:
-        return jsonify(amenity.to_dict())
+        return json_response(amenity)
 
     place.amenities.append(amenity)
     storage.save()
-    return jsonify(amenity.to_dict())
+    return json_response(amenity)
 
 
 @app_views.route('/places/<place_id>/amenities/<amenity_id>',
@@ -1,4 +1,8 @@
 from api.v1.views import app_views
+from api.v1.query_budget import query_budget
+from api.v1.response_cache import cached
+from api.v1.pagination import paginate
+from api.v1.serialization import json_response
 from flask import jsonify, abort, request
 from models import storage
 from models.place import Place
@@ -8,13 +12,14 @@ from models.user import User
 
 @app_views.route('/places/<place_id>/reviews',
                  methods=['GET'], strict_slashes=False)
+@query_budget(2)
+@cached(Place, Review)
 def get_place_reviews(place_id):
-    """Retrieve all reviews for a given place"""
+    """Retrieve the reviews for a given place, one page at a time"""
     place = storage.get(Place, place_id)
     if not place:
         abort(404)
-    reviews = [review.to_dict() for review in place.reviews]
-    return jsonify(reviews)
+    return paginate(Review, place_id=place_id)
 
 
 @app_views.route('/places/<place_id>/reviews',
@@ -46,20 +51,29 @@ def create_review(place_id):
         review = Review(**review_data)
         storage.new(review)
         storage.save()
-        return jsonify(review.to_dict()), 201
+        return json_response(review, 201)
     except Exception as e:
         storage.rollback()
         print(f"Error creating review: {str(e)}")
         abort(500)
 
 
+@app_views.route('/reviews', methods=['GET'], strict_slashes=False)
+@query_budget(1)
+@cached(Review)
+def get_reviews():
+    """Retrieve every review, paginated or streamed for exports"""
+    return paginate(Review)
+
+
 @app_views.route('/reviews/<review_id>', methods=['GET'], strict_slashes=False)
+@cached(Review)
 def get_review(review_id):
     """Retrieve a specific review"""
     review = storage.get(Review, review_id)
     if not review:
         abort(404)
-    return jsonify(review.to_dict())
+    return json_response(review)
 
 
 @app_views.route('/reviews/<review_id>', methods=['PUT'], strict_slashes=False)
@@ -80,7 +94,7 @@ def update_review(review_id):
             setattr(review, key, value)
 
     storage.save()
-    return jsonify(review.to_dict())
+    return json_response(review)
 
 
 @app_views.route('/reviews/<review_id>',
@@ -1,6 +1,10 @@
 #!/usr/bin/python3
 """States API views"""
 from api.v1.views import app_views
+from api.v1.query_budget import query_budget
+from api.v1.response_cache import cached
+from api.v1.pagination import paginate
+from api.v1.serialization import json_response
 from flask import jsonify, request, abort
 from models import storage
 from models.state import State
@@ -9,20 +13,22 @@ from flasgger.utils import swag_from
 
 @app_views.route('/states', methods=['GET'], strict_slashes=False)
 @swag_from('documentation/states/get_states.yml')
+@query_budget(1)
+@cached(State)
 def get_states():
-    """Get all states"""
-    states = [state.to_dict() for state in storage.all(State).values()]
-    return jsonify(states)
+    """Get states, one page at a time"""
+    return paginate(State)
 
 
 @app_views.route('/states/<state_id>', methods=['GET'], strict_slashes=False)
 @swag_from('documentation/states/get_state.yml')
+@cached(State)
 def get_state(state_id):
     """Retrieve a state by ID"""
     state = storage.get(State, state_id)
     if not state:
         abort(404)
-    return jsonify(state.to_dict())
+    return json_response(state)
 
 
 @app_views.route('/states/<state_id>',
@@ -53,11 +59,11 @@ def create_state():
         abort(400, "Missing name")
     existing_state = storage.get_by_name(State, state_data["name"])
     if existing_state:
-        return jsonify(existing_state.to_dict()), 200
+        return json_response(existing_state, 200)
     state = State(**state_data)
     storage.new(state)
     storage.save()
-    return jsonify(state.to_dict()), 201
+    return json_response(state, 201)
 
 
 @app_views.route('/states/<state_id>', methods=['PUT'], strict_slashes=False)
@@ -75,4 +81,4 @@ def update_state(state_id):
         if key not in ignore:
             setattr(state, key, value)
     storage.save()
-    return jsonify(state.to_dict())
+    return json_response(state)
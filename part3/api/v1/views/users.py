@@ -1,16 +1,21 @@
 #!/usr/bin/python3
 """Routes for User objects"""
 from api.v1.views import app_views
+from api.v1.query_budget import query_budget
+from api.v1.response_cache import cached
+from api.v1.pagination import paginate
+from api.v1.serialization import json_response
 from flask import jsonify, request, abort
 from models import storage
 from models.user import User
 
 
 @app_views.route('/users', methods=['GET'], strict_slashes=False)
+@query_budget(1)
+@cached(User)
 def get_users():
-    """Retrieve all users"""
-    users = [user.to_dict() for user in storage.all(User).values()]
-    return jsonify(users)
+    """Retrieve users, one page at a time"""
+    return paginate(User)
 
 
 @app_views.route('/users/<user_id>', methods=['GET'], strict_slashes=False)
@@ -19,7 +24,7 @@ def get_user(user_id):
     user = storage.get(User, user_id)
     if not user:
         abort(404)
-    return jsonify(user.to_dict())
+    return json_response(user)
 
 
 @app_views.route('/users', methods=['POST'], strict_slashes=False)
@@ -36,7 +41,7 @@ def create_user():
     user = User(**user_data)
     storage.new(user)
     storage.save()
-    return jsonify(user.to_dict()), 201
+    return json_response(user, 201)
 
 
 @app_views.route('/users/<user_id>', methods=['PUT'], strict_slashes=False)
@@ -53,7 +58,7 @@ def update_user(user_id):
         if key not in ["id", "email", "created_at", "updated_at"]:
             setattr(user, key, value)
     user.save()
-    return jsonify(user.to_dict())
+    return json_response(user)
 
 
 @app_views.route('/users/<user_id>', methods=['DELETE'], strict_slashes=False)
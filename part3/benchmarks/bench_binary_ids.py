@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+"""
+Benchmark for text vs binary UUID primary keys.
+
+Each variant runs in its own process against a freshly dropped schema:
+VARCHAR ids from uuid4 (the original layout), VARCHAR ids from UUIDv7,
+and BINARY(16) ids from UUIDv7. It reports review insert throughput and
+the data and index size of the reviews and places tables.
+
+Run against a throwaway database (HBNB_ENV=test drops every table):
+    HBNB_ENV=test python3 -m benchmarks.bench_binary_ids [--reviews 200000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+VARIANTS = {
+    'text uuid4': {'HBNB_BINARY_IDS': '0', 'uuid': '4'},
+    'text uuid7': {'HBNB_BINARY_IDS': '0', 'uuid': '7'},
+    'binary uuid7': {'HBNB_BINARY_IDS': '1', 'uuid': '7'},
+}
+
+
+def table_sizes(engine, tables):
+    """Return {table: (data_bytes, index_bytes)}"""
+    with engine.connect() as conn:
+        if engine.dialect.name == 'mysql':
+            for table in tables:
+                conn.exec_driver_sql(f"ANALYZE TABLE `{table}`").all()
+            rows = conn.exec_driver_sql(
+                "SELECT table_name, data_length, index_length "
+                "FROM information_schema.tables "
+                "WHERE table_schema = DATABASE()").all()
+            return {name: (data, index) for name, data, index in rows
+                    if name in tables}
+        # SQLite: split pages between tables and indexes with dbstat
+        sizes = {}
+        for table in tables:
+            data = conn.exec_driver_sql(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name = ?",
+                (table,)).scalar() or 0
+            index = conn.exec_driver_sql(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name IN "
+                "(SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = ?)", (table,)).scalar() or 0
+            sizes[table] = (data, index)
+        return sizes
+
+
+def child(args, uuid_version):
+    """Insert the dataset with one id layout and print JSON results"""
+    import models.base_model
+    if uuid_version == '4':
+        models.base_model.new_id = lambda: str(uuid.uuid4())
+    from models import storage
+    from models.city import City
+    from models.place import Place
+    from models.review import Review
+    from models.state import State
+    from models.user import User
+
+    state = State(name="Bench")
+    city = City(name="Bench", state_id=state.id)
+    users = [User(email=f"u{i}@example.com", password="password")
+             for i in range(100)]
+    places = [Place(name=f"Place {i}", city_id=city.id,
+                    user_id=users[i % 100].id) for i in range(args.places)]
+    for obj in [state, city] + users + places:
+        storage.new(obj)
+    storage.save()
+
+    start = time.perf_counter()
+    for i in range(args.reviews):
+        storage.new(Review(text="Bench review", place_id=places[i % len(
+            places)].id, user_id=users[i % 100].id))
+        if i % args.batch == args.batch - 1:
+            storage.save()
+            storage.close()
+    storage.save()
+    elapsed = time.perf_counter() - start
+    sizes = table_sizes(storage._DBStorage__engine, ('reviews', 'places'))
+    print(json.dumps({'rows_per_s': args.reviews / elapsed, 'sizes': sizes}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--reviews', type=int, default=200000)
+    parser.add_argument('--places', type=int, default=10000)
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--child', choices=('4', '7'))
+    args = parser.parse_args()
+    if args.child:
+        return child(args, args.child)
+
+    print(f"{'variant':>13} {'rows/s':>8} {'reviews data':>13}"
+          f" {'reviews idx':>12} {'places idx':>11}")
+    for name, variant in VARIANTS.items():
+        env = dict(os.environ, HBNB_ENV='test',
+                   HBNB_BINARY_IDS=variant['HBNB_BINARY_IDS'])
+        out = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_binary_ids',
+             '--child', variant['uuid'], '--reviews', str(args.reviews),
+             '--places', str(args.places), '--batch', str(args.batch)],
+            env=env, check=True, capture_output=True, text=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        sizes = result['sizes']
+        mb = 1024 * 1024
+        print(f"{name:>13} {result['rows_per_s']:>8.0f}"
+              f" {sizes['reviews'][0] / mb:>11.1f}MB"
+              f" {sizes['reviews'][1] / mb:>10.1f}MB"
+              f" {sizes['places'][1] / mb:>9.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""
+Benchmark for POST /api/v1/places_search.
+
+Seeds states, cities, places and amenities, then times a few search
+shapes through the Flask test client and counts the SQL statements each
+request issues. Exits non-zero if a request goes over --max-statements,
+so it doubles as an N+1 regression check.
+
+Run against a throwaway database (HBNB_ENV=test drops every table):
+    HBNB_ENV=test python3 -m benchmarks.bench_places_search [--places 20000]
+"""
+import argparse
+import json
+import random
+import time
+from sqlalchemy import event
+from api.v1.app import app
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+
+
+def seed(args, rng):
+    """Create the dataset, return (states, cities, amenities) ids"""
+    user = User(email="bench@example.com", password="bench")
+    states = [State(name=f"State {i}") for i in range(args.states)]
+    cities = [City(name=f"City {i}", state_id=rng.choice(states).id)
+              for i in range(args.cities)]
+    amenities = [Amenity(name=f"Amenity {i}") for i in range(args.amenities)]
+    for obj in [user] + states + cities + amenities:
+        storage.new(obj)
+    storage.save()
+    for i in range(args.places):
+        place = Place(name=f"Place {i}", user_id=user.id,
+                      city_id=rng.choice(cities).id)
+        for amenity in rng.sample(amenities, rng.randrange(len(amenities))):
+            place.amenities.append(amenity)
+        storage.new(place)
+        if i % 1000 == 999:
+            storage.save()
+    storage.save()
+    return ([s.id for s in states], [c.id for c in cities],
+            [a.id for a in amenities])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--states', type=int, default=20)
+    parser.add_argument('--cities', type=int, default=200)
+    parser.add_argument('--amenities', type=int, default=10)
+    parser.add_argument('--places', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-statements', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    states, cities, amenities = seed(args, rng)
+    searches = {
+        'all': {},
+        '3 states': {'states': states[:3]},
+        '3 states+5 cities': {'states': states[:3], 'cities': cities[:5]},
+        '2 amenities': {'amenities': amenities[:2]},
+        'states+amenities': {'states': states[:5],
+                             'amenities': amenities[:2]},
+        'page of 50': {'amenities': amenities[:1], 'limit': 50,
+                       'offset': 100},
+    }
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = storage._DBStorage__engine
+    event.listen(engine, 'before_cursor_execute', count)
+    client = app.test_client()
+    over_budget = False
+    print(f"{'search':>20} {'places':>7} {'statements':>10} {'ms':>8}")
+    for name, body in searches.items():
+        elapsed = 0
+        for _ in range(args.repeat):
+            del statements[:]
+            start = time.perf_counter()
+            response = client.post('/api/v1/places_search',
+                                   data=json.dumps(body),
+                                   content_type='application/json')
+            elapsed += time.perf_counter() - start
+        over_budget |= len(statements) > args.max_statements
+        print(f"{name:>20} {len(response.json):>7} {len(statements):>10}"
+              f" {elapsed / args.repeat * 1e3:>8.1f}")
+    event.remove(engine, 'before_cursor_execute', count)
+    if over_budget:
+        raise SystemExit(f"more than {args.max_statements} statement(s) "
+                         "per search")
+
+
+if __name__ == '__main__':
+    main()
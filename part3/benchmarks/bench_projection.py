@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+"""
+Benchmark for column-projected listings.
+
+Seeds --users users, then lists them in one page of that size twice:
+as ORM entities serialized with the model serializer (the old listing
+path) and as projected rows of public_columns(User) serialized with the
+row serializer. Reports CPU time and peak Python memory of each, best
+of --repeat, with a fresh session every run.
+
+Run against a throwaway database (HBNB_ENV=test drops every table):
+    HBNB_ENV=test python3 -m benchmarks.bench_projection [--users 100000]
+"""
+import argparse
+import time
+import tracemalloc
+from models import storage
+from models.serializer import public_columns, row_serializer, serializer
+from models.user import User
+
+
+def seed(count):
+    """Insert count users"""
+    for i in range(count):
+        storage.new(User(email=f"user{i}@example.com", password="bench",
+                         first_name=f"First {i}", last_name=f"Last {i}"))
+        if i % 5000 == 4999:
+            storage.save()
+    storage.save()
+    storage.close()
+
+
+def entities(limit):
+    """Old path: whole objects, tracked by the session"""
+    objs, _ = storage.page(User, limit)
+    dumps = serializer(User)
+    return b'[' + b','.join(map(dumps, objs)) + b']'
+
+
+def projected(limit):
+    """New path: selected columns as plain rows"""
+    columns = public_columns(User)
+    rows, _ = storage.page(User, limit, columns=columns)
+    dumps = row_serializer(User, columns)
+    return b'[' + b','.join(map(dumps, rows)) + b']'
+
+
+def measure(func, limit, repeat):
+    """Best CPU seconds, best peak bytes and body size over repeat runs"""
+    cpu, peak = [], []
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.process_time()
+        body = func(limit)
+        cpu.append(time.process_time() - start)
+        peak.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del body
+        storage.close()
+    return min(cpu), min(peak), len(func(limit))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    seed(args.users)
+    storage.close()
+    print(f"{args.users} users")
+    results = {}
+    for name, func in (('entities', entities), ('projected', projected)):
+        results[name] = measure(func, args.users, args.repeat)
+        cpu, peak, size = results[name]
+        print(f"{name:<10} {cpu * 1000:8.0f} ms cpu  "
+              f"{peak / 1e6:7.1f} MB peak  {size / 1e6:6.1f} MB body")
+    print(f"projected/entities: cpu "
+          f"{results['projected'][0] / results['entities'][0]:.2f}, "
+          f"memory {results['projected'][1] / results['entities'][1]:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Benchmark for place serialization.
+
+Serializes the same in-memory places through the old path,
+jsonify([place.to_dict() ...]), and through the generated serializer
+with each available backend, and reports the best time of --repeat runs.
+No rows are written; only the models import touches the database.
+
+    HBNB_ENV=test python3 -m benchmarks.bench_serializer [--places 100000]
+"""
+import argparse
+import time
+from flask import Flask, jsonify
+from models import serializer
+from models.place import Place
+
+
+def make_places(count):
+    """Build count places with every column set"""
+    return [Place(city_id=f'city-{i % 100}', user_id=f'user-{i % 1000}',
+                  name=f'Place {i}', description='A quiet room ' * 4,
+                  number_rooms=i % 5, number_bathrooms=i % 3,
+                  max_guest=i % 8, price_by_night=50 + i % 200,
+                  latitude=40 + (i % 1000) / 1000,
+                  longitude=-70 - (i % 1000) / 1000)
+            for i in range(count)]
+
+
+def best(func, repeat):
+    """Best wall time of repeat calls, and the last result's size"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--places', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    places = make_places(args.places)
+    app = Flask(__name__)
+
+    def old():
+        with app.app_context():
+            return len(jsonify([p.to_dict() for p in places]).get_data())
+
+    def new():
+        return len(serializer.dumps_list(places))
+
+    results = {'to_dict + jsonify': best(old, args.repeat)}
+    for backend in ('json', 'orjson'):
+        if backend == 'orjson' and serializer.orjson is None:
+            continue
+        serializer.BACKEND = backend
+        serializer._serializers.clear()
+        results[f'generated ({backend})'] = best(new, args.repeat)
+
+    baseline = results['to_dict + jsonify'][0]
+    print(f"{args.places} places")
+    for name, (seconds, size) in results.items():
+        print(f"{name:<20} {seconds * 1000:8.1f} ms  "
+              f"{args.places / seconds:10.0f} places/s  "
+              f"{size / 1e6:6.1f} MB  x{baseline / seconds:.1f}")
+
+
+if __name__ == '__main__':
+    main()
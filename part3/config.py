@@ -14,4 +14,9 @@ class Config:
                     'HBNB_MYSQL_HOST', 'localhost'), os.getenv(
                         'HBNB_MYSQL_DB', 'hbnb_dev_db')))
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Connection pool, per process (each gunicorn worker has its own)
+    SQLALCHEMY_POOL_SIZE = int(os.getenv('HBNB_DB_POOL_SIZE', '5'))
+    SQLALCHEMY_MAX_OVERFLOW = int(os.getenv('HBNB_DB_MAX_OVERFLOW', '10'))
+    SQLALCHEMY_POOL_RECYCLE = int(os.getenv('HBNB_DB_POOL_RECYCLE', '1800'))
+    SQLALCHEMY_POOL_TIMEOUT = int(os.getenv('HBNB_DB_POOL_TIMEOUT', '30'))
     JSON_SORT_KEYS = False
@@ -1,30 +1,19 @@
 #!/usr/bin/python3
 """HBNB console"""
 import cmd
+import sys
 from models import storage
-from models.base_model import BaseModel
-from models.user import User
-from models.place import Place
-from models.state import State
-from models.city import City
-from models.amenity import Amenity
-from models.review import Review
+from models.engine import bulk_io
+from models.engine.db_storage import classes
 import shlex
-
-classes = {
-    'BaseModel': BaseModel,
-    'User': User,
-    'Place': Place,
-    'State': State,
-    'City': City,
-    'Amenity': Amenity,
-    'Review': Review
-}
+from sqlalchemy.exc import SQLAlchemyError
 
 
 class HBNBCommand(cmd.Cmd):
     """HBNB command interpreter"""
     prompt = '(hbnb) '
+    # Set to 1 by a failed import/export, for the non-interactive exit code
+    exit_code = 0
 
     def do_quit(self, arg):
         """Quit command to exit the program"""
@@ -41,7 +30,8 @@ class HBNBCommand(cmd.Cmd):
 
     def do_create(self, arg):
         """Create a new instance"""
-        args = shlex.split(arg)
+        # Not shlex: the "..." around string values must survive
+        args = arg.split()
         if not args:
             print("** class name missing **")
             return
@@ -72,27 +62,31 @@ class HBNBCommand(cmd.Cmd):
             new_dict[key] = value
 
         new_instance = classes[args[0]](**new_dict)
+        storage.new(new_instance)
         new_instance.save()
         print(new_instance.id)
 
+    def do_import(self, arg):
+        """
+        Bulk load a CSV or NDJSON file (.gz allowed) into a class:
+        import <class> <file> [batch_size]
+        """
+        self.__bulk(bulk_io.import_file, arg)
 
-def do_show(self, arg):
-    """Show an instance based on the class name and id."""
-    if not arg:
-        print("** class name missing **")
-        return
-    try:
-        class_name, params = arg.split(" ", 1)
-    except ValueError:
-        class_name, params = arg, ""
+    def do_export(self, arg):
+        """
+        Stream every instance of a class to a CSV or NDJSON file:
+        export <class> <file> [batch_size]
+        """
+        self.__bulk(bulk_io.export_file, arg)
 
-    if class_name not in self.classes:
-        print("** class doesn't exist **")
-        return
-
-    def do_destroy(self, arg):
-        """Delete instance"""
+    def __bulk(self, run, arg):
+        """
+        Parse <class> <file> [batch_size] and run an import/export,
+        setting exit_code when it fails
+        """
         args = shlex.split(arg)
+        self.exit_code = 1
         if not args:
             print("** class name missing **")
             return
@@ -100,33 +94,73 @@ def do_show(self, arg):
             print("** class doesn't exist **")
             return
         if len(args) < 2:
-            print("** instance id missing **")
+            print("** file name missing **")
             return
-        key = f"{args[0]}.{args[1]}"
-        if key not in storage.all():
+        batch_size = bulk_io.DEFAULT_BATCH
+        if len(args) > 2:
+            try:
+                batch_size = int(args[2])
+            except ValueError:
+                print("** invalid batch size **")
+                return
+        try:
+            rows = run(storage, classes[args[0]], args[1],
+                       batch_size=batch_size)
+        except (OSError, ValueError, SQLAlchemyError) as error:
+            print(f"** {error} **")
+            return
+        self.exit_code = 0
+        # Keep an export to stdout free of anything but its rows
+        writes_stdout = run is bulk_io.export_file and args[1] == '-'
+        print(rows, file=sys.stderr if writes_stdout else sys.stdout)
+
+    def __lookup(self, args):
+        """
+        Check <class> <id> and fetch that one instance by primary key,
+        printing the usual error and returning None when it fails
+        """
+        if not args:
+            print("** class name missing **")
+            return None
+        if args[0] not in classes:
+            print("** class doesn't exist **")
+            return None
+        if len(args) < 2:
+            print("** instance id missing **")
+            return None
+        obj = storage.get(classes[args[0]], args[1])
+        if obj is None:
             print("** no instance found **")
+        return obj
+
+    def do_show(self, arg):
+        """Show an instance based on the class name and id."""
+        obj = self.__lookup(shlex.split(arg))
+        if obj is not None:
+            print(obj)
+
+    def do_destroy(self, arg):
+        """Delete instance"""
+        obj = self.__lookup(shlex.split(arg))
+        if obj is None:
             return
-        del storage.all()[key]
+        storage.delete(obj)
         storage.save()
 
     def do_all(self, arg):
         """Show all instances"""
         args = shlex.split(arg)
-        obj_list = []
         if not args:
-            for obj in storage.all().values():
-                obj_list.append(str(obj))
+            objs = storage.all()
         elif args[0] in classes:
-            for key, obj in storage.all().items():
-                if key.split('.')[0] == args[0]:
-                    obj_list.append(str(obj))
+            objs = storage.all(classes[args[0]])
         else:
             print("** class doesn't exist **")
             return
-        print(obj_list)
+        print([str(obj) for obj in objs.values()])
 
-    def do_update(self, arg):
-        """Update instance attributes"""
+    def do_count(self, arg):
+        """Count the instances of a class"""
         args = shlex.split(arg)
         if not args:
             print("** class name missing **")
@@ -134,12 +168,13 @@ def do_show(self, arg):
         if args[0] not in classes:
             print("** class doesn't exist **")
             return
-        if len(args) < 2:
-            print("** instance id missing **")
-            return
-        key = f"{args[0]}.{args[1]}"
-        if key not in storage.all():
-            print("** no instance found **")
+        print(storage.count(classes[args[0]]))
+
+    def do_update(self, arg):
+        """Update instance attributes"""
+        args = shlex.split(arg)
+        obj = self.__lookup(args)
+        if obj is None:
             return
         if len(args) < 3:
             print("** attribute name missing **")
@@ -148,7 +183,6 @@ def do_show(self, arg):
             print("** value missing **")
             return
 
-        obj = storage.all()[key]
         attr_name = args[2]
         attr_value = args[3]
 
@@ -179,16 +213,16 @@ def do_show(self, arg):
 
         method_name = command[0]
         params = command[1].rstrip(')')
+        instance_id = params.strip().strip('"')
 
         if method_name == 'all':
             self.do_all(class_name)
         elif method_name == 'count':
-            print(len([obj for obj in storage.all().values()
-                      if obj.__class__.__name__ == class_name]))
+            self.do_count(class_name)
         elif method_name == 'show':
-            self.do_show(f"{class_name} {params.strip('\"')}")
+            self.do_show(f"{class_name} {instance_id}")
         elif method_name == 'destroy':
-            self.do_destroy(f"{class_name} {params.strip('\"')}")
+            self.do_destroy(f"{class_name} {instance_id}")
         elif method_name == 'update':
             params = params.split(',')
             if len(params) < 2:
@@ -215,4 +249,10 @@ def do_show(self, arg):
 
 
 if __name__ == '__main__':
-    HBNBCommand().cmdloop()
+    if len(sys.argv) > 1:
+        # Non-interactive: ./console.py import Review reviews.ndjson
+        console = HBNBCommand()
+        console.onecmd(' '.join(shlex.quote(a) for a in sys.argv[1:]))
+        sys.exit(console.exit_code)
+    else:
+        HBNBCommand().cmdloop()
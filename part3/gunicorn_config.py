@@ -1,9 +1,33 @@
+import os
+
 bind = "0.0.0.0:5000"
-workers = 4
-worker_class = "sync"
+workers = int(os.getenv("HBNB_WORKERS", "4"))
+# The app is loaded after this file: let it see how many processes will
+# serve it (per-process caches refuse to run with more than one)
+os.environ["HBNB_WORKERS"] = str(workers)
+# Threaded workers: DBStorage gives each thread its own session, and each
+# worker's pool (HBNB_DB_POOL_SIZE + HBNB_DB_MAX_OVERFLOW) must cover
+# its threads
+worker_class = "gthread"
+threads = int(os.getenv("HBNB_GUNICORN_THREADS", "4"))
+# Import the app once in the master and fork it: workers share its
+# memory copy-on-write and boot faster
+preload_app = True
 timeout = 120
 keepalive = 5
 capture_output = True
 accesslog = "-"
 errorlog = "-"
 loglevel = "info"
+
+
+def when_ready(server):
+    """Release the master's own connections once the app is loaded"""
+    from models import storage
+    storage.dispose()
+
+
+def post_fork(server, worker):
+    """Give each worker a fresh pool instead of the master's sockets"""
+    from models import storage
+    storage.dispose(close=False)
@@ -0,0 +1,23 @@
+-- Ajoute les index de clés étrangères et de recherche sur une base existante
+-- Usage : mysql -u hbnb_dev -p hbnb_dev_db < migrations/001_add_indexes.sql
+-- (python3 -m models.engine.schema --create fait de même depuis les modèles)
+
+CREATE INDEX ix_users_email ON users (email);
+CREATE INDEX ix_users_created_at ON users (created_at, id);
+
+CREATE INDEX ix_states_name ON states (name);
+CREATE INDEX ix_states_created_at ON states (created_at, id);
+
+CREATE INDEX ix_cities_state_id ON cities (state_id);
+
+CREATE INDEX ix_amenities_created_at ON amenities (created_at, id);
+
+CREATE INDEX ix_places_city_id_created_at ON places (city_id, created_at, id);
+CREATE INDEX ix_places_user_id ON places (user_id);
+CREATE INDEX ix_places_latitude_longitude ON places (latitude, longitude);
+
+CREATE INDEX ix_place_amenity_amenity_id ON place_amenity (amenity_id);
+
+CREATE INDEX ix_reviews_place_id_created_at ON reviews (place_id, created_at, id);
+CREATE INDEX ix_reviews_user_id ON reviews (user_id);
+CREATE INDEX ix_reviews_created_at ON reviews (created_at, id);
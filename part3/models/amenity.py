@@ -1,13 +1,14 @@
 #!/usr/bin/python3
 """Amenity Model Module"""
 from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.orm import validates
 
 
 class Amenity(BaseModel, Base):
     """Amenity Class"""
     __tablename__ = 'amenities'
+    __table_args__ = (Index('ix_amenities_created_at', 'created_at', 'id'),)
     name = Column(String(128), nullable=False)
 
     @validates('name')
@@ -3,7 +3,7 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, String, DateTime
 from datetime import datetime
-import uuid
+from models.id_type import id_type, new_id
 
 Base = declarative_base()
 
@@ -12,13 +12,13 @@ class BaseModel(Base):
     """BaseModel class"""
     __abstract__ = True
 
-    id = Column(String(60), primary_key=True)
+    id = Column(id_type(), primary_key=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     def __init__(self, *args, **kwargs):
         """Initialize BaseModel"""
-        self.id = str(uuid.uuid4())
+        self.id = new_id()
         self.created_at = datetime.utcnow()
         self.updated_at = self.created_at
         if kwargs:
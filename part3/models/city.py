@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 """City Model Module"""
 from models.base_model import BaseModel, Base
+from models.id_type import id_type
 from sqlalchemy import Column, String, ForeignKey
 from sqlalchemy.orm import relationship
 
@@ -10,7 +11,8 @@ class City(BaseModel, Base):
     __tablename__ = 'cities'
 
     name = Column(String(128), nullable=False)
-    state_id = Column(String(60), ForeignKey('states.id'), nullable=False)
+    state_id = Column(id_type(), ForeignKey('states.id'), nullable=False,
+                      index=True)
     places = relationship(
         "Place",
         backref="city",
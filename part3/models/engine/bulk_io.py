@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+"""
+Bulk import and export of one class of objects as CSV or NDJSON.
+
+Files are streamed in chunks of --batch-size rows: each chunk of an
+import is one executemany INSERT and one commit, without building ORM
+objects, and an export reads through a server-side cursor. Progress and
+rows/sec go to stderr. The format follows the file name (.csv, .ndjson
+or .jsonl, optionally .gz); "-" is stdin/stdout, as NDJSON unless
+--format says otherwise.
+
+Import rows are column values by name, e.g. the output of an export:
+missing ids are generated, missing timestamps are set to now, empty CSV
+fields are NULL and unknown keys are ignored. Exports include every
+column, the password hash too, so that they can be imported back.
+
+    python3 -m models.engine.bulk_io import Review reviews.ndjson.gz
+    python3 -m models.engine.bulk_io export Place places.csv
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import inspect
+from sqlalchemy.types import DateTime, Float, Integer
+from models.id_type import new_id
+
+FORMATS = ('csv', 'ndjson')
+DEFAULT_BATCH = 5000
+
+
+def file_format(path, fmt=None):
+    """The format named by fmt, else the one path's extension implies"""
+    if fmt:
+        return fmt
+    name = path[:-3] if path.endswith('.gz') else path
+    return 'csv' if name.endswith('.csv') else 'ndjson'
+
+
+@contextmanager
+def open_text(path, mode):
+    """
+    Open path ('-' for stdin/stdout, .gz compressed) for text I/O. The
+    standard streams are left open when the block ends.
+    """
+    if path == '-':
+        stream = sys.stdin if mode == 'r' else sys.stdout
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is None:
+            # Already a text stream (e.g. redirected in tests)
+            yield stream
+            return
+        stream.flush()
+        handle = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+        try:
+            yield handle
+        finally:
+            if mode != 'r':
+                handle.flush()
+            handle.detach()
+        return
+    if path.endswith('.gz'):
+        handle = gzip.open(path, mode + 't', encoding='utf-8', newline='')
+    else:
+        handle = open(path, mode, encoding='utf-8', newline='')
+    with handle:
+        yield handle
+
+
+def converters(cls):
+    """Column name -> function turning a CSV/JSON value into a DB value"""
+    def text(value):
+        return None if value == '' else value
+
+    def typed(parse):
+        def convert(value):
+            if value is None or value == '':
+                return None
+            return parse(value) if isinstance(value, str) else value
+        return convert
+
+    result = {}
+    for column in inspect(cls).columns:
+        if isinstance(column.type, DateTime):
+            result[column.key] = typed(datetime.fromisoformat)
+        elif isinstance(column.type, Integer):
+            result[column.key] = typed(int)
+        elif isinstance(column.type, Float):
+            result[column.key] = typed(float)
+        else:
+            result[column.key] = text
+    return result
+
+
+def read_records(handle, fmt):
+    """Yield one dict per CSV row or NDJSON line"""
+    if fmt == 'csv':
+        yield from csv.DictReader(handle)
+        return
+    for line in handle:
+        if line.strip():
+            yield json.loads(line)
+
+
+def chunks(iterable, size):
+    """Yield lists of up to size items"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Progress:
+    """Rows done and rows/sec, reported to a stream after every chunk"""
+
+    def __init__(self, label, out=sys.stderr):
+        self.label = label
+        self.out = out
+        self.rows = 0
+        self.start = time.perf_counter()
+
+    def rate(self):
+        elapsed = time.perf_counter() - self.start
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def add(self, rows):
+        self.rows += rows
+        if self.out is not None:
+            self.out.write(f"\r{self.label}: {self.rows} rows, "
+                           f"{self.rate():.0f} rows/s")
+            self.out.flush()
+
+    def done(self):
+        if self.out is not None:
+            self.out.write("\n")
+        return self.rows
+
+
+def import_file(storage, cls, path, fmt=None, batch_size=DEFAULT_BATCH,
+                progress=sys.stderr):
+    """
+    Insert every record of path as a cls row, committing every
+    batch_size rows. A failing chunk is rolled back and the error
+    raised; the chunks before it stay committed.
+    Returns:
+        The number of rows inserted.
+    """
+    convert = converters(cls)
+    report = Progress(f"import {cls.__name__}", progress)
+    with open_text(path, 'r') as handle:
+        records = read_records(handle, file_format(path, fmt))
+        for chunk in chunks(records, batch_size):
+            now = datetime.utcnow()
+            rows = []
+            for record in chunk:
+                row = {key: convert[key](value)
+                       for key, value in record.items() if key in convert}
+                if not row.get('id'):
+                    row['id'] = new_id()
+                row['created_at'] = row.get('created_at') or now
+                row['updated_at'] = row.get('updated_at') or row['created_at']
+                rows.append(row)
+            try:
+                storage.bulk_insert(cls, rows)
+                storage.save()
+            except Exception:
+                storage.rollback()
+                raise
+            report.add(len(rows))
+    return report.done()
+
+
+def export_file(storage, cls, path, fmt=None, batch_size=DEFAULT_BATCH,
+                progress=sys.stderr):
+    """
+    Write every cls row to path, ordered by (created_at, id).
+    Returns:
+        The number of rows written.
+    """
+    from models.serializer import row_serializer
+    columns = [attr.key for attr in inspect(cls).column_attrs]
+    fmt = file_format(path, fmt)
+    report = Progress(f"export {cls.__name__}", progress)
+    rows = storage.iterate(cls, batch_size=batch_size, columns=columns)
+    with open_text(path, 'w') as handle:
+        if fmt == 'csv':
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            for chunk in chunks(rows, batch_size):
+                writer.writerows(
+                    ['' if value is None else
+                     value.isoformat() if isinstance(value, datetime)
+                     else value for value in row[:len(columns)]]
+                    for row in chunk)
+                report.add(len(chunk))
+        else:
+            dumps = row_serializer(cls, columns)
+            for chunk in chunks(rows, batch_size):
+                handle.write(b'\n'.join(map(dumps, chunk)).decode() + '\n')
+                report.add(len(chunk))
+    return report.done()
+
+
+def main(argv=None):
+    """Run one import or export, non-interactively"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('command', choices=('import', 'export'))
+    parser.add_argument('cls', metavar='class')
+    parser.add_argument('path', help='file to read or write, - for stdio')
+    parser.add_argument('--format', choices=FORMATS)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH)
+    parser.add_argument('--quiet', action='store_true',
+                        help='do not report progress')
+    args = parser.parse_args(argv)
+
+    from models import storage
+    from models.engine.db_storage import classes
+    cls = classes.get(args.cls)
+    if cls is None:
+        parser.error(f"unknown class {args.cls}")
+    run = import_file if args.command == 'import' else export_file
+    run(storage, cls, args.path, args.format, args.batch_size,
+        None if args.quiet else sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,15 @@
 #!/usr/bin/python3
 """Database Storage Module"""
+import math
+import threading
+import time
 from os import getenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import (create_engine, and_, bindparam, case, delete,
+                        event, exists, func, insert, or_, select, update)
+from sqlalchemy.types import Boolean
+from sqlalchemy.orm import (ONETOMANY, make_transient_to_detached,
+                            scoped_session, sessionmaker)
+from config import Config
 from models.base_model import Base
 from models.user import User
 from models.state import State
@@ -11,11 +18,26 @@ from models.amenity import Amenity
 from models.place import Place
 from models.review import Review
 
+EARTH_RADIUS_KM = 6371.0088
+
+# Model registry: class name -> class, built once at import
+classes = {
+    'User': User, 'State': State, 'City': City,
+    'Amenity': Amenity, 'Place': Place, 'Review': Review
+}
+
+# Rarely written classes whose get() may be served across requests
+CACHED_CLASSES = (State, Amenity)
+
 
 class DBStorage:
     """Database Storage Class"""
     __engine = None
     __session = None
+    __counts = None
+    __counts_at = 0.0
+    __entities = None
+    __generation = 0
 
     def rollback(self):
         """Rollback session"""
@@ -50,18 +72,25 @@ class DBStorage:
 
         self.__engine = create_engine(
             f'mysql+mysqldb://{user}:{pwd}@{host}/{db}',
-            pool_pre_ping=True
+            pool_pre_ping=True,
+            pool_size=Config.SQLALCHEMY_POOL_SIZE,
+            max_overflow=Config.SQLALCHEMY_MAX_OVERFLOW,
+            pool_recycle=Config.SQLALCHEMY_POOL_RECYCLE,
+            pool_timeout=Config.SQLALCHEMY_POOL_TIMEOUT
         )
 
+        # Seconds count_all() may serve cached counts; 0 disables the cache
+        self.counts_ttl = float(getenv('HBNB_COUNTS_TTL') or 0)
+        # Seconds get() may serve State/Amenity rows from the entity cache
+        self.entity_cache_ttl = float(getenv('HBNB_ENTITY_CACHE_TTL') or 0)
+        self.__entities = {}
+        self.__entities_lock = threading.Lock()
+
         if getenv('HBNB_ENV') == 'test':
             Base.metadata.drop_all(self.__engine)
 
     def all(self, cls=None):
         """Query objects"""
-        classes = {
-            'User': User, 'State': State, 'City': City,
-            'Amenity': Amenity, 'Place': Place, 'Review': Review
-        }
         objects = {}
 
         if cls:
@@ -95,30 +124,404 @@ class DBStorage:
             self.__session.delete(obj)
 
     def reload(self):
-        """Create all tables and session"""
+        """
+    Create all tables and the session registry.
+    self.__session is the scoped_session itself, not one Session taken
+    from it: every call through it reaches the calling thread's own
+    session, and close() ends that session at the end of each request.
+    """
         Base.metadata.create_all(self.__engine)
+        if self.__session is not None:
+            self.__session.remove()
         session_factory = sessionmaker(
             bind=self.__engine, expire_on_commit=False)
-        Session = scoped_session(session_factory)
-        self.__session = Session()
+        event.listen(session_factory, 'after_commit',
+                     self.__invalidate_counts)
+        event.listen(session_factory, 'after_flush', self.__collect_stale)
+        event.listen(session_factory, 'after_commit',
+                     self.__invalidate_entities)
+        event.listen(session_factory, 'after_bulk_delete',
+                     self.__collect_bulk)
+        event.listen(session_factory, 'after_bulk_update',
+                     self.__collect_bulk)
+        event.listen(session_factory, 'do_orm_execute',
+                     self.__collect_statement)
+        self.__session = scoped_session(session_factory)
 
     def close(self):
-        """Close session"""
-        if self.__session:
-            self.__session.close()
+        """Close the current thread's session and release its connection"""
+        if self.__session is not None:
+            self.__session.remove()
+
+    def dispose(self, close=True):
+        """
+    Drop every pooled connection so the next query opens a fresh one.
+    Call with close=False in a forked child (gunicorn post_fork): the
+    connections inherited from the parent are then forgotten rather than
+    closed, which would shut the parent's sockets too.
+    Args:
+        close (bool): Close pooled connections instead of discarding them.
+    """
+        if self.__session is not None:
+            self.__session.remove()
+        self.__engine.dispose(close=close)
+
+    def pool_stats(self):
+        """
+    Describe the engine connection pool of this process.
+    Returns:
+        A dict with the pool size, idle and in-use connections, and the
+        current overflow (negative while the pool is not yet full).
+    """
+        pool = self.__engine.pool
+        stats = {'class': type(pool).__name__}
+        for key in ('size', 'checkedin', 'checkedout', 'overflow'):
+            if hasattr(pool, key):
+                stats[key] = getattr(pool, key)()
+        return stats
 
-    def get(self, cls, id):
-        """Get object by class and id"""
+    def get(self, cls, id, options=None):
+        """
+    Get object by class (or class name) and id.
+    The request's session is the identity map: an object already loaded
+    in this request is returned without a query. With
+    HBNB_ENTITY_CACHE_TTL set, State and Amenity lookups are also served
+    across requests from a read-through cache dropped on commit.
+    Args:
+        options (list): Loader options for this lookup, e.g.
+            [joinedload(State.cities)] for a view that walks the cities.
+    """
         if cls and id:
             if isinstance(cls, str):
-                cls = eval(cls)
-            obj = self.__session.get(cls, id)
-            return obj
+                cls = classes.get(cls)
+                if cls is None:
+                    return None
+            if (options or self.entity_cache_ttl <= 0
+                    or cls not in CACHED_CLASSES):
+                return self.__session.get(cls, id, options=options)
+            return self.__cached_get(cls, id)
         return None
 
+    def __cached_get(self, cls, id):
+        """session.get() backed by the cross-request entity cache"""
+        key = (cls.__name__, id)
+        mapper = cls.__mapper__
+        identity = mapper.identity_key_from_primary_key([id])
+        obj = self.__session.identity_map.get(identity)
+        if obj is not None:
+            return obj
+        now = time.monotonic()
+        entry = self.__entities.get(key)
+        if entry is not None and entry[0] > now:
+            obj = mapper.class_manager.new_instance()
+            for name, value in entry[1].items():
+                setattr(obj, name, value)
+            make_transient_to_detached(obj)
+            self.__session.add(obj)
+            return obj
+
+        generation = self.__generation
+        obj = self.__session.get(cls, id)
+        if obj is not None:
+            values = {attr.key: getattr(obj, attr.key)
+                      for attr in mapper.column_attrs}
+            with self.__entities_lock:
+                # Skip the store if a commit invalidated entries meanwhile
+                if generation == self.__generation:
+                    self.__entities[key] = (now + self.entity_cache_ttl,
+                                            values)
+        return obj
+
+    def __collect_stale(self, session, flush_context):
+        """Remember cached-class objects written by this flush"""
+        stale = session.info.setdefault('stale_entities', set())
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, CACHED_CLASSES):
+                stale.add((type(obj).__name__, obj.id))
+
+    def __collect_bulk(self, context):
+        """Bulk query writes bypass the flush: forget everything on commit"""
+        context.session.info['stale_all'] = True
+
+    def __collect_statement(self, orm_execute_state):
+        """UPDATE/DELETE statements (e.g. bulk_update) also bypass it"""
+        state = orm_execute_state
+        if ((state.is_update or state.is_delete) and state.bind_mapper
+                and issubclass(state.bind_mapper.class_, CACHED_CLASSES)):
+            state.session.info['stale_all'] = True
+
+    def __invalidate_entities(self, session):
+        """Drop cache entries for objects this commit wrote"""
+        stale = session.info.pop('stale_entities', None)
+        stale_all = session.info.pop('stale_all', False)
+        if stale or stale_all:
+            with self.__entities_lock:
+                self.__generation += 1
+                if stale_all:
+                    self.__entities.clear()
+                for key in stale or ():
+                    self.__entities.pop(key, None)
+
+    def existing_ids(self, cls, ids):
+        """
+    Check many ids at once.
+    Args:
+        cls (class): The class to look in.
+        ids (iterable): Candidate ids; non-string values are skipped.
+    Returns:
+        The set of ids that have a cls row, found with one query.
+    """
+        ids = [obj_id for obj_id in ids if isinstance(obj_id, str)]
+        if not ids:
+            return set()
+        return set(self.__session.scalars(
+            select(cls.id).where(cls.id.in_(ids))))
+
+    def bulk_new(self, objs):
+        """
+    Queue objects for bulk_save(). They never enter the session: no
+    identity map entry, no change tracking and no per-object INSERT.
+    Args:
+        objs (iterable): New model objects, of any classes.
+    """
+        self.__session.info.setdefault('bulk_new', []).extend(objs)
+
+    def bulk_save(self):
+        """
+    Insert every object queued by bulk_new() with one executemany
+    INSERT per table, parent tables first, and commit them together
+    with anything else pending in the session.
+    Returns:
+        The number of objects inserted.
+    """
+        pending = self.__session.info.pop('bulk_new', [])
+        by_table = {}
+        for obj in pending:
+            by_table.setdefault(type(obj).__table__, []).append(obj)
+        try:
+            # Pending parents first: bulk_insert() does not autoflush
+            self.__session.flush()
+            for table in Base.metadata.sorted_tables:
+                objs = by_table.get(table)
+                if objs:
+                    self.bulk_insert(type(objs[0]), [
+                        obj.__dict__ for obj in objs])
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        return len(pending)
+
+    def bulk_insert(self, cls, rows):
+        """
+    Insert rows into the cls table with one executemany INSERT, with
+    autoflush off so nothing pending in the session is written first.
+    Every row gets every column, unset ones their scalar default, so
+    the batch is never split by differing keys. Commit with save().
+    Args:
+        cls (class): The class whose table receives the rows.
+        rows (list): Mappings of column name to value; other keys are
+            ignored.
+    """
+        defaults = {}
+        for column in cls.__table__.columns:
+            default = column.default
+            defaults[column.key] = (default.arg if default is not None
+                                    and default.is_scalar else None)
+        with self.__session.no_autoflush:
+            self.__session.execute(insert(cls), [
+                {key: row.get(key, default)
+                 for key, default in defaults.items()} for row in rows])
+
+    def bulk_update(self, cls, rows):
+        """
+    Update many cls rows with one executemany UPDATE by primary key.
+    Rows may set different columns: the statement then sets each
+    column any row names to CASE WHEN <row sets it> THEN <value> ELSE
+    <column> END, since the ORM would issue one UPDATE per key set.
+    Objects of cls already loaded in the session are not refreshed.
+    Commit with save().
+    Args:
+        cls (class): The class to update.
+        rows (list): Dicts holding the id and the columns to set.
+    """
+        if not rows:
+            return
+        keys = set(rows[0])
+        if all(row.keys() == keys for row in rows):
+            self.__session.execute(update(cls), rows)
+            return
+        columns = cls.__mapper__.columns
+        names = sorted({key for row in rows for key in row} - {'id'})
+        stmt = update(cls).where(cls.id == bindparam('_id')).values({
+            name: case((bindparam(f'_set_{name}', type_=Boolean),
+                        bindparam(f'_new_{name}', type_=columns[name].type)),
+                       else_=getattr(cls, name))
+            for name in names})
+        params = []
+        for row in rows:
+            values = {'_id': row['id']}
+            for name in names:
+                values[f'_set_{name}'] = name in row
+                values[f'_new_{name}'] = row.get(name)
+            params.append(values)
+        self.__session.execute(stmt, params, execution_options={
+            'synchronize_session': False, 'dml_strategy': 'core_only'})
+
+    def bulk_delete(self, cls, ids):
+        """
+    Delete cls rows by id with one DELETE ... IN per table, first
+    deleting what the ORM would cascade to: rows of delete-cascading
+    one-to-many relationships and many-to-many link rows.
+    Commit with save().
+    Args:
+        cls (class): The class to delete from.
+        ids (list): Ids of the rows to delete.
+    Returns:
+        The number of cls rows deleted.
+    """
+        if not ids:
+            return 0
+        for rel in cls.__mapper__.relationships:
+            if rel.secondary is not None:
+                for _, link_column in rel.synchronize_pairs:
+                    self.__session.execute(delete(rel.secondary).where(
+                        link_column.in_(ids)))
+            elif rel.direction is ONETOMANY and rel.cascade.delete:
+                child = rel.mapper.class_
+                _, fk_column = rel.synchronize_pairs[0]
+                child_ids = self.__session.scalars(
+                    select(child.id).where(fk_column.in_(ids))).all()
+                self.bulk_delete(child, child_ids)
+        # The ids are known: drop their objects from the session here
+        # rather than have 'fetch' SELECT them first where the dialect
+        # (MySQL) has no DELETE ... RETURNING
+        result = self.__session.execute(
+            delete(cls).where(cls.id.in_(ids)),
+            execution_options={'synchronize_session': False})
+        identity_map = self.__session.identity_map
+        for obj_id in ids:
+            obj = identity_map.get(
+                cls.__mapper__.identity_key_from_primary_key([obj_id]))
+            if obj is not None:
+                self.__session.expunge(obj)
+        return result.rowcount
+
+    def page(self, cls, limit, after=None, columns=None, **filters):
+        """
+    Fetch one page of cls ordered by (created_at, id).
+    Args:
+        cls (class): The class to query.
+        limit (int): Maximum number of objects to return.
+        after (tuple): (created_at, id) of the last object already seen.
+        columns (list): Column names to select instead of whole objects;
+            rows then come back as plain named tuples, with no ORM
+            instance built or tracked. id and created_at are always
+            selected, for the cursor.
+        filters: Column equality filters, e.g. city_id=...
+    Returns:
+        (objects or rows, next_after) where next_after is the
+        (created_at, id) to resume from, or None on the last page.
+    """
+        if columns is not None:
+            stmt = self.__keyset(self.__projection(cls, columns).filter_by(
+                **filters), cls, after).limit(limit + 1)
+            rows = self.__session.execute(stmt).all()
+            next_after = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_after = (rows[-1].created_at, rows[-1].id)
+            return rows, next_after
+
+        query = self.__session.query(cls, cls.created_at).filter_by(**filters)
+        query = self.__keyset(query, cls, after)
+        rows = query.limit(limit + 1).all()
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            # Take created_at from the row, not the (possibly more
+            # precise) in-memory attribute, so the cursor matches the DB
+            next_after = (rows[-1][1], rows[-1][0].id)
+        return [obj for obj, _ in rows], next_after
+
+    def iterate(self, cls, after=None, batch_size=1000, columns=None,
+                **filters):
+        """
+    Yield every cls object ordered by (created_at, id) without loading
+    them all at once: rows come from a server-side cursor in batches of
+    batch_size, and each object leaves the session once the caller
+    moves on, so memory stays bounded by one batch.
+    Args:
+        cls (class): The class to query.
+        after (tuple): Optional (created_at, id) to resume after.
+        batch_size (int): Rows fetched per round trip.
+        columns (list): Column names to yield as named tuples instead
+            of objects, as in page().
+        filters: Column equality filters, e.g. place_id=...
+    """
+        if columns is not None:
+            stmt = self.__keyset(self.__projection(cls, columns).filter_by(
+                **filters), cls, after)
+            yield from self.__session.execute(
+                stmt, execution_options={'yield_per': batch_size})
+            return
+        stmt = self.__keyset(select(cls).filter_by(**filters), cls, after)
+        for obj in self.__session.scalars(
+                stmt, execution_options={'yield_per': batch_size}):
+            yield obj
+            self.__session.expunge(obj)
+
+    @staticmethod
+    def __projection(cls, columns):
+        """Select columns of cls, plus the keyset columns if missing"""
+        names = list(columns)
+        names += [name for name in ('id', 'created_at') if name not in names]
+        return select(*[getattr(cls, name) for name in names])
+
+    @staticmethod
+    def __keyset(query, cls, after):
+        """Order a query or select by (created_at, id) and seek past after"""
+        if after is not None:
+            created_at, obj_id = after
+            query = query.filter(or_(
+                cls.created_at > created_at,
+                and_(cls.created_at == created_at, cls.id > obj_id)))
+        return query.order_by(cls.created_at, cls.id)
+
     def count(self, cls=None):
-        """Count objects"""
-        return len(self.all(cls))
+        """Count objects of cls (a class or class name), or of every class"""
+        if cls is None:
+            return sum(self.count_all().values())
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+            if cls is None:
+                return 0
+        return self.__session.query(func.count(cls.id)).scalar()
+
+    def count_all(self):
+        """
+    Count the rows of every class in a single SELECT.
+    With HBNB_COUNTS_TTL set, the result is reused for that many seconds
+    or until this storage commits, whichever comes first.
+    Returns:
+        A dict mapping class name to count.
+    """
+        now = time.monotonic()
+        if (self.__counts is not None
+                and now - self.__counts_at < self.counts_ttl):
+            return dict(self.__counts)
+        row = self.__session.execute(select(*[
+            select(func.count(cls.id)).scalar_subquery().label(name)
+            for name, cls in classes.items()
+        ])).one()
+        counts = dict(row._mapping)
+        if self.counts_ttl > 0:
+            self.__counts, self.__counts_at = counts, now
+        return dict(counts)
+
+    def __invalidate_counts(self, session):
+        """Drop cached counts after a commit"""
+        self.__counts = None
 
     def delete_all(self):
         """Delete all objects in the correct order"""
@@ -133,3 +536,87 @@ class DBStorage:
         except Exception as e:
             self.__session.rollback()
             raise e
+
+    def places_nearby(self, lat, lon, radius_km, limit=20, offset=0):
+        """
+    Find places within radius_km of (lat, lon), nearest first.
+    A latitude/longitude bounding box (served by the
+    ix_places_latitude_longitude index) narrows the rows before the
+    exact haversine distance is computed.
+    Args:
+        lat, lon (float): Search point in degrees.
+        radius_km (float): Search radius in kilometres.
+        limit, offset (int): Page of results to return.
+    Returns:
+        (total, [(place, distance_km), ...]) for the requested page.
+    """
+        dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+        filters = [Place.latitude.between(lat - dlat, lat + dlat)]
+        cos_edge = math.cos(math.radians(min(abs(lat) + dlat, 90)))
+        if cos_edge > 1e-9:
+            dlon = math.degrees(radius_km / (EARTH_RADIUS_KM * cos_edge))
+            if dlon < 180:
+                low, high = lon - dlon, lon + dlon
+                if low < -180:
+                    filters.append(or_(Place.longitude >= low + 360,
+                                       Place.longitude <= high))
+                elif high > 180:
+                    filters.append(or_(Place.longitude >= low,
+                                       Place.longitude <= high - 360))
+                else:
+                    filters.append(Place.longitude.between(low, high))
+
+        a = (func.pow(func.sin(func.radians(Place.latitude - lat) / 2), 2) +
+             math.cos(math.radians(lat)) *
+             func.cos(func.radians(Place.latitude)) *
+             func.pow(func.sin(func.radians(Place.longitude - lon) / 2), 2))
+        # Clamp rounding overshoot; CASE rather than MySQL's LEAST()
+        distance = 2 * EARTH_RADIUS_KM * func.asin(
+            func.sqrt(case((a > 1.0, 1.0), else_=a)))
+        matches = self.__session.query(
+            Place.id.label('id'), distance.label('distance')
+        ).filter(*filters).subquery()
+        within = matches.c.distance <= radius_km
+
+        total = self.__session.query(func.count()).select_from(
+            matches).filter(within).scalar()
+        rows = self.__session.query(Place, matches.c.distance).join(
+            matches, Place.id == matches.c.id
+        ).filter(within).order_by(
+            matches.c.distance, Place.id).offset(offset).limit(limit).all()
+        return total, [(place, dist) for place, dist in rows]
+
+    def search_places(self, states=None, cities=None, amenities=None,
+                      limit=None, offset=0):
+        """
+    Search places in one SQL statement.
+    Args:
+        states (list): State ids; places must be in one of their cities.
+        cities (list): City ids; places must be in one of them.
+        amenities (list): Amenity ids; places must have every existing
+            amenity among them (unknown ids are ignored).
+        limit, offset (int): Optional page, ordered by (created_at, id).
+    Returns:
+        A list of Place objects.
+    """
+        query = self.__session.query(Place)
+        if states:
+            query = query.filter(Place.city_id.in_(
+                select(City.id).where(City.state_id.in_(states))))
+        if cities:
+            query = query.filter(Place.city_id.in_(cities))
+        if amenities:
+            link = Place.place_amenity
+            # No requested amenity may be missing from the place
+            missing = select(Amenity.id).where(
+                Amenity.id.in_(amenities),
+                ~exists().where(link.c.place_id == Place.id,
+                                link.c.amenity_id == Amenity.id
+                                ).correlate_except(link))
+            query = query.filter(~missing.exists())
+        query = query.order_by(Place.created_at, Place.id)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Convert id columns between VARCHAR(60) text and BINARY(16).
+
+Every primary and foreign key column is rewritten in place with MySQL 8's
+UUID_TO_BIN / BIN_TO_UUID; foreign keys are dropped first and restored
+afterwards. MySQL commits each ALTER on its own, so take a backup and
+stop the API before running:
+    python3 -m models.engine.migrate_ids --to binary   # then HBNB_BINARY_IDS=1
+    python3 -m models.engine.migrate_ids --to text     # roll back
+"""
+import argparse
+import sys
+from sqlalchemy import inspect
+from models.base_model import Base
+
+UUID_PATTERN = ('^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+                '[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+
+def id_columns():
+    """Map each table to its primary and foreign key column names"""
+    return {table.name: [c.name for c in table.columns
+                         if c.primary_key or c.foreign_keys]
+            for table in Base.metadata.sorted_tables}
+
+
+def invalid_ids(conn, columns):
+    """Count text ids that UUID_TO_BIN would reject, per table.column"""
+    bad = {}
+    for table, names in columns.items():
+        for name in names:
+            count = conn.exec_driver_sql(
+                f"SELECT COUNT(*) FROM `{table}` "
+                f"WHERE `{name}` NOT REGEXP %s", (UUID_PATTERN,)).scalar()
+            if count:
+                bad[f"{table}.{name}"] = count
+    return bad
+
+
+def migrate(engine, to):
+    """Rewrite every id column to BINARY(16) (to='binary') or back"""
+    if engine.dialect.name != 'mysql':
+        raise NotImplementedError("id migration requires MySQL 8")
+    columns = id_columns()
+    inspector = inspect(engine)
+    foreign_keys = {table: inspector.get_foreign_keys(table)
+                    for table in columns}
+    with engine.connect() as conn:
+        if to == 'binary':
+            bad = invalid_ids(conn, columns)
+            if bad:
+                raise ValueError(f"ids that are not UUIDs: {bad}")
+
+        for table, fks in foreign_keys.items():
+            for fk in fks:
+                conn.exec_driver_sql(
+                    f"ALTER TABLE `{table}` DROP FOREIGN KEY `{fk['name']}`")
+
+        convert, final = (('UUID_TO_BIN', 'BINARY(16)') if to == 'binary'
+                          else ('BIN_TO_UUID', 'VARCHAR(60)'))
+        for table, names in columns.items():
+            for name in names:
+                conn.exec_driver_sql(f"ALTER TABLE `{table}` MODIFY `{name}` "
+                                     "VARBINARY(60) NOT NULL")
+                conn.exec_driver_sql(f"UPDATE `{table}` "
+                                     f"SET `{name}` = {convert}(`{name}`)")
+                conn.exec_driver_sql(f"ALTER TABLE `{table}` MODIFY `{name}` "
+                                     f"{final} NOT NULL")
+                conn.commit()
+
+        for table, fks in foreign_keys.items():
+            for fk in fks:
+                local = ', '.join(f"`{c}`" for c in fk['constrained_columns'])
+                remote = ', '.join(f"`{c}`" for c in fk['referred_columns'])
+                ondelete = fk.get('options', {}).get('ondelete')
+                conn.exec_driver_sql(
+                    f"ALTER TABLE `{table}` ADD CONSTRAINT `{fk['name']}` "
+                    f"FOREIGN KEY ({local}) REFERENCES "
+                    f"`{fk['referred_table']}` ({remote})"
+                    + (f" ON DELETE {ondelete}" if ondelete else ""))
+        conn.commit()
+
+
+def main():
+    """Run the migration on the configured database"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--to', choices=('binary', 'text'), required=True)
+    args = parser.parse_args()
+
+    from models import storage
+    migrate(storage._DBStorage__engine, args.to)
+    print(f"id columns converted to {args.to}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
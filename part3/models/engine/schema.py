@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+"""
+Schema checks: missing relationship indexes and full table scans.
+
+Usage:
+    python3 -m models.engine.schema            # report, exit 1 if gaps
+    python3 -m models.engine.schema --create   # also create model indexes
+"""
+import argparse
+import sys
+from sqlalchemy import inspect
+from models.base_model import Base
+
+
+def _covers(index_columns, columns):
+    """True if an index on index_columns can serve lookups on columns"""
+    return list(index_columns[:len(columns)]) == list(columns)
+
+
+def missing_relationship_indexes(engine=None):
+    """
+    Find foreign keys with no index starting with their columns.
+    Args:
+        engine: Check the live database; without it the model
+            metadata is checked instead.
+    Returns:
+        A list of (table, columns, referred_table) tuples.
+    """
+    inspector = inspect(engine) if engine is not None else None
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if inspector is not None:
+            indexed = [i['column_names'] for i in
+                       inspector.get_indexes(table.name)]
+            indexed += [u['column_names'] for u in
+                        inspector.get_unique_constraints(table.name)]
+            indexed.append(
+                inspector.get_pk_constraint(table.name)['constrained_columns'])
+            foreign_keys = [(fk['constrained_columns'], fk['referred_table'])
+                            for fk in inspector.get_foreign_keys(table.name)]
+        else:
+            indexed = [[c.name for c in i.columns] for i in table.indexes]
+            indexed.append([c.name for c in table.primary_key.columns])
+            foreign_keys = [([c.name for c in fk.columns],
+                             fk.referred_table.name)
+                            for fk in table.foreign_key_constraints]
+        for columns, referred in foreign_keys:
+            if not any(_covers(i, columns) for i in indexed):
+                missing.append((table.name, tuple(columns), referred))
+    return missing
+
+
+def missing_model_indexes(engine):
+    """Indexes declared on the models but absent from the database"""
+    inspector = inspect(engine)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        existing = {i['name'] for i in inspector.get_indexes(table.name)}
+        missing += [i for i in table.indexes if i.name not in existing]
+    return missing
+
+
+def full_scans(connection, statement, parameters=()):
+    """
+    EXPLAIN a statement and list the tables it reads with a full scan.
+    Args:
+        connection: A SQLAlchemy Connection.
+        statement (str), parameters: As seen by the DBAPI cursor.
+    Returns:
+        A list of table names read without any index.
+    """
+    tables = set(Base.metadata.tables)
+    dialect = connection.dialect.name
+    scans = []
+    if dialect == 'mysql':
+        result = connection.exec_driver_sql('EXPLAIN ' + statement,
+                                            parameters)
+        for row in result.mappings():
+            if row['type'] == 'ALL' and row['table'] in tables:
+                scans.append(row['table'])
+    elif dialect == 'sqlite':
+        result = connection.exec_driver_sql(
+            'EXPLAIN QUERY PLAN ' + statement, parameters)
+        for row in result:
+            words = row[-1].split()
+            if (len(words) == 2 and words[0] == 'SCAN'
+                    and words[1] in tables):
+                scans.append(words[1])
+    else:
+        raise NotImplementedError(f"EXPLAIN is not supported for {dialect}")
+    return scans
+
+
+def main():
+    """Report schema gaps on the configured database"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--create', action='store_true',
+                        help='create the indexes declared on the models')
+    args = parser.parse_args()
+
+    from models import storage
+    engine = storage._DBStorage__engine
+    for index in missing_model_indexes(engine):
+        columns = ', '.join(c.name for c in index.columns)
+        if args.create:
+            index.create(engine)
+            print(f"created {index.name} on {index.table.name}({columns})")
+        else:
+            print(f"missing model index {index.name} on "
+                  f"{index.table.name}({columns})")
+    gaps = missing_relationship_indexes(engine)
+    for table, columns, referred in gaps:
+        print(f"no index on {table}({', '.join(columns)}) "
+              f"for its foreign key to {referred}")
+    return 1 if gaps or missing_model_indexes(engine) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+Identifier column type and generator.
+
+Ids are UUID strings everywhere in Python and in the API. By default
+they are stored as VARCHAR(60) text; with HBNB_BINARY_IDS=1 every
+primary and foreign key column is BINARY(16) instead, which shrinks the
+InnoDB clustered index and every secondary index that repeats the key.
+New ids are UUIDv7: their leading bits are a millisecond timestamp, so
+inserts land at the end of the primary key instead of splitting random
+pages.
+"""
+import os
+import time
+import uuid
+from sqlalchemy import String
+from sqlalchemy.types import BINARY, TypeDecorator
+
+BINARY_IDS = os.getenv('HBNB_BINARY_IDS', '').lower() in ('1', 'true')
+
+
+def uuid7():
+    """Return a time-ordered version 7 UUID (RFC 9562)"""
+    value = (time.time_ns() // 1000000) << 80
+    value |= int.from_bytes(os.urandom(10), 'big') & ((1 << 80) - 1)
+    value &= ~(0xf << 76)
+    value |= 0x7 << 76
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+def new_id():
+    """Return a new object id as a string"""
+    return str(uuid7())
+
+
+class BinaryUUID(TypeDecorator):
+    """UUID strings in Python, 16 raw bytes in the database"""
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """Pack a UUID string; a malformed id binds NULL, matching nothing"""
+        if value is None or isinstance(value, bytes):
+            return value
+        try:
+            return uuid.UUID(str(value)).bytes
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        """Unpack the stored bytes back into the canonical string"""
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+def id_type():
+    """Column type for primary and foreign keys"""
+    return BinaryUUID() if BINARY_IDS else String(60)
@@ -1,16 +1,24 @@
 #!/usr/bin/python3
 """Place Model Module"""
 from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Table
+from models.id_type import id_type
+from sqlalchemy import (Column, String, Integer, Float, ForeignKey, Table,
+                        Index)
 from sqlalchemy.orm import relationship, backref
 
 
 class Place(BaseModel, Base):
     """Place Model"""
     __tablename__ = 'places'
+    __table_args__ = (
+        # Serves city_id lookups and the per-city keyset pagination order
+        Index('ix_places_city_id_created_at', 'city_id', 'created_at', 'id'),
+        Index('ix_places_latitude_longitude', 'latitude', 'longitude'),
+    )
 
-    city_id = Column(String(60), ForeignKey('cities.id'), nullable=False)
-    user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
+    city_id = Column(id_type(), ForeignKey('cities.id'), nullable=False)
+    user_id = Column(id_type(), ForeignKey('users.id'), nullable=False,
+                     index=True)
     name = Column(String(128), nullable=False)
     description = Column(String(1024))
     number_rooms = Column(Integer, default=0)
@@ -26,7 +34,7 @@ class Place(BaseModel, Base):
         Base.metadata,
         Column(
             'place_id',
-            String(60),
+            id_type(),
             ForeignKey(
                 'places.id',
                 ondelete='CASCADE'),
@@ -34,12 +42,14 @@ class Place(BaseModel, Base):
             nullable=False),
         Column(
             'amenity_id',
-            String(60),
+            id_type(),
             ForeignKey(
                 'amenities.id',
                 ondelete='CASCADE'),
             primary_key=True,
-            nullable=False))
+            nullable=False),
+        # The primary key covers place_id lookups; Amenity.places needs this
+        Index('ix_place_amenity_amenity_id', 'amenity_id'))
 
     amenities = relationship(
         "Amenity",
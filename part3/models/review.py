@@ -1,14 +1,22 @@
 #!/usr/bin/python3
 """Review Model Module"""
 from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String, ForeignKey
+from models.id_type import id_type
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 
 class Review(BaseModel, Base):
     """Review Class"""
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # Serves place_id lookups and the per-place keyset pagination order
+        Index('ix_reviews_place_id_created_at',
+              'place_id', 'created_at', 'id'),
+        Index('ix_reviews_created_at', 'created_at', 'id'),
+    )
 
     text = Column(String(1024), nullable=False)
-    place_id = Column(String(60), ForeignKey('places.id'), nullable=False)
-    user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
+    place_id = Column(id_type(), ForeignKey('places.id'), nullable=False)
+    user_id = Column(id_type(), ForeignKey('users.id'), nullable=False,
+                     index=True)
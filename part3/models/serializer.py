@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+"""
+Per-model JSON serializers.
+
+The first time a model class is serialized, a function is generated from
+its column list that writes the object's JSON straight from its
+__dict__, skipping the to_dict() copy and a second walk by the JSON
+encoder. The output matches jsonify(obj.to_dict()): the same keys,
+sorted, with ISO 8601 datetimes, except that columns a model lists in
+hidden_columns (the user's password hash) are never written. Attributes
+that were never loaded are left out, as to_dict() does.
+
+row_serializer() does the same for the named tuples DBStorage returns
+when a listing selects only public_columns(cls).
+
+orjson is used when it is installed (set HBNB_JSON_BACKEND=json to turn
+it off); otherwise values go through the standard library's C string
+encoder.
+"""
+import json
+from datetime import datetime
+from json.encoder import encode_basestring_ascii
+from os import getenv
+from sqlalchemy import inspect
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson and getenv(
+    'HBNB_JSON_BACKEND', 'orjson') == 'orjson' else 'json'
+
+# Encoders by value type for the standard library backend
+_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: lambda v: 'true' if v else 'false',
+    type(None): lambda v: 'null',
+    datetime: lambda v: '"' + v.isoformat() + '"',
+}
+
+_serializers = {}
+
+
+def public_columns(cls):
+    """Column attribute names of cls that may leave the API"""
+    hidden = getattr(cls, 'hidden_columns', ())
+    return tuple(attr.key for attr in inspect(cls).column_attrs
+                 if attr.key not in hidden)
+
+
+def _slow(cls, values, fields):
+    """Encode whatever of fields values (a mapping) has, via json.dumps"""
+    result = {'__class__': cls.__name__}
+    for name in fields:
+        if name in values:
+            value = values[name]
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            result[name] = value
+    return json.dumps(result, sort_keys=True, separators=(',', ':'),
+                      default=str).encode()
+
+
+def _compile(cls, columns=None):
+    """
+    Generate a serializer for cls objects, or, given columns, for rows
+    holding those columns in that order
+    """
+    fields = list(columns or public_columns(cls))
+    keys = sorted(fields + ['__class__'])
+    if columns is None:
+        read = '{!r}'.format
+        prologue, values = 'd = obj.__dict__', 'obj.__dict__'
+    else:
+        read = {name: i for i, name in enumerate(fields)}.__getitem__
+        prologue, values = 'd = obj', 'obj._mapping'
+    if BACKEND == 'orjson':
+        items = [f'"__class__": {cls.__name__!r}' if key == '__class__'
+                 else f'{key!r}: d[{read(key)}]' for key in keys]
+        body = f"_dumps({{{', '.join(items)}}})"
+        namespace = {'_dumps': orjson.dumps}
+    else:
+        parts = []
+        for i, key in enumerate(keys):
+            prefix = ('{' if i == 0 else ',') + json.dumps(key) + ':'
+            if key == '__class__':
+                parts.append(repr(prefix + json.dumps(cls.__name__)))
+            else:
+                parts.append(f'{prefix!r}')
+                parts.append(f'_e[(v := d[{read(key)}]).__class__](v)')
+        parts.append("'}'")
+        body = f"''.join(({', '.join(parts)})).encode()"
+        namespace = {'_e': _ENCODERS}
+    source = (f"def serialize(obj):\n"
+              f"    {prologue}\n"
+              f"    try:\n"
+              f"        return {body}\n"
+              f"    except (KeyError, TypeError):\n"
+              f"        return _slow(_cls, {values}, _fields)\n")
+    namespace.update(_slow=_slow, _cls=cls, _fields=fields)
+    exec(compile(source, f'<serializer {cls.__name__}>', 'exec'), namespace)
+    return namespace['serialize']
+
+
+def serializer(cls):
+    """Return the generated serializer for cls, building it once"""
+    func = _serializers.get(cls)
+    if func is None:
+        func = _serializers[cls] = _compile(cls)
+    return func
+
+
+def row_serializer(cls, columns):
+    """Return the generated serializer for rows of cls columns"""
+    key = (cls, tuple(columns))
+    func = _serializers.get(key)
+    if func is None:
+        func = _serializers[key] = _compile(cls, key[1])
+    return func
+
+
+def dumps(obj):
+    """JSON bytes for one model object"""
+    return serializer(type(obj))(obj)
+
+
+def dumps_list(objs):
+    """JSON bytes for a list of model objects"""
+    return b'[' + b','.join(serializer(type(obj))(obj) for obj in objs) + \
+        b']'
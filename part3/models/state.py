@@ -1,15 +1,16 @@
 #!/usr/bin/python3
 """State Model Module"""
 from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.orm import relationship
 
 
 class State(BaseModel, Base):
     """State Class"""
     __tablename__ = 'states'
+    __table_args__ = (Index('ix_states_created_at', 'created_at', 'id'),)
 
-    name = Column(String(128), nullable=False)
+    name = Column(String(128), nullable=False, index=True)
     cities = relationship(
         "City",
         backref="state",
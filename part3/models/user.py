@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 """User Model Module"""
 from models.base_model import BaseModel, Base
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.orm import relationship
 from hashlib import md5
 import re
@@ -10,7 +10,10 @@ import re
 class User(BaseModel, Base):
     """Representation of a User."""
     __tablename__ = 'users'
-    email = Column(String(128), nullable=False)
+    __table_args__ = (Index('ix_users_created_at', 'created_at', 'id'),)
+    # Never written out by the API serializers
+    hidden_columns = ('password',)
+    email = Column(String(128), nullable=False, index=True)
     password = Column(String(128), nullable=False)
     first_name = Column(String(128), nullable=True)
     last_name = Column(String(128), nullable=True)
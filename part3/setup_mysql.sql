@@ -23,14 +23,17 @@ CREATE TABLE IF NOT EXISTS users (
     first_name VARCHAR(128),
     last_name VARCHAR(128),
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_users_email (email),
+    INDEX ix_users_created_at (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS amenities (
     id VARCHAR(60) NOT NULL PRIMARY KEY,
     name VARCHAR(128) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_amenities_created_at (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS cities (
@@ -38,7 +41,8 @@ CREATE TABLE IF NOT EXISTS cities (
     name VARCHAR(128) NOT NULL,
     state_id VARCHAR(60) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_cities_state_id (state_id)
 );
 
 CREATE TABLE IF NOT EXISTS places (
@@ -54,14 +58,19 @@ CREATE TABLE IF NOT EXISTS places (
     latitude FLOAT(10, 6) NOT NULL,
     longitude FLOAT(10, 6) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_places_city_id_created_at (city_id, created_at, id),
+    INDEX ix_places_user_id (user_id),
+    INDEX ix_places_latitude_longitude (latitude, longitude)
 );
 
 CREATE TABLE IF NOT EXISTS states (
     id VARCHAR(60) NOT NULL PRIMARY KEY,
     name VARCHAR(128) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_states_name (name),
+    INDEX ix_states_created_at (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS reviews (
@@ -70,7 +79,10 @@ CREATE TABLE IF NOT EXISTS reviews (
     user_id VARCHAR(60) NOT NULL,
     place_id VARCHAR(60) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_reviews_place_id_created_at (place_id, created_at, id),
+    INDEX ix_reviews_user_id (user_id),
+    INDEX ix_reviews_created_at (created_at, id)
 );
 
 -- Création de la base de données de test
@@ -96,14 +108,17 @@ CREATE TABLE IF NOT EXISTS users (
     first_name VARCHAR(128),
     last_name VARCHAR(128),
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_users_email (email),
+    INDEX ix_users_created_at (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS amenities (
     id VARCHAR(60) NOT NULL PRIMARY KEY,
     name VARCHAR(128) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_amenities_created_at (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS cities (
@@ -111,7 +126,8 @@ CREATE TABLE IF NOT EXISTS cities (
     name VARCHAR(128) NOT NULL,
     state_id VARCHAR(60) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_cities_state_id (state_id)
 );
 
 CREATE TABLE IF NOT EXISTS places (
@@ -127,14 +143,19 @@ CREATE TABLE IF NOT EXISTS places (
     latitude FLOAT(10, 6) NOT NULL,
     longitude FLOAT(10, 6) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_places_city_id_created_at (city_id, created_at, id),
+    INDEX ix_places_user_id (user_id),
+    INDEX ix_places_latitude_longitude (latitude, longitude)
 );
 
 CREATE TABLE IF NOT EXISTS states (
     id VARCHAR(60) NOT NULL PRIMARY KEY,
     name VARCHAR(128) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_states_name (name),
+    INDEX ix_states_created_at (created_at, id)
 );
 
 CREATE TABLE IF NOT EXISTS reviews (
@@ -143,5 +164,8 @@ CREATE TABLE IF NOT EXISTS reviews (
     user_id VARCHAR(60) NOT NULL,
     place_id VARCHAR(60) NOT NULL,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    INDEX ix_reviews_place_id_created_at (place_id, created_at, id),
+    INDEX ix_reviews_user_id (user_id),
+    INDEX ix_reviews_created_at (created_at, id)
 );
\ No newline at end of file
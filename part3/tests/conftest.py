@@ -2,6 +2,9 @@ import pytest
 from api.v1.app import app
 from models import storage
 
+# Views over their SQL statement budget fail the test instead of logging
+app.config['QUERY_BUDGET_STRICT'] = True
+
 @pytest.fixture
 def client():
     """Provide a Flask test client."""
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""Tests for per-request SQL statement budgets"""
+import unittest
+from api.v1.app import create_app
+from api.v1.query_budget import QueryBudgetExceeded, query_budget
+from models import storage
+from models.city import City
+from models.state import State
+
+
+class TestQueryBudget(unittest.TestCase):
+    """Test cases for statement counting and budgets"""
+
+    def setUp(self):
+        """Build an app with a view that issues two statements"""
+        self.app = create_app()
+
+        @self.app.route('/two_queries')
+        @query_budget(1)
+        def two_queries():
+            storage.count(State)
+            storage.count(City)
+            return {}
+
+        self.client = self.app.test_client()
+
+    def test_over_budget_logs(self):
+        """Test an endpoint over budget logs a warning"""
+        with self.assertLogs('api.v1.query_budget', 'WARNING') as logs:
+            response = self.client.get('/two_queries')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('issued 2 SQL statements, budget is 1',
+                      logs.output[0])
+
+    def test_over_budget_raises_when_strict(self):
+        """Test QUERY_BUDGET_STRICT turns the warning into an error"""
+        self.app.config['QUERY_BUDGET_STRICT'] = True
+        self.app.testing = True
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get('/two_queries')
+
+    def test_cities_of_state_in_one_statement(self):
+        """Test GET /states/<id>/cities joins the cities in"""
+        state = State(name="Budget State")
+        storage.new(state)
+        for i in range(3):
+            storage.new(City(name=f"City {i}", state_id=state.id))
+        storage.save()
+        storage.close()
+
+        self.app.config['QUERY_BUDGET_STRICT'] = True
+        self.app.testing = True
+        response = self.client.get(f'/api/v1/states/{state.id}/cities')
+        self.assertEqual(len(response.json), 3)
+        storage.delete_all()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+"""Tests for the commit-invalidated response cache"""
+import unittest
+from unittest import mock
+from flask import Flask, g
+from api.v1.app import create_app
+from api.v1 import response_cache
+from api.v1.response_cache import LRUBackend, RedisBackend
+from models import storage
+from models.state import State
+
+
+class FakeRedis:
+    """Stand-in for a shared Redis client"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for cached reads and their invalidation"""
+
+    backend = None
+
+    def setUp(self):
+        """Build an app with a fresh cache"""
+        self.app = create_app()
+        response_cache.init_app(self.app, self.make_backend())
+        self.client = self.app.test_client()
+        self.state = State(name="Cached")
+        storage.new(self.state)
+        storage.save()
+
+    def tearDown(self):
+        """Remove the test state"""
+        state = storage.get(State, self.state.id)
+        if state:
+            storage.delete(state)
+            storage.save()
+        storage.close()
+
+    def make_backend(self):
+        """Backend under test"""
+        return LRUBackend(maxsize=16)
+
+    def test_second_read_is_a_hit(self):
+        """Test a repeated GET is served from the cache"""
+        url = f'/api/v1/states/{self.state.id}'
+        first = self.client.get(url)
+        second = self.client.get(url)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(first.get_json(), second.get_json())
+
+    def test_hit_skips_the_database(self):
+        """Test a hit issues no SQL statement"""
+        url = f'/api/v1/states/{self.state.id}'
+        self.client.get(url)
+        with self.client as client:
+            client.get(url)
+            self.assertEqual(g.get('sql_statements', 0), 0)
+
+    def test_commit_invalidates(self):
+        """Test an update through the API is visible on the next read"""
+        url = f'/api/v1/states/{self.state.id}'
+        self.client.get(url)
+        self.client.put(url, json={'name': 'Renamed'})
+        response = self.client.get(url)
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+        self.assertEqual(response.get_json()['name'], 'Renamed')
+
+    def test_list_invalidated_by_new_row(self):
+        """Test a list view sees rows committed after it was cached"""
+        self.client.get('/api/v1/states?limit=1000')
+        state = State(name="Later")
+        storage.new(state)
+        storage.save()
+        try:
+            response = self.client.get('/api/v1/states?limit=1000')
+            self.assertEqual(response.headers['X-Cache'], 'MISS')
+            self.assertIn(state.id,
+                          [s['id'] for s in response.get_json()])
+        finally:
+            storage.delete(state)
+            storage.save()
+
+    def test_bulk_insert_invalidates(self):
+        """Test rows written by bulk_save retire cached lists too"""
+        self.client.get('/api/v1/states?limit=1000')
+        state = State(name="Bulk")
+        storage.bulk_new([state])
+        storage.bulk_save()
+        try:
+            response = self.client.get('/api/v1/states?limit=1000')
+            self.assertEqual(response.headers['X-Cache'], 'MISS')
+        finally:
+            storage.bulk_delete(State, [state.id])
+            storage.save()
+
+    def test_rollback_does_not_invalidate(self):
+        """Test a rolled back write leaves cached entries in place"""
+        url = f'/api/v1/states/{self.state.id}'
+        self.client.get(url)
+        storage.new(State(name="Discarded"))
+        storage.rollback()
+        self.assertEqual(self.client.get(url).headers['X-Cache'], 'HIT')
+
+    def test_not_found_is_not_cached(self):
+        """Test error responses are never stored"""
+        self.client.get('/api/v1/states/nope')
+        response = self.client.get('/api/v1/states/nope')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('X-Cache', response.headers)
+
+
+class TestSharedResponseCache(TestResponseCache):
+    """Same behaviour through the shared backend"""
+
+    def make_backend(self):
+        """Backend under test"""
+        return RedisBackend(FakeRedis())
+
+
+class TestBackendChoice(unittest.TestCase):
+    """Test cases for choosing the backend from the environment"""
+
+    def test_lru_refused_with_several_workers(self):
+        """Test per-process versions are not used by several workers"""
+        with mock.patch.dict('os.environ', {'HBNB_RESPONSE_CACHE': 'lru',
+                                            'HBNB_WORKERS': '4'}):
+            with self.assertRaises(RuntimeError):
+                response_cache.init_app(Flask(__name__))
+
+    def test_lru_with_one_worker(self):
+        """Test a single process may keep its own cache"""
+        app = Flask(__name__)
+        with mock.patch.dict('os.environ', {'HBNB_RESPONSE_CACHE': 'lru',
+                                            'HBNB_WORKERS': '1'}):
+            cache = response_cache.init_app(app)
+        self.assertIsInstance(cache.backend, LRUBackend)
+
+
+class TestLRUBackend(unittest.TestCase):
+    """Test cases for the in-process backend"""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unread entry goes first"""
+        backend = LRUBackend(maxsize=2)
+        backend.set('a', 1, 60)
+        backend.set('b', 2, 60)
+        backend.get('a')
+        backend.set('c', 3, 60)
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('a'), 1)
+
+    def test_expires(self):
+        """Test entries past their ttl are dropped"""
+        backend = LRUBackend()
+        backend.set('a', 1, -1)
+        self.assertIsNone(backend.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
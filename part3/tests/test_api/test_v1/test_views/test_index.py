@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""Tests for index API endpoints"""
+import unittest
+from api.v1.app import app
+from models import storage
+from models.state import State
+
+
+class TestIndexAPI(unittest.TestCase):
+    """Test cases for status and stats"""
+
+    def setUp(self):
+        """Create the test client"""
+        self.client = app.test_client()
+
+    def tearDown(self):
+        """Clean the database after each test"""
+        storage.delete_all()
+
+    def test_status(self):
+        """Test GET /api/v1/status"""
+        response = self.client.get('/api/v1/status')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {"status": "OK"})
+
+    def test_stats(self):
+        """Test GET /api/v1/stats"""
+        before = self.client.get('/api/v1/stats').json
+        self.assertEqual(set(before), {"amenities", "cities", "places",
+                                       "reviews", "states", "users"})
+        storage.new(State(name="Stats State"))
+        storage.save()
+        after = self.client.get('/api/v1/stats').json
+        self.assertEqual(after["states"], before["states"] + 1)
+
+    def test_pool_stats(self):
+        """Test GET /api/v1/stats/pool"""
+        response = self.client.get('/api/v1/stats/pool')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('class', response.json)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,7 +8,11 @@ from models.user import User
 from models.state import State
 from models.city import City
 from models.place import Place
+from models.amenity import Amenity
+from models.review import Review
+from sqlalchemy import event
 import uuid
+from unittest import mock
 
 
 class TestPlaceAPI(unittest.TestCase):
@@ -135,3 +139,233 @@ class TestPlaceAPI(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertIsInstance(response.json, list)
+
+    def search(self, data):
+        """POST data to /api/v1/places_search, return the place names"""
+        response = self.client.post(
+            '/api/v1/places_search',
+            data=json.dumps(data),
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        return [place['name'] for place in response.json]
+
+    def test_places_search_filters(self):
+        """Test places_search state, city and amenity filters"""
+        other_city = City(name="Other City", state_id=self.state_id)
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        other = Place(name="Other Place", user_id=self.user_id,
+                      city_id=other_city.id)
+        for obj in (other_city, wifi, pool, other):
+            storage.new(obj)
+        self.place.amenities.append(wifi)
+        other.amenities.append(wifi)
+        other.amenities.append(pool)
+        storage.save()
+
+        both = ['Test Place', 'Other Place']
+        self.assertEqual(self.search({}), both)
+        self.assertEqual(self.search({"states": [self.state_id]}), both)
+        self.assertEqual(self.search({"cities": [other_city.id]}),
+                         ['Other Place'])
+        self.assertEqual(self.search({"amenities": [wifi.id]}), both)
+        self.assertEqual(self.search({"amenities": [wifi.id, pool.id]}),
+                         ['Other Place'])
+        self.assertEqual(self.search({"amenities": [pool.id, "unknown"]}),
+                         ['Other Place'])
+        self.assertEqual(self.search({"states": [str(uuid.uuid4())]}), [])
+        self.assertEqual(self.search({"limit": 1, "offset": 1}),
+                         ['Other Place'])
+
+        storage.delete(wifi)
+        storage.delete(pool)
+        storage.save()
+
+    def test_places_search_invalid_filters(self):
+        """Test places_search rejects filters that are not lists of ids"""
+        for data in ({"states": "abc"}, {"cities": [{"a": 1}]},
+                     {"amenities": 5}, {"states": [self.state_id, 7]}):
+            response = self.client.post('/api/v1/places_search',
+                                        data=json.dumps(data),
+                                        headers=self.headers)
+            self.assertEqual(response.status_code, 400, data)
+
+    def test_places_search_single_statement(self):
+        """Test places_search issues one SQL statement"""
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = storage._DBStorage__engine
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            self.search({"states": [self.state_id],
+                         "cities": [self.city_id],
+                         "amenities": [str(uuid.uuid4())]})
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+        self.assertEqual(len(statements), 1)
+
+    def test_places_search_not_json(self):
+        """Test places_search rejects a non JSON body"""
+        response = self.client.post('/api/v1/places_search', data="x")
+        self.assertEqual(response.status_code, 400)
+
+    def test_places_nearby(self):
+        """Test GET /api/v1/places/nearby"""
+        for name, lat, lon in (("Near", 48.86, 2.36), ("Far", 51.5, -0.12)):
+            storage.new(Place(name=name, user_id=self.user_id,
+                              city_id=self.city_id, latitude=lat,
+                              longitude=lon))
+        storage.save()
+
+        response = self.client.get(
+            '/api/v1/places/nearby?lat=48.85&lon=2.35&radius_km=10')
+        self.assertEqual(response.status_code, 200)
+        data = response.json
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['results'][0]['place']['name'], 'Near')
+        self.assertAlmostEqual(data['results'][0]['distance_km'], 1.33,
+                               places=1)
+
+        response = self.client.get(
+            '/api/v1/places/nearby?lat=48.85&lon=2.35&radius_km=500')
+        self.assertEqual(response.json['total'], 2)
+        self.assertEqual(
+            [r['place']['name'] for r in response.json['results']],
+            ['Near', 'Far'])
+
+        response = self.client.get('/api/v1/places/nearby?lat=48.85')
+        self.assertEqual(response.status_code, 400)
+
+    def test_create_places_batch(self):
+        """Test POST /api/v1/places/batch reports every item"""
+        items = [
+            {'city_id': self.city_id, 'user_id': self.user_id,
+             'name': 'Batch 1', 'number_rooms': 1},
+            {'city_id': self.city_id, 'user_id': self.user_id},
+            {'city_id': str(uuid.uuid4()), 'user_id': self.user_id,
+             'name': 'Nowhere'},
+            'not an object',
+            {'city_id': self.city_id, 'user_id': self.user_id,
+             'name': 'Batch 2'},
+        ]
+        response = self.client.post('/api/v1/places/batch',
+                                    data=json.dumps(items),
+                                    headers=self.headers)
+        self.assertEqual(response.status_code, 207)
+        results = response.json
+        self.assertEqual([r['status'] for r in results],
+                         [201, 400, 404, 400, 201])
+        self.assertEqual(results[1]['error'], 'Missing name')
+        self.assertEqual(results[0]['place']['number_rooms'], 1)
+        storage.close()
+        created = storage.get(Place, results[4]['place']['id'])
+        self.assertEqual(created.name, 'Batch 2')
+
+        response = self.client.post('/api/v1/places/batch', data='{}',
+                                    headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_places_batch_bad_values(self):
+        """Test badly typed values fail their own item, not the batch"""
+        good = {'city_id': self.city_id, 'user_id': self.user_id,
+                'name': 'Good', 'latitude': 48.5}
+        items = [good,
+                 dict(good, number_rooms='abc'),
+                 dict(good, latitude='x'),
+                 dict(good, name='n' * 129),
+                 dict(good, max_guest=True)]
+        response = self.client.post('/api/v1/places/batch',
+                                    data=json.dumps(items),
+                                    headers=self.headers)
+        self.assertEqual(response.status_code, 207)
+        results = response.json
+        self.assertEqual([r['status'] for r in results],
+                         [201, 400, 400, 400, 400])
+        self.assertIn('number_rooms', results[1]['error'])
+        self.assertIn('128', results[3]['error'])
+        storage.close()
+        self.assertIsNotNone(storage.get(Place, results[0]['place']['id']))
+
+        items = [{'id': self.place_id, 'max_guest': 7},
+                 {'id': self.place_id, 'price_by_night': 'free'},
+                 {'id': self.place_id, 'name': None}]
+        response = self.client.put('/api/v1/places/batch',
+                                   data=json.dumps(items),
+                                   headers=self.headers)
+        self.assertEqual([r['status'] for r in response.json],
+                         [200, 400, 400])
+        storage.close()
+        place = storage.get(Place, self.place_id)
+        self.assertEqual((place.name, place.max_guest), ('Test Place', 7))
+
+    def test_update_places_batch(self):
+        """Test PUT /api/v1/places/batch updates by id"""
+        items = [{'id': self.place_id, 'name': 'Renamed', 'max_guest': 9},
+                 {'id': str(uuid.uuid4()), 'name': 'Ghost'},
+                 {'id': self.place_id, 'colour': 'blue'}]
+        response = self.client.put('/api/v1/places/batch',
+                                   data=json.dumps(items),
+                                   headers=self.headers)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([r['status'] for r in response.json],
+                         [200, 404, 400])
+        storage.close()
+        place = storage.get(Place, self.place_id)
+        self.assertEqual((place.name, place.max_guest), ('Renamed', 9))
+
+    def test_update_places_batch_mixed_columns(self):
+        """Test items setting different columns share one UPDATE"""
+        other = Place(name="Other", user_id=self.user_id,
+                      city_id=self.city_id, price_by_night=10)
+        storage.new(other)
+        storage.save()
+        other_id = other.id
+        items = [{'id': self.place_id, 'name': 'Renamed'},
+                 {'id': other_id, 'price_by_night': 5, 'description': None}]
+        response = self.client.put('/api/v1/places/batch',
+                                   data=json.dumps(items),
+                                   headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        storage.close()
+        place = storage.get(Place, self.place_id)
+        self.assertEqual((place.name, place.price_by_night),
+                         ('Renamed', 100))
+        other = storage.get(Place, other_id)
+        self.assertEqual((other.name, other.price_by_night), ('Other', 5))
+        storage.delete(other)
+        storage.save()
+
+    def test_delete_places_batch(self):
+        """Test DELETE /api/v1/places/batch cascades like the ORM"""
+        self.check_delete_places_batch()
+
+    def test_delete_places_batch_no_returning(self):
+        """Test the batch delete keeps its budget without RETURNING"""
+        dialect = storage._DBStorage__engine.dialect
+        with mock.patch.object(dialect, 'delete_returning', False), \
+                mock.patch.object(dialect, 'update_returning', False):
+            self.check_delete_places_batch()
+
+    def check_delete_places_batch(self):
+        """Delete the test place and a missing id in one batch"""
+        review = Review(place_id=self.place_id, user_id=self.user_id,
+                        text="Soon gone")
+        amenity = Amenity(name="Sauna")
+        storage.new(review)
+        storage.new(amenity)
+        self.place.amenities.append(amenity)
+        storage.save()
+        response = self.client.delete('/api/v1/places/batch',
+                                      data=json.dumps([self.place_id,
+                                                       'missing']),
+                                      headers=self.headers)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([r['status'] for r in response.json], [200, 404])
+        storage.close()
+        self.assertIsNone(storage.get(Place, self.place_id))
+        self.assertIsNone(storage.get(Review, review.id))
+        self.assertIsNotNone(storage.get(Amenity, amenity.id))
@@ -112,6 +112,29 @@ class TestReviewAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIsInstance(response.json, list)
 
+    def test_export_reviews_ndjson(self):
+        """Test GET /api/v1/reviews streamed as NDJSON"""
+        for i in range(3):
+            storage.new(Review(place_id=self.place_id, user_id=self.user_id,
+                               text=f"Review {i}"))
+        storage.save()
+        response = self.client.get(
+            '/api/v1/reviews', headers={'Accept': 'application/x-ndjson'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(len(lines), 4)
+        texts = {json.loads(line)['text'] for line in lines}
+        self.assertIn('Great place!', texts)
+
+    def test_stream_place_reviews_json(self):
+        """Test GET /api/v1/places/<place_id>/reviews?stream=1"""
+        response = self.client.get(
+            f'/api/v1/places/{self.place_id}/reviews?stream=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json[0]['id'], self.review_id)
+        self.assertEqual(len(response.json), 1)
+
     def test_get_review(self):
         """Test GET /api/v1/reviews/<review_id>"""
         response = self.client.get(f'/api/v1/reviews/{self.review_id}')
@@ -40,6 +40,34 @@ class TestStateAPI(unittest.TestCase):
         # Vérifie qu'au moins 1 état existe
         self.assertGreaterEqual(len(response.json), 1)
 
+    def test_get_states_pagination(self):
+        """Test GET /api/v1/states?limit=&after= walks every state once"""
+        tie = self.state.created_at.isoformat()
+        for i in range(4):
+            # Same created_at as the first state: the id breaks the tie
+            storage.new(State(name=f"State {i}", created_at=tie,
+                              updated_at=tie))
+        storage.save()
+
+        seen = []
+        url = '/api/v1/states?limit=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.json), 2)
+            seen.extend(state['id'] for state in response.json)
+            cursor = response.headers.get('X-Next-Cursor')
+            url = cursor and f'/api/v1/states?limit=2&after={cursor}'
+            if cursor:
+                self.assertIn(f'after={cursor}', response.headers['Link'])
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+        response = self.client.get('/api/v1/states?after=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/v1/states?limit=0')
+        self.assertEqual(response.status_code, 400)
+
     def test_get_state(self):
         """Test GET /api/v1/states/<state_id>"""
         response = self.client.get(f'/api/v1/states/{self.state_id}')
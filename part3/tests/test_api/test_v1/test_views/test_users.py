@@ -46,6 +46,7 @@ class TestUserAPI(unittest.TestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["id"], "1234")
         self.assertEqual(data[0]["email"], self.user_data["email"])
+        self.assertNotIn("password", data[0])
 
     @patch('models.storage.get')
     def test_get_user_by_id(self, mock_storage_get):
@@ -58,6 +59,7 @@ class TestUserAPI(unittest.TestCase):
         data = json.loads(response.data)
         self.assertEqual(data["id"], "1234")
         self.assertEqual(data["email"], self.user_data["email"])
+        self.assertNotIn("password", data)
 
     @patch('models.storage.new')
     @patch('models.storage.save')
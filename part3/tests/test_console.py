@@ -0,0 +1,164 @@
+import unittest
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+from sqlalchemy import event
+from console import HBNBCommand
+from models import storage
+from models.state import State
+
+
+class TestConsole(unittest.TestCase):
+    """Test cases for the console commands"""
+
+    def setUp(self):
+        """Create a state and record the SQL each command runs"""
+        self.state = State(name="Console")
+        storage.new(self.state)
+        storage.save()
+        self.state_id = self.state.id
+        storage.close()
+        self.statements = []
+        self.engine = storage._DBStorage__engine
+        event.listen(self.engine, 'before_cursor_execute', self.capture)
+
+    def tearDown(self):
+        """Stop recording and remove the state if a test left it"""
+        event.remove(self.engine, 'before_cursor_execute', self.capture)
+        storage.rollback()
+        storage.bulk_delete(State, [self.state_id])
+        storage.save()
+        storage.close()
+
+    def capture(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def run_command(self, line):
+        """Run one console line, returning what it printed"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            HBNBCommand().onecmd(line)
+        return out.getvalue().strip()
+
+    def selects(self):
+        return [s for s in self.statements
+                if s.lstrip().upper().startswith('SELECT')]
+
+    def test_show(self):
+        """Test show fetches one row by primary key"""
+        out = self.run_command(f'State.show("{self.state_id}")')
+        self.assertIn(self.state_id, out)
+        self.assertEqual(len(self.selects()), 1)
+        self.assertNotIn('cities', self.selects()[0])
+        self.assertEqual(self.run_command("show State missing"),
+                         "** no instance found **")
+
+    def test_count(self):
+        """Test count is a single COUNT query"""
+        out = self.run_command("State.count()")
+        self.assertEqual(int(out), storage.count(State))
+        self.assertEqual(len(self.selects()), 2)
+        self.assertIn('count(', self.selects()[0].lower())
+
+    def test_update(self):
+        """Test update writes the attribute to the database"""
+        self.run_command(f'update State {self.state_id} name "Renamed"')
+        storage.close()
+        self.assertEqual(storage.get(State, self.state_id).name, "Renamed")
+
+    def test_destroy(self):
+        """Test destroy deletes the row, not just a dict entry"""
+        self.run_command(f"destroy State {self.state_id}")
+        storage.close()
+        self.assertIsNone(storage.get(State, self.state_id))
+        self.assertEqual(self.run_command(f"destroy State {self.state_id}"),
+                         "** no instance found **")
+
+    def test_create(self):
+        """Test create persists the new instance"""
+        new_id = self.run_command('create State name="Created_State"')
+        storage.close()
+        self.assertEqual(storage.get(State, new_id).name, "Created State")
+        storage.bulk_delete(State, [new_id])
+        storage.save()
+
+    def test_export_import(self):
+        """Test export then import through the console round-trips"""
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'states.ndjson')
+            self.assertEqual(int(self.run_command(f"export State {path}")),
+                             storage.count(State))
+            with open(path) as handle:
+                self.assertIn(self.state_id, handle.read())
+
+            storage.bulk_delete(State, [self.state_id])
+            storage.save()
+            with open(path) as handle:
+                lines = [line for line in handle if self.state_id in line]
+            mine = os.path.join(tmp, 'mine.ndjson')
+            with open(mine, 'w') as handle:
+                handle.writelines(lines)
+            self.assertEqual(self.run_command(f"import State {mine} 10"),
+                             "1")
+            storage.close()
+            self.assertEqual(storage.get(State, self.state_id).name,
+                             "Console")
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_export_import_stdio(self):
+        """Test "-" streams through stdin/stdout and leaves them open"""
+        out = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        err = io.StringIO()
+        console = HBNBCommand()
+        with redirect_stdout(out), redirect_stderr(err):
+            console.onecmd("export State -")
+            print("still open")
+        out.seek(0)
+        lines = out.read().splitlines()
+        self.assertEqual(console.exit_code, 0)
+        self.assertEqual(lines[-1], "still open")
+        # The row count goes to stderr, not into the exported data
+        self.assertEqual(len(lines) - 1, storage.count(State))
+        self.assertIn(str(len(lines) - 1), err.getvalue())
+        mine = [line for line in lines if self.state_id in line]
+
+        storage.bulk_delete(State, [self.state_id])
+        storage.save()
+        stdin = io.TextIOWrapper(io.BytesIO(mine[0].encode() + b'\n'),
+                                 encoding='utf-8')
+        with mock.patch('sys.stdin', stdin), redirect_stderr(err):
+            self.assertEqual(self.run_command("import State -"), "1")
+        self.assertFalse(stdin.closed)
+        storage.close()
+        self.assertEqual(storage.get(State, self.state_id).name, "Console")
+
+    def test_import_errors(self):
+        """Test import reports bad arguments instead of raising"""
+        self.assertEqual(self.run_command("import"),
+                         "** class name missing **")
+        self.assertEqual(self.run_command("import Nope x.csv"),
+                         "** class doesn't exist **")
+        self.assertEqual(self.run_command("import State"),
+                         "** file name missing **")
+        self.assertEqual(self.run_command("import State x.csv many"),
+                         "** invalid batch size **")
+        self.assertIn("No such file",
+                      self.run_command("import State /nonexistent.csv"))
+
+    def test_failed_import_exit_code(self):
+        """Test a failed import/export is reported through exit_code"""
+        console = HBNBCommand()
+        with redirect_stdout(io.StringIO()):
+            console.onecmd("import State /nonexistent.csv")
+            self.assertEqual(console.exit_code, 1)
+            console.onecmd("import Nope x.csv")
+            self.assertEqual(console.exit_code, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
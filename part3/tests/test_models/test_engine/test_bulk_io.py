@@ -0,0 +1,102 @@
+import unittest
+import os
+import shutil
+import tempfile
+from models.engine.db_storage import DBStorage
+from models.engine import bulk_io
+from models.state import State
+from models.city import City
+from models.id_type import new_id
+
+
+class TestBulkIO(unittest.TestCase):
+    """Test cases for bulk import and export"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up storage and a scratch directory"""
+        cls.storage = DBStorage()
+        cls.storage.reload()
+        cls.tmp = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory"""
+        shutil.rmtree(cls.tmp)
+
+    def setUp(self):
+        """Create a state to import cities into"""
+        self.state = State(name="Bulk IO")
+        self.storage.new(self.state)
+        self.storage.save()
+        self.state_id = self.state.id
+
+    def tearDown(self):
+        """Delete the state and the cities it got"""
+        self.storage.rollback()
+        self.storage.bulk_delete(State, [self.state_id])
+        self.storage.save()
+        self.storage.close()
+
+    def round_trip(self, name):
+        """Import cities from name, export them and import them again"""
+        path = os.path.join(self.tmp, name)
+        fmt = bulk_io.file_format(path)
+        with bulk_io.open_text(path, 'w') as handle:
+            if fmt == 'csv':
+                handle.write("name,state_id,__class__\n")
+                handle.writelines(f"City {i},{self.state_id},City\n"
+                                  for i in range(7))
+            else:
+                handle.writelines(
+                    f'{{"name": "City {i}", "state_id": "{self.state_id}"}}\n'
+                    for i in range(7))
+        self.assertEqual(bulk_io.import_file(
+            self.storage, City, path, batch_size=3, progress=None), 7)
+        self.storage.close()
+        cities = self.storage.all(City)
+        mine = {c.id: c for c in cities.values()
+                if c.state_id == self.state_id}
+        self.assertEqual(sorted(c.name for c in mine.values()),
+                         [f"City {i}" for i in range(7)])
+
+        out = os.path.join(self.tmp, 'out.' + name)
+        exported = bulk_io.export_file(self.storage, City, out,
+                                       batch_size=2, progress=None)
+        self.assertEqual(exported, len(cities))
+
+        self.storage.bulk_delete(City, list(mine))
+        self.storage.save()
+        bulk_io.import_file(self.storage, City, out, progress=None)
+        self.storage.close()
+        for city in mine.values():
+            copy = self.storage.get(City, city.id)
+            self.assertEqual(copy.name, city.name)
+            self.assertEqual(copy.created_at, city.created_at)
+
+    def test_csv(self):
+        """Test a CSV round trip"""
+        self.round_trip('cities.csv')
+
+    def test_ndjson_gz(self):
+        """Test a compressed NDJSON round trip"""
+        self.round_trip('cities.ndjson.gz')
+
+    def test_failed_chunk(self):
+        """Test a bad chunk is rolled back and earlier ones kept"""
+        path = os.path.join(self.tmp, 'bad.csv')
+        with open(path, 'w') as handle:
+            handle.write("id,name,state_id\n")
+            handle.write("{0},Good,{1}\n{0},Twice,{1}\n".format(
+                new_id(), self.state_id))
+        with self.assertRaises(Exception):
+            bulk_io.import_file(self.storage, City, path, batch_size=1,
+                                progress=None)
+        self.storage.close()
+        names = [c.name for c in self.storage.all(City).values()
+                 if c.state_id == self.state_id]
+        self.assertEqual(names, ["Good"])
+
+
+if __name__ == '__main__':
+    unittest.main()
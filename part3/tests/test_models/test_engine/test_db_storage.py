@@ -8,6 +8,8 @@ from models.amenity import Amenity
 from models.place import Place
 from models.review import Review
 import os
+import threading
+from sqlalchemy import event
 
 class TestDBStorage(unittest.TestCase):
     """Test cases for DBStorage"""
@@ -117,6 +119,148 @@ class TestDBStorage(unittest.TestCase):
         result = self.storage.all(Place)
         self.assertIn(f"Place.{self.place.id}", result)
 
+    def test_count(self):
+        """Test counting objects with SELECT COUNT"""
+        before = self.storage.count(State)
+        self.storage.new(self.state)
+        self.storage.save()
+        self.assertEqual(self.storage.count(State), before + 1)
+        self.assertEqual(self.storage.count("State"), before + 1)
+        self.assertEqual(self.storage.count("Unknown"), 0)
+        self.assertEqual(self.storage.count(),
+                         sum(self.storage.count_all().values()))
+
+    def test_count_all_cache(self):
+        """Test cached counts are dropped on commit"""
+        self.storage.counts_ttl = 60
+        try:
+            counts = self.storage.count_all()
+            self.assertEqual(self.storage.count_all(), counts)
+            self.storage.new(self.state)
+            self.storage.save()
+            self.assertEqual(self.storage.count_all()["State"],
+                             counts["State"] + 1)
+        finally:
+            self.storage.counts_ttl = 0
+
+    def test_session_per_thread(self):
+        """Test each thread gets its own session from the registry"""
+        registry = self.storage._DBStorage__session
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(registry()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(sessions[0], registry())
+        self.assertIs(registry(), registry())
+
+    def test_pool_stats(self):
+        """Test pool statistics are reported"""
+        stats = self.storage.pool_stats()
+        self.assertIn('class', stats)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_dispose_after_fork(self):
+        """Test a forked child can query after dispose(close=False)"""
+        self.storage.count(State)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self.storage.dispose(close=False)
+                self.storage.count(State)
+                os._exit(0)
+            except BaseException:
+                os._exit(1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        # The parent's pooled connection was left untouched
+        self.assertIsInstance(self.storage.count(State), int)
+
+    def test_get_by_class_name(self):
+        """Test get resolves class names through the registry"""
+        self.storage.new(self.state)
+        self.storage.save()
+        self.assertIs(self.storage.get("State", self.state.id), self.state)
+        self.assertIsNone(self.storage.get("Unknown", self.state.id))
+        self.assertIsNone(self.storage.get("__import__('os')", "x"))
+
+    def test_entity_cache(self):
+        """Test State lookups are served across sessions until a commit"""
+        engine = self.storage._DBStorage__engine
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        self.storage.counts_ttl = 0
+        self.storage.entity_cache_ttl = 60
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            state = State(name="Cached")
+            self.storage.new(state)
+            self.storage.save()
+            self.storage.close()
+            self.storage.get(State, state.id)
+            self.storage.close()
+            del statements[:]
+            cached = self.storage.get(State, state.id)
+            self.assertEqual(statements, [])
+            self.assertEqual(cached.name, "Cached")
+
+            cached.name = "Renamed"
+            self.storage.save()
+            self.storage.close()
+            self.assertEqual(self.storage.get(State, state.id).name,
+                             "Renamed")
+
+            self.storage.delete(self.storage.get(State, state.id))
+            self.storage.save()
+            self.storage.close()
+            self.assertIsNone(self.storage.get(State, state.id))
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+            self.storage.entity_cache_ttl = 0
+
+    def test_page_projection(self):
+        """Test a projected page returns rows, not tracked objects"""
+        self.storage.new(self.state)
+        self.storage.save()
+        self.storage.close()
+        rows, _ = self.storage.page(State, 1000, columns=['name'])
+        row = next(r for r in rows if r.id == self.state.id)
+        self.assertEqual(row.name, "California")
+        self.assertIsNotNone(row.created_at)
+        self.assertNotIsInstance(row, State)
+        session = self.storage._DBStorage__session
+        self.assertEqual(len(session.identity_map), 0)
+        streamed = list(self.storage.iterate(State, columns=['name']))
+        self.assertEqual([r.id for r in streamed], [r.id for r in rows])
+
+    def test_bulk_writes(self):
+        """Test bulk_save inserts queued objects, bulk_delete cascades"""
+        states = [State(name=f"Bulk {i}") for i in range(3)]
+        city = City(name="Bulk City", state_id=states[0].id)
+        self.storage.bulk_new([city] + states)
+        self.assertEqual(self.storage.bulk_save(), 4)
+        self.storage.close()
+        self.assertEqual(self.storage.get(City, city.id).name, "Bulk City")
+        self.assertEqual(self.storage.existing_ids(
+            State, [s.id for s in states] + ["missing"]),
+            {s.id for s in states})
+
+        self.storage.bulk_update(State, [{'id': states[1].id,
+                                          'name': "Renamed"}])
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.get(State, states[1].id).name,
+                         "Renamed")
+
+        ids = [s.id for s in states]
+        self.assertEqual(self.storage.bulk_delete(State, ids), 3)
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.existing_ids(State, ids), set())
+        self.assertIsNone(self.storage.get(City, city.id))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""Tests for schema indexes and query plans"""
+import unittest
+from sqlalchemy import event
+from api.v1.app import app
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+from models.engine.schema import (full_scans, missing_model_indexes,
+                                  missing_relationship_indexes)
+
+
+class TestSchema(unittest.TestCase):
+    """Test cases for indexes backing relationships and hot endpoints"""
+
+    def setUp(self):
+        """Create one object of each class"""
+        self.client = app.test_client()
+        self.engine = storage._DBStorage__engine
+        self.state = State(name="Indexed State")
+        self.city = City(name="Indexed City", state_id=self.state.id)
+        self.user = User(email="indexed@example.com", password="password")
+        self.place = Place(name="Indexed Place", city_id=self.city.id,
+                           user_id=self.user.id)
+        self.amenity = Amenity(name="Indexed Amenity")
+        self.review = Review(text="Indexed", place_id=self.place.id,
+                             user_id=self.user.id)
+        for obj in (self.state, self.city, self.user, self.place,
+                    self.amenity, self.review):
+            storage.new(obj)
+        storage.save()
+
+    def tearDown(self):
+        """Clean the database after each test"""
+        storage.rollback()
+        storage.delete_all()
+
+    def test_models_index_every_foreign_key(self):
+        """Test every foreign key declared on the models is indexed"""
+        self.assertEqual(missing_relationship_indexes(), [])
+
+    def test_database_matches_models(self):
+        """Test the database has every index declared on the models"""
+        self.assertEqual(missing_model_indexes(self.engine), [])
+        self.assertEqual(missing_relationship_indexes(self.engine), [])
+
+    def test_hot_endpoints_avoid_full_scans(self):
+        """Test lookups by parent id or name never scan a whole table"""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append((statement, parameters))
+
+        event.listen(self.engine, 'before_cursor_execute', capture)
+        try:
+            for url in (f'/api/v1/states/{self.state.id}/cities',
+                        f'/api/v1/cities/{self.city.id}/places',
+                        f'/api/v1/places/{self.place.id}/reviews',
+                        f'/api/v1/places/{self.place.id}/amenities'):
+                self.assertEqual(self.client.get(url).status_code, 200)
+            storage.get_by_name(State, "Indexed State")
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', capture)
+
+        with self.engine.connect() as conn:
+            for statement, parameters in statements:
+                self.assertEqual(full_scans(conn, statement, parameters), [],
+                                 statement)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""Tests for the id column type and UUIDv7 generator"""
+import time
+import unittest
+import uuid
+from models.id_type import BinaryUUID, new_id, uuid7
+
+
+class TestIdType(unittest.TestCase):
+    """Test cases for UUIDv7 ids and BinaryUUID"""
+
+    def test_uuid7_layout(self):
+        """Test version, variant and embedded timestamp"""
+        before = time.time_ns() // 1000000
+        value = uuid7()
+        after = time.time_ns() // 1000000
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(before <= value.int >> 80 <= after)
+
+    def test_uuid7_time_ordered(self):
+        """Test ids from later milliseconds sort after earlier ones"""
+        first = new_id()
+        time.sleep(0.002)
+        self.assertLess(first, new_id())
+        self.assertEqual(len(new_id()), 36)
+
+    def test_binary_round_trip(self):
+        """Test ids are stored as 16 bytes and read back as strings"""
+        column = BinaryUUID()
+        obj_id = new_id()
+        stored = column.process_bind_param(obj_id, None)
+        self.assertEqual(len(stored), 16)
+        self.assertEqual(column.process_result_value(stored, None), obj_id)
+        self.assertIsNone(column.process_bind_param(None, None))
+
+    def test_binary_malformed_id(self):
+        """Test a malformed id binds NULL so lookups find nothing"""
+        self.assertIsNone(BinaryUUID().process_bind_param("not-a-uuid", None))
+
+
+if __name__ == '__main__':
+    unittest.main()
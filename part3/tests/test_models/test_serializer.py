@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""Tests for the generated model serializers"""
+import json
+import unittest
+from collections import namedtuple
+from models import serializer
+from models.place import Place
+from models.state import State
+from models.user import User
+
+Row = namedtuple('Row', 'name id created_at latitude')
+
+
+class TestSerializer(unittest.TestCase):
+    """Test cases for dumps/dumps_list against to_dict"""
+
+    def setUp(self):
+        """Build objects with every column type set"""
+        self.place = Place(city_id='c1', user_id='u1', name='Café "Nord"',
+                           description=None, number_rooms=3,
+                           number_bathrooms=1, max_guest=4,
+                           price_by_night=90, latitude=48.85,
+                           longitude=2)
+        self.backend = serializer.BACKEND
+
+    def tearDown(self):
+        """Restore the configured backend"""
+        serializer.BACKEND = self.backend
+        serializer._serializers.clear()
+
+    def backends(self):
+        """Yield each available backend, with fresh serializers"""
+        for backend in ('json', 'orjson'):
+            if backend == 'orjson' and serializer.orjson is None:
+                continue
+            serializer.BACKEND = backend
+            serializer._serializers.clear()
+            with self.subTest(backend=backend):
+                yield backend
+
+    def test_matches_to_dict(self):
+        """Test the output decodes to exactly to_dict()"""
+        for _ in self.backends():
+            self.assertEqual(json.loads(serializer.dumps(self.place)),
+                             self.place.to_dict())
+
+    def test_keys_sorted(self):
+        """Test keys come out in the order jsonify sorts them"""
+        for _ in self.backends():
+            keys = list(json.loads(serializer.dumps(self.place)))
+            self.assertEqual(keys, sorted(keys))
+
+    def test_unloaded_columns_left_out(self):
+        """Test columns missing from __dict__ are skipped like to_dict"""
+        state = State(name="Texas")
+        del state.__dict__['updated_at']
+        for _ in self.backends():
+            out = json.loads(serializer.dumps(state))
+            self.assertNotIn('updated_at', out)
+            self.assertEqual(out['name'], 'Texas')
+
+    def test_dumps_list(self):
+        """Test a list of mixed models encodes as a JSON array"""
+        user = User(email='a@b.c', password='secret')
+        for _ in self.backends():
+            out = json.loads(serializer.dumps_list([self.place, user]))
+            expected = user.to_dict()
+            del expected['password']
+            self.assertEqual(out, [self.place.to_dict(), expected])
+            self.assertEqual(serializer.dumps_list([]), b'[]')
+
+    def test_hidden_columns(self):
+        """Test the password hash is never written"""
+        user = User(email='a@b.c', password='secret')
+        self.assertNotIn('password', serializer.public_columns(User))
+        for _ in self.backends():
+            self.assertNotIn(b'password', serializer.dumps(user))
+
+    def test_row_serializer(self):
+        """Test rows of selected columns encode like their objects"""
+        columns = ('name', 'id', 'created_at', 'latitude')
+        row = Row(self.place.name, self.place.id, self.place.created_at,
+                  self.place.latitude)
+        expected = {key: value for key, value in self.place.to_dict().items()
+                    if key in columns or key == '__class__'}
+        for _ in self.backends():
+            dumps = serializer.row_serializer(Place, columns)
+            self.assertEqual(json.loads(dumps(row)), expected)
+
+    def test_generated_once(self):
+        """Test each class gets one serializer"""
+        self.assertIs(serializer.serializer(Place),
+                      serializer.serializer(Place))
+
+
+if __name__ == '__main__':
+    unittest.main()